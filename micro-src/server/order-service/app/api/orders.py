@@ -4,14 +4,15 @@ Authentication is delegated to User Service via REST API
 """
 
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.schemas import OrderCreate, OrderUpdate, OrderResponse
 from app.services import OrderService
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, oauth2_scheme
+from app.utils.pagination import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,8 @@ router = APIRouter(prefix="/orders", tags=["Orders"])
 async def create_order(
     order_data: OrderCreate,
     db: Session = Depends(get_db),
-    current_user: int = Depends(get_current_user)
+    current_user: int = Depends(get_current_user),
+    token: str = Depends(oauth2_scheme)
 ):
     """
     Create new order (Requires authentication)
@@ -50,13 +52,17 @@ async def create_order(
     - Requires JWT token in header: `Authorization: Bearer <token>`
     - Token is validated via User Service REST API
     
+    **Stock Reservation:**
+    - Stock is reserved atomically in Product Service (forwarding the token),
+      committed once the order is stored and released if storing fails
+    
     **Event Publishing:**
     - Publishes `order.created` event to RabbitMQ for Notification Service
     """
     order_service = OrderService(db)
     
     try:
-        order = await order_service.create_order(order_data, current_user)
+        order = await order_service.create_order(order_data, current_user, token)
         logger.info(f"✅ Order created successfully: ID={order.id}")
         return order
     except Exception as e:
@@ -71,29 +77,59 @@ async def create_order(
     "",
     response_model=List[OrderResponse],
     summary="Get all orders",
-    description="Get all orders with pagination (requires JWT token)"
+    description="Get all orders with offset or cursor pagination (requires JWT token)"
 )
 async def get_orders(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of orders to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of orders"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     db: Session = Depends(get_db),
     current_user: int = Depends(get_current_user)
 ):
     """
-    Get all orders for current user
+    Get all orders for current user, newest first
     
     **Query Parameters:**
     - **skip**: Number of orders to skip (offset) - default: 0
     - **limit**: Maximum number of orders to return - default: 100
+    - **cursor**: Opaque cursor of the previous page (cannot be combined with skip)
     
     **Response:**
     - List of orders for current user
+    - `X-Next-Cursor` header when more orders may follow; pass it as
+      `cursor` to get the next page without the cost of a deep OFFSET
+    
+    **Errors:**
+    - 422: Invalid cursor, or both skip and cursor given
     
     **Authentication:**
     - Requires JWT token in header: `Authorization: Bearer <token>`
     """
     order_service = OrderService(db)
-    orders = order_service.get_orders_by_user(current_user, skip=skip, limit=limit)
+
+    if cursor is None:
+        orders = order_service.get_orders_by_user(current_user, skip=skip, limit=limit)
+    else:
+        if skip:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Không thể dùng đồng thời skip và cursor"
+            )
+        try:
+            page_cursor = decode_cursor(cursor)
+        except ValueError:
+            page_cursor = None
+        # Order cursors always carry created_at, the leading sort key
+        if page_cursor is None or page_cursor.created_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Cursor phân trang không hợp lệ"
+            )
+        orders = order_service.get_orders_by_user_after(current_user, page_cursor, limit=limit)
+
+    if len(orders) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(orders[-1].id, orders[-1].created_at)
     return orders
 
 
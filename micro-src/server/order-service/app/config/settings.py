@@ -23,6 +23,46 @@ class Settings(BaseSettings):
     # Product Service Configuration
     PRODUCT_SERVICE_URL: str = "http://localhost:8002"
 
+    # Shared HTTP Client (pooled keep-alive connections to other services)
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE: int = 20  # Idle connections kept open for reuse
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle connection is kept
+    HTTP_CLIENT_HTTP2: bool = False  # Requires the h2 package (httpx[http2])
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 1.0
+    HTTP_CLIENT_TIMEOUT: float = 5.0  # Default for upstreams without their own timeout
+    USER_SERVICE_TIMEOUT: float = 5.0
+    PRODUCT_SERVICE_TIMEOUT: float = 5.0
+
+    # Stock Reservation
+    RESERVATION_COMMIT_ATTEMPTS: int = 4  # Commit tries before the order is cancelled
+    RESERVATION_COMMIT_BACKOFF: float = 0.2  # Seconds before the first retry, doubled each time
+
+    # Local JWT Verification
+    # "remote": validate every token via User Service /validate-token
+    # "local": verify signature and expiry here, only fetch User Service's deny-list
+    AUTH_MODE: str = "remote"
+    JWT_SECRET_KEY: str = "your-secret-key-change-this-in-production-min-32-characters"  # User Service SECRET_KEY (HS* only)
+    JWT_ALGORITHM: str = "HS256"  # User Service ALGORITHM; RS*/ES* verify with its JWKS, no secret needed
+    JWKS_URL: str = ""  # Default: {USER_SERVICE_URL}/.well-known/jwks.json
+    JWKS_TTL: float = 300.0  # Seconds between key set refreshes
+    JWKS_MIN_REFRESH_INTERVAL: float = 10.0  # Min seconds between refreshes for unknown kids
+    AUTH_DENYLIST_TTL: float = 30.0  # Seconds between deny-list refreshes
+    AUTH_DENYLIST_RETRY: float = 5.0  # Seconds before retrying a failed refresh
+    AUTH_DENYLIST_MAX_STALE: float = 300.0  # Reject tokens when the list is older than this
+    INTERNAL_SERVICE_TOKEN: str = "your-internal-service-token-change-this-in-production"  # User Service INTERNAL_SERVICE_TOKEN
+
+    # Token Validation Cache (User Service /validate-token results)
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_TTL: float = 60.0  # Max seconds a valid result is reused (never past the token's exp)
+    TOKEN_CACHE_NEGATIVE_TTL: float = 5.0  # Seconds an invalid result is reused
+    TOKEN_CACHE_MAX_ITEMS: int = 10000  # Local entries per worker (LRU)
+    TOKEN_CACHE_REDIS_URL: str = ""  # e.g. redis://redis:6379/0 to share results; empty = per process only
+    TOKEN_CACHE_REDIS_TIMEOUT: float = 0.5
+
+    # User Events (user.deactivated purges cached tokens)
+    USER_EVENTS_ENABLED: bool = True
+    USER_EVENTS_EXCHANGE: str = "user_events"
+
     # RabbitMQ Configuration
     RABBITMQ_HOST: str = "localhost"
     RABBITMQ_PORT: int = 5672
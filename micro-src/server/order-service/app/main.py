@@ -10,7 +10,10 @@ from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.config import settings
 from app.api import orders
+from app.utils.http_client import http_client
 from app.utils.rabbitmq import rabbitmq_publisher
+from app.utils.token_cache import token_validation_cache
+from app.utils.user_events import user_events_consumer
 from app.utils.tracing import setup_tracing
 
 # Configure logging
@@ -55,6 +58,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
@@ -110,6 +114,7 @@ async def health_check():
             "port": settings.RABBITMQ_PORT,
             "exchange": settings.RABBITMQ_EXCHANGE,
         },
+        "token_cache": token_validation_cache.stats(),
     }
 
 
@@ -123,6 +128,17 @@ async def startup_event():
     logger.info(f"🔐 User Service URL: {settings.USER_SERVICE_URL}")
     logger.info(f"📦 Product Service URL: {settings.PRODUCT_SERVICE_URL}")
     
+    # Pooled connections to User Service and Product Service
+    await http_client.start()
+    
+    # Reuse token validation results; purge them when a user is deactivated
+    await token_validation_cache.connect()
+    if settings.USER_EVENTS_ENABLED:
+        try:
+            await user_events_consumer.start()
+        except Exception as e:
+            logger.warning(f"⚠️ User events unavailable, cached tokens are only dropped on expiry: {e}")
+    
     # Connect to RabbitMQ
     try:
         await rabbitmq_publisher.connect()
@@ -143,3 +159,12 @@ async def shutdown_event():
         logger.info("✅ RabbitMQ connection closed gracefully")
     except Exception as e:
         logger.error(f"❌ Error closing RabbitMQ connection: {e}")
+    
+    try:
+        await user_events_consumer.close()
+    except Exception as e:
+        logger.error(f"❌ Error closing user events connection: {e}")
+    await token_validation_cache.close()
+    
+    # Close pooled HTTP connections
+    await http_client.close()
@@ -3,7 +3,7 @@ Order Model - Database model for orders
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Enum, Index
 from sqlalchemy.sql import func
 import enum
 
@@ -36,6 +36,10 @@ class Order(Base):
         updated_at: Order last update timestamp
     """
     __tablename__ = "orders"
+    __table_args__ = (
+        # Keyset pagination of a user's order history (newest first)
+        Index("ix_orders_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, nullable=False, index=True)
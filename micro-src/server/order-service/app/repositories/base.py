@@ -50,9 +50,9 @@ class BaseRepository(Generic[ModelType]):
             limit: Maximum number of entities to return
             
         Returns:
-            List of entities
+            List of entities ordered by ID
         """
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        return self.db.query(self.model).order_by(self.model.id).offset(skip).limit(limit).all()
 
     def create(self, obj_data: dict) -> ModelType:
         """
@@ -2,7 +2,9 @@
 Order Repository - Data access for orders
 """
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
 from app.models import Order
@@ -39,12 +41,43 @@ class OrderRepository(BaseRepository[Order]):
         return (
             self.db.query(Order)
             .filter(Order.user_id == user_id)
-            .order_by(Order.created_at.desc())
+            .order_by(Order.created_at.desc(), Order.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    def get_by_user_id_after(
+        self,
+        user_id: int,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Order]:
+        """
+        Get orders by user ID, newest first, starting after a keyset cursor
+        Uses the (user_id, created_at, id) index, so every page costs the same
+        no matter how deep it is
+        
+        Args:
+            user_id: User ID
+            after_created_at: Creation time of the last order of the previous page
+            after_id: ID of the last order of the previous page
+            limit: Maximum number of orders to return
+            
+        Returns:
+            List of orders
+        """
+        query = self.db.query(Order).filter(Order.user_id == user_id)
+        if after_created_at is not None and after_id is not None:
+            query = query.filter(tuple_(Order.created_at, Order.id) < (after_created_at, after_id))
+        return (
+            query
+            .order_by(Order.created_at.desc(), Order.id.desc())
+            .limit(limit)
+            .all()
+        )
+
     def get_by_product_id(self, product_id: int, skip: int = 0, limit: int = 100) -> List[Order]:
         """
         Get orders by product ID
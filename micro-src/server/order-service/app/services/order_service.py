@@ -3,7 +3,9 @@ Order Service - Business Logic for Order Management
 Handles order creation and publishes events to RabbitMQ
 """
 
+import asyncio
 import logging
+import uuid
 import httpx
 from typing import List, Optional
 from sqlalchemy.orm import Session
@@ -12,6 +14,8 @@ from app.models import Order
 from app.schemas import OrderCreate, OrderUpdate
 from app.repositories import OrderRepository
 from app.utils import publish_order_created
+from app.utils.http_client import http_client
+from app.utils.pagination import Cursor
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -33,13 +37,21 @@ class OrderService:
         self.db = db
         self.order_repository = OrderRepository(db)
 
-    async def create_order(self, order_data: OrderCreate, user_id: int) -> Order:
+    async def create_order(self, order_data: OrderCreate, user_id: int, token: str) -> Order:
         """
         Create new order and publish event to RabbitMQ
         
+        Stock is reserved atomically in Product Service before the order is
+        stored, committed once it is stored and released if storing fails,
+        so concurrent orders cannot oversell a product. If the commit still
+        fails after retries, the order is cancelled and the reservation
+        released, so no stored order is left holding a reservation that
+        would expire and put its stock back on sale.
+        
         Args:
             order_data: Order creation data
             user_id: User ID from JWT token
+            token: Caller's JWT token, forwarded to Product Service
             
         Returns:
             Created order
@@ -53,12 +65,13 @@ class OrderService:
         if not product:
             raise Exception(f"Không tìm thấy sản phẩm có ID: {order_data.product_id}")
         
-        # Check stock availability
-        if product["quantity"] < order_data.quantity:
-            raise Exception(
-                f"Sản phẩm không đủ số lượng. Còn lại: {product['quantity']}, "
-                f"Yêu cầu: {order_data.quantity}"
-            )
+        # Reserve stock; Product Service checks and decrements in one statement
+        reservation = await self._reserve_stock(
+            order_data.product_id,
+            order_data.quantity,
+            token,
+            reference=f"order-{uuid.uuid4().hex}"
+        )
         
         # Calculate prices
         unit_price = float(product["price"])
@@ -75,9 +88,23 @@ class OrderService:
             "status": "pending",
         }
         
-        order = self.order_repository.create(order_dict)
+        try:
+            order = self.order_repository.create(order_dict)
+        except Exception:
+            # Give the stock back, the order was not stored
+            await self._finish_reservation(order_data.product_id, reservation["id"], token, "release")
+            raise
         logger.info(f"✅ Order created: ID={order.id}, User={user_id}, Product={order_data.product_id}")
         
+        if not await self._commit_reservation(order_data.product_id, reservation["id"], token):
+            try:
+                self.order_repository.update(order.id, {"status": "cancelled"})
+            except Exception as e:
+                logger.error(f"❌ Failed to cancel order {order.id}: {e}")
+            await self._finish_reservation(order_data.product_id, reservation["id"], token, "release")
+            logger.error(f"❌ Order {order.id} cancelled: reservation {reservation['id']} could not be committed")
+            raise Exception("Không thể xác nhận giữ hàng tại Product Service, đơn hàng đã bị hủy")
+        
         # Publish order.created event to RabbitMQ
         try:
             await publish_order_created({
@@ -98,6 +125,117 @@ class OrderService:
         
         return order
 
+    async def _reserve_stock(self, product_id: int, quantity: int, token: str, reference: str) -> dict:
+        """
+        Reserve product stock in Product Service
+        
+        Args:
+            product_id: Product ID
+            quantity: Quantity to reserve
+            token: JWT token forwarded to Product Service
+            reference: Idempotency key, so a retried request reserves only once
+            
+        Returns:
+            Reservation data
+            
+        Raises:
+            Exception if product not found, insufficient stock or Product Service unavailable
+        """
+        try:
+            response = await http_client.client.post(
+                f"{settings.PRODUCT_SERVICE_URL}/products/{product_id}/reserve",
+                json={"quantity": quantity, "reference": reference},
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=http_client.timeout(settings.PRODUCT_SERVICE_TIMEOUT)
+            )
+        except httpx.TimeoutException:
+            logger.error("⏱️ Product Service timeout")
+            raise Exception("Product Service không phản hồi")
+        except httpx.RequestError as e:
+            logger.error(f"❌ Error connecting to Product Service: {e}")
+            raise Exception(f"Lỗi kết nối Product Service: {str(e)}")
+        
+        if response.status_code in (200, 201):
+            reservation = response.json()
+            logger.info(f"📦 Reserved {quantity} of product ID {product_id} (reservation {reservation['id']})")
+            return reservation
+        if response.status_code in (404, 409):
+            # Product Service explains why (not found / insufficient stock)
+            raise Exception(response.json().get("detail", "Không thể giữ hàng"))
+        
+        logger.error(f"Product Service returned status: {response.status_code}")
+        raise Exception("Không thể giữ hàng tại Product Service")
+
+    async def _commit_reservation(self, product_id: int, reservation_id: int, token: str) -> bool:
+        """
+        Commit a reservation, retrying with exponential backoff
+        
+        Commit is idempotent in Product Service, so a retry after a lost
+        response succeeds. A 409 (the reservation was released or expired
+        meanwhile) and 404 are final and not retried.
+        
+        Args:
+            product_id: Product ID
+            reservation_id: Reservation ID
+            token: JWT token forwarded to Product Service
+            
+        Returns:
+            True if the reservation is committed
+        """
+        delay = settings.RESERVATION_COMMIT_BACKOFF
+        for attempt in range(1, settings.RESERVATION_COMMIT_ATTEMPTS + 1):
+            status_code = await self._finish_reservation(product_id, reservation_id, token, "commit")
+            if status_code == 200:
+                return True
+            if status_code in (404, 409) or attempt == settings.RESERVATION_COMMIT_ATTEMPTS:
+                return False
+            logger.warning(f"⚠️ Retrying commit of reservation {reservation_id} in {delay}s (attempt {attempt})")
+            await asyncio.sleep(delay)
+            delay *= 2
+        return False
+
+    async def _finish_reservation(
+        self,
+        product_id: int,
+        reservation_id: int,
+        token: str,
+        action: str
+    ) -> Optional[int]:
+        """
+        Commit or release a reservation in Product Service
+        
+        Failures are logged, not raised; the caller decides whether to retry.
+        A release that fails leaves the reservation to expire, which gives
+        its stock back.
+        
+        Args:
+            product_id: Product ID
+            reservation_id: Reservation ID
+            token: JWT token forwarded to Product Service
+            action: "commit" or "release"
+            
+        Returns:
+            Product Service status code (200 if the action was accepted),
+            None if it could not be reached
+        """
+        try:
+            response = await http_client.client.post(
+                f"{settings.PRODUCT_SERVICE_URL}/products/{product_id}/{action}",
+                json={"reservation_id": reservation_id},
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=http_client.timeout(settings.PRODUCT_SERVICE_TIMEOUT)
+            )
+        except httpx.RequestError as e:
+            logger.error(f"❌ Failed to {action} reservation {reservation_id}: {e}")
+            return None
+        
+        if response.status_code != 200:
+            logger.error(
+                f"❌ Failed to {action} reservation {reservation_id}: "
+                f"Product Service returned status {response.status_code}"
+            )
+        return response.status_code
+
     async def _get_product(self, product_id: int) -> Optional[dict]:
         """
         Get product details from Product Service
@@ -109,19 +247,19 @@ class OrderService:
             Product data or None if not found
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{settings.PRODUCT_SERVICE_URL}/products/{product_id}"
-                )
+            response = await http_client.client.get(
+                f"{settings.PRODUCT_SERVICE_URL}/products/{product_id}",
+                timeout=http_client.timeout(settings.PRODUCT_SERVICE_TIMEOUT)
+            )
+            
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 404:
+                return None
+            else:
+                logger.error(f"Product Service returned status: {response.status_code}")
+                return None
                 
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 404:
-                    return None
-                else:
-                    logger.error(f"Product Service returned status: {response.status_code}")
-                    return None
-                    
         except httpx.TimeoutException:
             logger.error("⏱️ Product Service timeout")
             raise Exception("Product Service không phản hồi")
@@ -168,6 +306,30 @@ class OrderService:
         """
         return self.order_repository.get_by_user_id(user_id, skip=skip, limit=limit)
 
+    def get_orders_by_user_after(
+        self,
+        user_id: int,
+        cursor: Optional[Cursor],
+        limit: int = 100
+    ) -> List[Order]:
+        """
+        Get orders by user ID with keyset pagination
+        
+        Args:
+            user_id: User ID
+            cursor: Cursor of the last order of the previous page (None for the first page)
+            limit: Maximum number of orders to return
+            
+        Returns:
+            List of orders, newest first
+        """
+        return self.order_repository.get_by_user_id_after(
+            user_id,
+            after_created_at=cursor.created_at if cursor else None,
+            after_id=cursor.id if cursor else None,
+            limit=limit,
+        )
+
     def update_order(self, order_id: int, order_data: OrderUpdate) -> Optional[Order]:
         """
         Update order status
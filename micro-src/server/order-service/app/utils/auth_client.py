@@ -4,8 +4,12 @@ Auth Client - Communicate with User Service for authentication
 
 import httpx
 import logging
+from typing import Optional
 
 from app.config import settings
+from app.utils.http_client import http_client
+from app.utils.jwt_verifier import verify_token
+from app.utils.token_cache import token_validation_cache
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +17,9 @@ logger = logging.getLogger(__name__)
 async def validate_token(token: str) -> dict:
     """
     Validate JWT token via User Service
+    With AUTH_MODE=local the token is verified here and User Service is
+    only called for tokens without a user ID claim; User Service answers
+    are reused from the token cache
     
     Args:
         token: JWT token to validate
@@ -20,23 +27,46 @@ async def validate_token(token: str) -> dict:
     Returns:
         Dict with validation result and username if valid
         
+    Raises:
+        Exception if User Service is unreachable
+    """
+    if settings.AUTH_MODE == "local":
+        result = await verify_token(token)
+        if result is not None:
+            return result
+
+    result = await token_validation_cache.get_or_validate(token, _validate_remote)
+    return result if result is not None else {"valid": False}
+
+
+async def _validate_remote(token: str) -> Optional[dict]:
+    """
+    Call User Service /validate-token
+    
+    Args:
+        token: JWT token to validate
+        
+    Returns:
+        User Service response, or None if it answered with an error status
+        (not cached)
+        
     Raises:
         Exception if User Service is unreachable
     """
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.post(
-                f"{settings.USER_SERVICE_URL}/validate-token",
-                json={"token": token}
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"✅ Token validated successfully for user: {data.get('username')}")
-                return data
-            else:
-                logger.warning(f"❌ Token validation failed: {response.status_code}")
-                return {"valid": False}
+        response = await http_client.client.post(
+            f"{settings.USER_SERVICE_URL}/validate-token",
+            json={"token": token},
+            timeout=http_client.timeout(settings.USER_SERVICE_TIMEOUT)
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            logger.info(f"✅ Token validated successfully for user: {data.get('username')}")
+            return data
+        else:
+            logger.warning(f"❌ Token validation failed: {response.status_code}")
+            return None
                 
     except httpx.TimeoutException:
         logger.error("⏱️ User Service timeout")
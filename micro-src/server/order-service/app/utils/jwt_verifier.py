@@ -0,0 +1,236 @@
+"""
+JWT Verifier - Verify access tokens locally instead of calling User Service
+Signature and expiry are checked with the key shared with User Service
+(HS*) or with User Service's published public keys (RS*/ES*, JWKS);
+User Service is only consulted for its deny-list of deactivated users,
+which is cached and refreshed at most every AUTH_DENYLIST_TTL seconds
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, FrozenSet, Optional
+import httpx
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+
+from app.config import settings
+from app.utils.http_client import http_client
+
+logger = logging.getLogger(__name__)
+
+
+class VerifierUnavailableError(Exception):
+    """Raised when tokens cannot be verified locally for lack of User Service data"""
+
+
+class DenyListUnavailableError(VerifierUnavailableError):
+    """Raised when no sufficiently fresh deny-list could be loaded"""
+
+
+class KeySetUnavailableError(VerifierUnavailableError):
+    """Raised when User Service's public keys have never been loaded"""
+
+
+class TokenDenyList:
+    """
+    Cached copy of User Service's token deny-list
+    One refresh runs at a time; concurrent requests use the current copy
+    """
+
+    def __init__(self):
+        """Initialize empty deny-list, loaded on first use"""
+        self._user_ids: FrozenSet[int] = frozenset()
+        self._loaded_at: Optional[float] = None
+        self._next_refresh = 0.0
+        self._lock = asyncio.Lock()
+
+    async def contains(self, user_id: int) -> bool:
+        """
+        Check whether a user's tokens are denied
+        
+        Args:
+            user_id: User ID from the token
+        
+        Returns:
+            True if the user was deactivated
+        
+        Raises:
+            DenyListUnavailableError: If the list is older than
+                AUTH_DENYLIST_MAX_STALE and cannot be refreshed
+        """
+        if time.monotonic() >= self._next_refresh:
+            await self._refresh()
+
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > settings.AUTH_DENYLIST_MAX_STALE:
+            raise DenyListUnavailableError("Không thể tải danh sách thu hồi token từ User Service")
+        return user_id in self._user_ids
+
+    def add(self, user_id: int):
+        """
+        Deny a user's tokens before the next refresh (user.deactivated event)
+        
+        Args:
+            user_id: ID of the deactivated user
+        """
+        self._user_ids = self._user_ids | {user_id}
+
+    async def _refresh(self):
+        """
+        Fetch the deny-list from User Service
+        A failed fetch keeps the current copy and is retried after AUTH_DENYLIST_RETRY seconds
+        """
+        async with self._lock:
+            now = time.monotonic()
+            if now < self._next_refresh:
+                # Refreshed by a concurrent request while we waited
+                return
+
+            try:
+                response = await http_client.client.get(
+                    f"{settings.USER_SERVICE_URL}/token-denylist",
+                    headers={"X-Service-Token": settings.INTERNAL_SERVICE_TOKEN},
+                    timeout=http_client.timeout(settings.USER_SERVICE_TIMEOUT)
+                )
+                response.raise_for_status()
+                self._user_ids = frozenset(response.json()["user_ids"])
+                self._loaded_at = now
+                self._next_refresh = now + settings.AUTH_DENYLIST_TTL
+            except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"⚠️ Failed to refresh token deny-list: {e}")
+                self._next_refresh = now + settings.AUTH_DENYLIST_RETRY
+
+
+# Global deny-list instance
+token_deny_list = TokenDenyList()
+
+
+class KeySet:
+    """
+    Cached, parsed copy of User Service's JWKS (RS*/ES* tokens)
+    Refreshed every JWKS_TTL seconds, and early when a token names an
+    unknown kid (key rotation), at most every JWKS_MIN_REFRESH_INTERVAL seconds
+    """
+
+    def __init__(self):
+        """Initialize empty key set, loaded on first use"""
+        self._keys: Dict[str, Key] = {}
+        self._loaded = False
+        self._expires_at = 0.0
+        self._next_refresh_allowed = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self, kid: str) -> Optional[Key]:
+        """
+        Get the public key of a key ID
+        
+        Args:
+            kid: Key ID from the token header
+        
+        Returns:
+            Parsed public key, or None if User Service does not publish it
+        
+        Raises:
+            KeySetUnavailableError: If the key set was never loaded
+        """
+        now = time.monotonic()
+        if now >= self._expires_at or (kid not in self._keys and now >= self._next_refresh_allowed):
+            await self._refresh()
+
+        if not self._loaded:
+            raise KeySetUnavailableError("Không thể tải khóa công khai từ User Service")
+        return self._keys.get(kid)
+
+    async def _refresh(self):
+        """
+        Fetch and parse the JWKS
+        A failed fetch keeps the current keys
+        """
+        async with self._lock:
+            now = time.monotonic()
+            if now < self._next_refresh_allowed:
+                # Refreshed by a concurrent request while we waited
+                return
+            self._next_refresh_allowed = now + settings.JWKS_MIN_REFRESH_INTERVAL
+
+            try:
+                response = await http_client.client.get(
+                    settings.JWKS_URL or f"{settings.USER_SERVICE_URL}/.well-known/jwks.json",
+                    timeout=http_client.timeout(settings.USER_SERVICE_TIMEOUT)
+                )
+                response.raise_for_status()
+                keys = {
+                    key["kid"]: jwk.construct(key, algorithm=settings.JWT_ALGORITHM)
+                    for key in response.json()["keys"]
+                    if key.get("alg", settings.JWT_ALGORITHM) == settings.JWT_ALGORITHM
+                }
+            except (httpx.HTTPError, JWTError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"⚠️ Failed to refresh JWKS: {e}")
+                return
+
+            self._keys = keys
+            self._loaded = True
+            self._expires_at = now + settings.JWKS_TTL
+
+
+# Global key set instance
+key_set = KeySet()
+
+
+async def decode_token(token: str) -> Optional[dict]:
+    """
+    Verify a token's signature and expiry
+    HS* tokens are checked with the shared key, RS*/ES* tokens with the
+    public key named by their kid header
+    
+    Args:
+        token: JWT token
+    
+    Returns:
+        Token claims if valid, None otherwise
+    
+    Raises:
+        KeySetUnavailableError: If the public keys cannot be loaded
+    """
+    try:
+        if settings.JWT_ALGORITHM.startswith("HS"):
+            key = settings.JWT_SECRET_KEY
+        else:
+            kid = jwt.get_unverified_header(token).get("kid")
+            key = await key_set.get(kid) if kid else None
+            if key is None:
+                return None
+        return jwt.decode(token, key, algorithms=[settings.JWT_ALGORITHM])
+    except JWTError:
+        return None
+
+
+async def verify_token(token: str) -> Optional[dict]:
+    """
+    Validate a token without calling User Service per request
+    
+    Args:
+        token: JWT token
+    
+    Returns:
+        Same shape as User Service's /validate-token response, or None if
+        the token carries no user ID claim (issued before local verification
+        was enabled) and must be validated remotely
+    
+    Raises:
+        VerifierUnavailableError: If the public keys or deny-list cannot be loaded
+    """
+    claims = await decode_token(token)
+    if claims is None:
+        return {"valid": False}
+
+    username = claims.get("sub")
+    user_id = claims.get("uid")
+    if username is None or user_id is None:
+        return None
+
+    if await token_deny_list.contains(user_id):
+        logger.warning(f"❌ Token of deactivated user {user_id} rejected")
+        return {"valid": False}
+
+    return {"valid": True, "username": username, "user_id": user_id}
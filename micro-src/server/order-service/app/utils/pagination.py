@@ -0,0 +1,62 @@
+"""
+Cursor Pagination - Opaque keyset cursors for list endpoints
+A cursor encodes the sort key of the last row of a page, so the next page
+is read with an index range scan instead of OFFSET
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import NamedTuple, Optional, Union
+
+
+class Cursor(NamedTuple):
+    """Sort key of the last row of a page"""
+
+    id: int
+    created_at: Optional[datetime] = None
+
+
+def encode_cursor(id: int, created_at: Union[datetime, str, None] = None) -> str:
+    """
+    Encode the last row of a page as an opaque cursor
+    
+    Args:
+        id: ID of the last row
+        created_at: Creation time of the last row, if it is part of the sort key
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {"id": id}
+    if created_at is not None:
+        payload["created_at"] = created_at if isinstance(created_at, str) else created_at.isoformat()
+
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode a cursor produced by encode_cursor
+    
+    Args:
+        cursor: Cursor string from the client
+        
+    Returns:
+        Decoded cursor
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        created_at = payload.get("created_at")
+        return Cursor(
+            id=int(payload["id"]),
+            created_at=datetime.fromisoformat(created_at) if created_at else None,
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError("Invalid cursor") from e
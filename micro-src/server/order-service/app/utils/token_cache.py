@@ -0,0 +1,299 @@
+"""
+Token Validation Cache - Reuse User Service /validate-token results
+Results are kept per token hash in an in-process LRU (per worker) and,
+when TOKEN_CACHE_REDIS_URL is set, in Redis shared by all instances.
+Valid results never outlive the token's exp; invalid ones are kept for
+TOKEN_CACHE_NEGATIVE_TTL seconds. Concurrent validations of the same token
+share one call to User Service, and entries of a deactivated user are
+purged when User Service publishes user.deactivated
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+import redis.asyncio as aioredis
+from jose import JWTError, jwt
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cached result of one token: auth:token:{sha256(token)}
+TOKEN_KEY_PREFIX = "auth:token:"
+
+# Hashes of a user's cached tokens, used to purge them: auth:user-tokens:{user_id}
+USER_TOKENS_KEY_PREFIX = "auth:user-tokens:"
+
+
+class TokenValidationCache:
+    """
+    Cache of token validation results in front of User Service
+    Only answers from User Service are cached; connection errors are not
+    """
+
+    def __init__(self):
+        """Initialize empty cache; Redis is attached by connect()"""
+        # token hash -> (result, expires at)
+        self._entries: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+        # user ID -> token hashes, so a deactivation purges all of them
+        self._user_tokens: Dict[int, Set[str]] = {}
+        # In-flight validations per token hash (single-flight)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Bumped on every purge; a validation that started earlier is not stored
+        self._purge_epoch = 0
+        self.redis_client: Optional[aioredis.Redis] = None
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def connect(self):
+        """
+        Attach the shared Redis tier if TOKEN_CACHE_REDIS_URL is set
+        The client is kept even if Redis is down; the cache then works per
+        process until Redis comes back
+        """
+        if not settings.TOKEN_CACHE_ENABLED or not settings.TOKEN_CACHE_REDIS_URL:
+            return
+
+        self.redis_client = aioredis.from_url(
+            settings.TOKEN_CACHE_REDIS_URL,
+            socket_timeout=settings.TOKEN_CACHE_REDIS_TIMEOUT,
+            socket_connect_timeout=settings.TOKEN_CACHE_REDIS_TIMEOUT,
+        )
+        try:
+            await self.redis_client.ping()
+            logger.info("✅ Token cache connected to Redis")
+        except (RedisError, OSError) as e:
+            logger.error(f"❌ Token cache failed to connect to Redis: {e}")
+
+    async def close(self):
+        """
+        Close the Redis connection pool
+        """
+        if self.redis_client:
+            await self.redis_client.aclose()
+            self.redis_client = None
+
+    @staticmethod
+    def _hash(token: str) -> str:
+        """Cache key of a token; the token itself is never stored"""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    async def get_or_validate(
+        self, token: str, validate: Callable[[str], Awaitable[Optional[dict]]]
+    ) -> Optional[dict]:
+        """
+        Get a token's validation result, calling User Service on a miss
+        
+        Args:
+            token: JWT token
+            validate: Calls User Service; returns its /validate-token
+                response, or None if the answer must not be cached
+        
+        Returns:
+            Validation result ({"valid": ..., "username": ..., "user_id": ...}),
+            or None if User Service gave no usable answer
+        """
+        if not settings.TOKEN_CACHE_ENABLED:
+            return await validate(token)
+
+        token_hash = self._hash(token)
+        result = self._get_local(token_hash)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        task = self._inflight.get(token_hash)
+        if task is None:
+            task = asyncio.create_task(self._load(token_hash, token, validate))
+            self._inflight[token_hash] = task
+            task.add_done_callback(lambda _: self._inflight.pop(token_hash, None))
+        else:
+            self.coalesced += 1
+
+        # Shielded: a cancelled request does not cancel the validation others wait for
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, token_hash: str, token: str, validate: Callable[[str], Awaitable[Optional[dict]]]
+    ) -> Optional[dict]:
+        """
+        Fill the local tier from Redis or User Service
+        
+        Args:
+            token_hash: Cache key of the token
+            token: JWT token
+            validate: Calls User Service
+        
+        Returns:
+            Validation result, or None if it could not be determined
+        """
+        cached = await self._get_shared(token_hash)
+        if cached is not None:
+            result, ttl = cached
+            self.hits += 1
+            self._set_local(token_hash, result, ttl)
+            return result
+
+        self.misses += 1
+        epoch = self._purge_epoch
+        result = await validate(token)
+        if result is None:
+            return None
+
+        ttl = self._ttl(token, result)
+        if ttl > 0 and epoch == self._purge_epoch:
+            self._set_local(token_hash, result, ttl)
+            await self._set_shared(token_hash, result, ttl)
+        return result
+
+    @staticmethod
+    def _ttl(token: str, result: dict) -> float:
+        """
+        How long a validation result may be reused
+        
+        Args:
+            token: JWT token
+            result: Validation result
+        
+        Returns:
+            Seconds; a valid result is never kept past the token's exp
+        """
+        if not result.get("valid"):
+            return settings.TOKEN_CACHE_NEGATIVE_TTL
+
+        try:
+            # Signature was checked by User Service; only exp is needed here
+            exp = jwt.get_unverified_claims(token).get("exp")
+        except JWTError:
+            return 0
+        if not isinstance(exp, (int, float)):
+            return 0
+        return min(settings.TOKEN_CACHE_TTL, exp - time.time())
+
+    def _get_local(self, token_hash: str) -> Optional[dict]:
+        """Get an unexpired result from the local tier"""
+        entry = self._entries.get(token_hash)
+        if entry is None:
+            return None
+
+        result, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._drop_local(token_hash)
+            return None
+
+        self._entries.move_to_end(token_hash)
+        return result
+
+    def _set_local(self, token_hash: str, result: dict, ttl: float):
+        """Store a result in the local tier, evicting least recently used entries"""
+        self._drop_local(token_hash)
+        self._entries[token_hash] = (result, time.monotonic() + ttl)
+        user_id = result.get("user_id")
+        if user_id is not None:
+            self._user_tokens.setdefault(user_id, set()).add(token_hash)
+
+        while len(self._entries) > settings.TOKEN_CACHE_MAX_ITEMS:
+            self._drop_local(next(iter(self._entries)))
+
+    def _drop_local(self, token_hash: str):
+        """Remove a result from the local tier and the user index"""
+        entry = self._entries.pop(token_hash, None)
+        if entry is None:
+            return
+
+        user_id = entry[0].get("user_id")
+        token_hashes = self._user_tokens.get(user_id)
+        if token_hashes is not None:
+            token_hashes.discard(token_hash)
+            if not token_hashes:
+                del self._user_tokens[user_id]
+
+    async def _get_shared(self, token_hash: str) -> Optional[Tuple[dict, float]]:
+        """
+        Get a result from Redis
+        
+        Returns:
+            (result, remaining TTL in seconds), or None on a miss or Redis error
+        """
+        if not self.redis_client:
+            return None
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(f"{TOKEN_KEY_PREFIX}{token_hash}")
+                pipe.pttl(f"{TOKEN_KEY_PREFIX}{token_hash}")
+                value, ttl_ms = await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis error reading token cache: {e}")
+            return None
+
+        if value is None or ttl_ms <= 0:
+            return None
+        return json.loads(value), ttl_ms / 1000
+
+    async def _set_shared(self, token_hash: str, result: dict, ttl: float):
+        """Store a result in Redis and index it under its user"""
+        if not self.redis_client:
+            return
+
+        ttl_ms = max(int(ttl * 1000), 1)
+        user_id = result.get("user_id")
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(f"{TOKEN_KEY_PREFIX}{token_hash}", json.dumps(result), px=ttl_ms)
+                if user_id is not None:
+                    user_key = f"{USER_TOKENS_KEY_PREFIX}{user_id}"
+                    pipe.sadd(user_key, token_hash)
+                    # Outlives every token hash it lists (their TTL is at most TOKEN_CACHE_TTL)
+                    pipe.expire(user_key, max(int(settings.TOKEN_CACHE_TTL), 1))
+                await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis error writing token cache: {e}")
+
+    async def purge_user(self, user_id: int):
+        """
+        Drop all cached results of a user's tokens
+        
+        Args:
+            user_id: ID of the deactivated user
+        """
+        self._purge_epoch += 1
+        for token_hash in list(self._user_tokens.get(user_id, ())):
+            self._drop_local(token_hash)
+
+        if not self.redis_client:
+            return
+
+        user_key = f"{USER_TOKENS_KEY_PREFIX}{user_id}"
+        try:
+            token_hashes = await self.redis_client.smembers(user_key)
+            keys = [f"{TOKEN_KEY_PREFIX}{h.decode()}" for h in token_hashes]
+            await self.redis_client.unlink(user_key, *keys)
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis error purging cached tokens of user {user_id}: {e}")
+
+    def stats(self) -> dict:
+        """
+        Get token cache statistics
+        
+        Returns:
+            Entry count and hit/miss/coalesced counters of this process
+        """
+        return {
+            "enabled": settings.TOKEN_CACHE_ENABLED,
+            "shared": self.redis_client is not None,
+            "items": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+# Global token cache instance
+token_validation_cache = TokenValidationCache()
@@ -0,0 +1,102 @@
+"""
+User Events Consumer - React to user.deactivated events from User Service
+Every instance binds its own exclusive queue, so each one purges its
+token cache and updates its deny-list as soon as a user is deactivated
+"""
+
+import json
+import logging
+from typing import Optional
+import aio_pika
+from aio_pika import ExchangeType, IncomingMessage
+
+from app.config import settings
+from app.utils.jwt_verifier import token_deny_list
+from app.utils.token_cache import token_validation_cache
+
+logger = logging.getLogger(__name__)
+
+# Routing key (and event name) published by User Service
+USER_DEACTIVATED = "user.deactivated"
+
+
+class UserEventsConsumer:
+    """
+    RabbitMQ Consumer for user events
+    """
+
+    def __init__(self):
+        """Initialize User Events Consumer"""
+        self.connection: Optional[aio_pika.RobustConnection] = None
+        self.channel: Optional[aio_pika.Channel] = None
+        self.queue: Optional[aio_pika.Queue] = None
+
+    async def start(self):
+        """
+        Connect to RabbitMQ and start consuming user events
+        The queue is server-named and deleted with the connection; it is
+        declared again by the robust connection after a reconnect
+        """
+        self.connection = await aio_pika.connect_robust(
+            host=settings.RABBITMQ_HOST,
+            port=settings.RABBITMQ_PORT,
+            login=settings.RABBITMQ_USER,
+            password=settings.RABBITMQ_PASSWORD,
+        )
+        self.channel = await self.connection.channel()
+
+        exchange = await self.channel.declare_exchange(
+            settings.USER_EVENTS_EXCHANGE,
+            ExchangeType.TOPIC,
+            durable=True,
+        )
+        self.queue = await self.channel.declare_queue(exclusive=True)
+        await self.queue.bind(exchange, routing_key=USER_DEACTIVATED)
+        await self.queue.consume(self.process_message)
+
+        logger.info(f"🎧 Listening for {USER_DEACTIVATED} on exchange '{settings.USER_EVENTS_EXCHANGE}'")
+
+    async def process_message(self, message: IncomingMessage):
+        """
+        Process incoming message
+        
+        Args:
+            message: Incoming RabbitMQ message
+        """
+        async with message.process():
+            try:
+                body = json.loads(message.body.decode())
+                event = body.get("event")
+                data = body.get("data", {})
+
+                if event == USER_DEACTIVATED:
+                    await self._on_user_deactivated(int(data["user_id"]))
+                else:
+                    logger.warning(f"⚠️ Unknown event type: {event}")
+
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                logger.error(f"❌ Invalid user event: {e}")
+            except Exception as e:
+                logger.error(f"❌ Error processing user event: {e}")
+
+    async def _on_user_deactivated(self, user_id: int):
+        """
+        Stop accepting a deactivated user's tokens
+        
+        Args:
+            user_id: ID of the deactivated user
+        """
+        await token_validation_cache.purge_user(user_id)
+        token_deny_list.add(user_id)
+        logger.info(f"🔒 Purged cached tokens of deactivated user {user_id}")
+
+    async def close(self):
+        """
+        Close RabbitMQ connection
+        """
+        if self.connection and not self.connection.is_closed:
+            await self.connection.close()
+
+
+# Global consumer instance
+user_events_consumer = UserEventsConsumer()
@@ -15,7 +15,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from app.database import Base
-from app.models import Product  # Import all models
+from app.models import Product, StockReservation  # Import all models
 from app.config import settings
 
 # this is the Alembic Config object, which provides
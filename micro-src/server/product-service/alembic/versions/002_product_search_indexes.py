@@ -0,0 +1,42 @@
+"""Add full-text and trigram search indexes on products
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Expression index: must stay identical to SEARCH_VECTOR_SQL in
+    # app/repositories/product_repository.py or queries will not use it.
+    # 'simple' config: no stemming dictionary exists for Vietnamese names
+    op.execute(
+        "CREATE INDEX ix_products_search_vector ON products USING gin (("
+        "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+        "))"
+    )
+
+    # Serves fuzzy (name % :q) and substring (name ILIKE '%..%') matches
+    op.execute(
+        "CREATE INDEX ix_products_name_trgm ON products USING gin (name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_name_trgm', table_name='products')
+    op.drop_index('ix_products_search_vector', table_name='products')
@@ -0,0 +1,39 @@
+"""Add composite indexes for filtered and sorted product listings
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Price range filter and price sort (id keeps the order stable)
+    op.create_index('ix_products_price_id', 'products', ['price', 'id'], unique=False)
+    # updated_since filter and updated_at sort
+    op.create_index('ix_products_updated_at_id', 'products', ['updated_at', 'id'], unique=False)
+    # In-stock listing: only rows with stock are indexed
+    op.create_index(
+        'ix_products_in_stock_id',
+        'products',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('quantity > 0')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_in_stock_id', table_name='products')
+    op.drop_index('ix_products_updated_at_id', table_name='products')
+    op.drop_index('ix_products_price_id', table_name='products')
@@ -3,14 +3,45 @@ Product Routes - Endpoints for product management
 Authentication is delegated to User Service via REST API
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
-from app.schemas import ProductCreate, ProductUpdate, ProductResponse
+from app.schemas import (
+    ProductCreate,
+    ProductUpdate,
+    ProductResponse,
+    ProductSort,
+    ProductListFilters,
+    ProductSuggestion,
+    SuggestIndexStats,
+    BulkUpsertReport,
+    StockReservationCreate,
+    StockReservationAction,
+    StockReservationResponse,
+    HotStockReport,
+)
 from app.services import ProductService
+from app.services.hot_stock_reconciler import hot_stock_reconciler
+from app.services.product_service import iter_product_export
+from app.services.suggest_indexer import suggest_index, suggest_indexer
 from app.api.deps import get_current_user
+from app.utils.bulk_import import UPLOAD_FORMATS, BulkImportError, iter_upload_rows
+from app.utils.http_cache import (
+    cache_headers,
+    http_date,
+    is_not_modified,
+    listing_etag,
+    not_modified,
+    product_etag,
+)
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
@@ -19,38 +50,407 @@ router = APIRouter(prefix="/products", tags=["Products"])
     "",
     response_model=List[ProductResponse],
     summary="Get all products",
-    description="Get all products with pagination (no authentication required)"
+    description="Get products with filters, sorting and offset or cursor pagination (no authentication required)"
 )
-def get_products(
+async def get_products(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of products to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of products"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    min_price: Optional[Decimal] = Query(None, ge=0, description="Minimum price (inclusive)"),
+    max_price: Optional[Decimal] = Query(None, ge=0, description="Maximum price (inclusive)"),
+    in_stock: Optional[bool] = Query(None, description="true: only in stock, false: only sold out"),
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=100, description="Name starts with (case-insensitive)"),
+    updated_since: Optional[datetime] = Query(None, description="Only products updated at or after this time (ISO 8601)"),
+    sort: ProductSort = Query(ProductSort.ID, description="Sort order, '-' prefix for descending"),
     db: Session = Depends(get_db)
 ):
     """
-    Get all products
+    Get products, filtered and sorted on the server
     
     **Query Parameters:**
     - **skip**: Number of products to skip (offset) - default: 0
     - **limit**: Maximum number of products to return - default: 100
+    - **cursor**: Opaque cursor of the previous page (cannot be combined with skip)
+    - **min_price** / **max_price**: Price range (inclusive)
+    - **in_stock**: `true` for products with quantity > 0, `false` for sold out ones
+    - **name_prefix**: Name starts with this text (case-insensitive)
+    - **updated_since**: Only products updated at or after this time
+    - **sort**: `id` (default), `name`, `price`, `-price`, `updated_at`, `-updated_at`
     
     **Response:**
     - List of products with full information
+    - `X-Next-Cursor` header when more products may follow and `sort=id`;
+      pass it as `cursor` to get the next page without the cost of a deep OFFSET
+    - `ETag` of the page; send it back in `If-None-Match` to get an empty
+      304 while no product on the page changed
+    
+    **Errors:**
+    - 422: Invalid cursor, cursor combined with skip or another sort order,
+      or min_price greater than max_price
+    
+    **Note:** This endpoint does not require authentication
+    """
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Giá tối thiểu không được lớn hơn giá tối đa"
+        )
+
+    page_cursor = None
+    if cursor is not None:
+        if skip:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Không thể dùng đồng thời skip và cursor"
+            )
+        if sort != ProductSort.ID:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Cursor chỉ hỗ trợ sắp xếp theo id"
+            )
+        try:
+            page_cursor = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Cursor phân trang không hợp lệ"
+            )
+
+    filters = ProductListFilters(
+        min_price=min_price,
+        max_price=max_price,
+        in_stock=in_stock,
+        name_prefix=name_prefix,
+        updated_since=updated_since,
+        sort=sort,
+    )
+
+    product_service = ProductService(db)
+    products = await product_service.get_all_products(
+        skip=skip,
+        limit=limit,
+        cursor=page_cursor,
+        filters=filters
+    )
+
+    # No Last-Modified: removing a product does not move the page's newest updated_at
+    headers = cache_headers(listing_etag(products))
+    if len(products) == limit and sort == ProductSort.ID:
+        headers["X-Next-Cursor"] = encode_cursor(products[-1]["id"])
+
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+
+    response.headers.update(headers)
+    return products
+
+
+@router.get(
+    "/batch",
+    response_model=List[ProductResponse],
+    summary="Get many products",
+    description="Get many products by ID in one request (no authentication required)"
+)
+async def get_products_batch(
+    ids: str = Query(..., description="Comma-separated product IDs, e.g. 1,2,3"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get many products by ID
+    
+    **Query Parameters:**
+    - **ids**: Comma-separated product IDs (maximum `BATCH_MAX_IDS`)
+    
+    **Response:**
+    - List of found products in request order (unknown IDs are omitted)
+    
+    **Errors:**
+    - 422: Invalid or too many IDs
+    
+    **Note:** This endpoint does not require authentication
+    """
+    try:
+        product_ids = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Danh sách ID sản phẩm không hợp lệ"
+        )
+
+    if not product_ids or len(product_ids) > settings.BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Cần từ 1 đến {settings.BATCH_MAX_IDS} ID sản phẩm"
+        )
+
+    product_service = ProductService(db)
+    return await product_service.get_products_by_ids(product_ids)
+
+
+@router.get(
+    "/search",
+    response_model=List[ProductResponse],
+    summary="Search products",
+    description="Full-text and fuzzy product search (no authentication required)"
+)
+async def search_products(
+    q: str = Query(..., min_length=1, max_length=100, description="Search text"),
+    skip: int = Query(0, ge=0, description="Number of results to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    db: Session = Depends(get_db)
+):
+    """
+    Search products by name and description
+    
+    **Query Parameters:**
+    - **q**: Search text; every word is prefix-matched ("lap" finds "Laptop")
+      and names tolerate small typos
+    - **skip**: Number of results to skip - default: 0
+    - **limit**: Maximum number of results to return - default: 20
+    
+    **Response:**
+    - List of matching products, most relevant first
+      (name matches rank above description matches)
+    
+    **Note:** This endpoint does not require authentication
+    """
+    product_service = ProductService(db)
+    return await product_service.search_products(q, skip=skip, limit=limit)
+
+
+@router.get(
+    "/suggest",
+    response_model=List[ProductSuggestion],
+    summary="Autocomplete products",
+    description="Product name suggestions from the in-memory index (no authentication required)"
+)
+async def suggest_products(
+    q: str = Query(..., min_length=1, max_length=100, description="Text typed so far"),
+    limit: int = Query(10, ge=1, le=20, description="Maximum number of suggestions"),
+):
+    """
+    Suggest products while the user types
+    
+    **Query Parameters:**
+    - **q**: Text typed so far; every word is prefix-matched, accents are optional
+      ("chuot khong" finds "Chuột không dây")
+    - **limit**: Maximum number of suggestions - default: 10
+    
+    **Response:**
+    - List of `{id, name}`, name matches first
+    
+    **Errors:**
+    - 503: Index is still being built after startup
+    
+    **Note:** Served from worker memory, never queries the database
+    """
+    if not settings.SUGGEST_INDEX_ENABLED or not suggest_index.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Chỉ mục gợi ý sản phẩm chưa sẵn sàng",
+            headers={"Retry-After": "5"}
+        )
+
+    return suggest_index.suggest(q, limit=limit)
+
+
+@router.post(
+    "/suggest/rebuild",
+    response_model=SuggestIndexStats,
+    summary="Rebuild suggest index",
+    description="Rebuild this worker's suggest index from the database (requires JWT token)"
+)
+async def rebuild_suggest_index(
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Rebuild the suggest index of the worker handling the request (Requires authentication)
+    
+    Suggestions keep being served from the old index until the new one is ready.
+    
+    **Response:**
+    - Index statistics after the rebuild
+    
+    **Errors:**
+    - 401: Not logged in or invalid token
+    - 503: Suggest index is disabled
+    """
+    if not settings.SUGGEST_INDEX_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Chỉ mục gợi ý sản phẩm đang tắt"
+        )
+
+    return await suggest_indexer.rebuild()
+
+
+@router.get(
+    "/changes",
+    response_model=List[ProductResponse],
+    summary="Get changed products",
+    description="Incremental sync: products created or updated since a point in time (no authentication required)"
+)
+async def get_product_changes(
+    response: Response,
+    updated_since: datetime = Query(..., description="Only products updated at or after this time (ISO 8601)"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    limit: int = Query(100, ge=1, le=settings.CHANGES_MAX_LIMIT, description="Maximum number of products"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get products changed since the last sync, oldest change first
+    
+    **Query Parameters:**
+    - **updated_since**: Start of the sync window
+    - **cursor**: Position after the last product already synced
+    - **limit**: Maximum number of products to return - default: 100
+    
+    **Response:**
+    - Products ordered by (updated_at, id)
+    - `X-Next-Cursor` header with the position after the last product of
+      the page; keep it and pass it back to resume from there. An empty
+      page means the consumer is up to date.
+    
+    Deletions are not listed here; they are published as `product.deleted`
+    events on the `product_events` exchange.
+    
+    **Errors:**
+    - 422: Invalid cursor or updated_since
     
     **Note:** This endpoint does not require authentication
     """
+    page_cursor = None
+    if cursor is not None:
+        try:
+            page_cursor = decode_cursor(cursor)
+        except ValueError:
+            page_cursor = None
+        if page_cursor is None or page_cursor.updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Cursor phân trang không hợp lệ"
+            )
+
     product_service = ProductService(db)
-    products = product_service.get_all_products(skip=skip, limit=limit)
+    products = await product_service.get_changed_products(
+        updated_since=updated_since,
+        cursor=page_cursor,
+        limit=limit
+    )
+
+    if products:
+        last = products[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.id, updated_at=last.updated_at)
+    elif cursor is not None:
+        # Nothing new yet: the consumer keeps its position
+        response.headers["X-Next-Cursor"] = cursor
     return products
 
 
+_EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+@router.get(
+    "/export",
+    summary="Export all products",
+    description="Stream the whole catalog as NDJSON or CSV, optionally gzipped (requires JWT token)",
+    response_class=StreamingResponse,
+)
+async def export_products(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    gzip: bool = Query(False, description="Gzip the file"),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Export a full snapshot of the catalog (Requires authentication)
+    
+    **Query Parameters:**
+    - **format**: `ndjson` (default, one product per line) or `csv`
+    - **gzip**: Compress the file (`.gz`) - default: false
+    
+    **Response:**
+    - Products ordered by ID, streamed as they are read from a server-side
+      cursor, so memory stays constant for any catalog size
+    - CSV files can be uploaded back to `POST /products/bulk`
+    
+    **Errors:**
+    - 401: Not logged in or invalid token
+    - 422: Unknown format
+    
+    **Authentication:**
+    - Requires JWT token in header: `Authorization: Bearer <token>`
+    - Token is validated via User Service REST API
+    """
+    filename = f"products.{export_format}"
+    media_type = _EXPORT_MEDIA_TYPES[export_format]
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        iter_product_export(export_format, compress=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get(
+    "/hot-stock",
+    response_model=HotStockReport,
+    summary="Hot stock report",
+    description="Compare Redis stock counters of hot products with the database (requires JWT token)"
+)
+async def get_hot_stock_report(
+    db: Session = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Hot stock reconciliation report (Requires authentication)
+    
+    Hot products (HOT_STOCK_PRODUCT_IDS) keep their available quantity in
+    Redis during flash sales; reservations are written to the database in
+    batches every HOT_STOCK_RECONCILE_INTERVAL seconds.
+    
+    **Response:**
+    - Per product: Redis counter, database quantity, change pending
+      reconciliation and **drift** (0 when Redis and database agree)
+    - Reconciliation counters of the instance that answered
+    
+    **Errors:**
+    - 401: Not logged in or invalid token
+    - 503: Redis unavailable
+    """
+    product_service = ProductService(db)
+    try:
+        products = await product_service.get_hot_stock_report()
+    except (RedisError, OSError):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Không thể đọc số lượng tồn kho từ Redis"
+        )
+
+    return HotStockReport(
+        enabled=settings.HOT_STOCK_ENABLED,
+        reconcile_interval=settings.HOT_STOCK_RECONCILE_INTERVAL,
+        products=products,
+        **hot_stock_reconciler.stats
+    )
+
+
 @router.get(
     "/{product_id}",
     response_model=ProductResponse,
     summary="Get product details",
     description="Get detailed information of a product (no authentication required)"
 )
-def get_product(
+async def get_product(
     product_id: int,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
@@ -61,22 +461,31 @@ def get_product(
     
     **Response:**
     - Product detailed information
+    - `ETag` and `Last-Modified`; send them back in `If-None-Match` /
+      `If-Modified-Since` to get an empty 304 while the product is unchanged
     
     **Errors:**
     - 404: Product not found
     
-    **Note:** This endpoint does not require authentication
+    **Note:** This endpoint does not require authentication.
+    The body is served pre-rendered from the cache, `response_model`
+    only documents its shape.
     """
     product_service = ProductService(db)
-    product = product_service.get_product_by_id(product_id)
+    document = await product_service.get_product_json(product_id)
 
-    if product is None:
+    if document is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Không tìm thấy sản phẩm có ID: {product_id}"
         )
 
-    return product
+    body, updated_at = document
+    headers = cache_headers(product_etag(product_id, updated_at), http_date(updated_at))
+    if is_not_modified(request, headers["ETag"], headers["Last-Modified"]):
+        return not_modified(headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post(
@@ -112,10 +521,81 @@ async def create_product(
     - Token is validated via User Service REST API
     """
     product_service = ProductService(db)
-    product = product_service.create_product(product_data)
+    product = await product_service.create_product(product_data)
     return product
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkUpsertReport,
+    summary="Bulk create or update products",
+    description="Import products from a streamed NDJSON or CSV upload (requires JWT token)",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def bulk_upsert_products(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Create or update many products in one request (Requires authentication)
+    
+    **Request Body** (streamed, not buffered):
+    - `Content-Type: application/x-ndjson`: one product object per line
+    - `Content-Type: text/csv`: header row with `name,price,quantity`
+      and optional `id,description` columns
+    
+    Rows with an `id` update that product (or create it with that ID),
+    rows without one create a new product.
+    
+    **Response:**
+    - Counts of received, created, updated and failed rows
+    - Line number and reasons of each failed row
+    
+    **Errors:**
+    - 401: Not logged in or invalid token
+    - 415: Unsupported content type
+    - 422: Invalid CSV header
+    - 501: Database does not support bulk imports (PostgreSQL/SQLite only)
+    
+    **Authentication:**
+    - Requires JWT token in header: `Authorization: Bearer <token>`
+    - Token is validated via User Service REST API
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    upload_format = UPLOAD_FORMATS.get(content_type)
+    if upload_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Định dạng tệp không được hỗ trợ, hãy dùng NDJSON hoặc CSV"
+        )
+
+    product_service = ProductService(db)
+    if not product_service.supports_bulk_upsert():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Cơ sở dữ liệu hiện tại không hỗ trợ nhập hàng loạt"
+        )
+
+    try:
+        return await product_service.bulk_upsert_products(
+            iter_upload_rows(request.stream(), upload_format)
+        )
+    except BulkImportError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+
+
 @router.put(
     "/{product_id}",
     response_model=ProductResponse,
@@ -155,7 +635,7 @@ async def update_product(
     **Note:** Only provide fields to update
     """
     product_service = ProductService(db)
-    product = product_service.update_product(product_id, product_data)
+    product = await product_service.update_product(product_id, product_data)
 
     if product is None:
         raise HTTPException(
@@ -195,7 +675,7 @@ async def delete_product(
     - Token is validated via User Service REST API
     """
     product_service = ProductService(db)
-    success = product_service.delete_product(product_id)
+    success = await product_service.delete_product(product_id)
 
     if not success:
         raise HTTPException(
@@ -204,3 +684,152 @@ async def delete_product(
         )
 
     return None
+
+
+def _reservation_response(reservation, remaining_quantity: Optional[int] = None) -> StockReservationResponse:
+    """Build the API response of a reservation"""
+    return StockReservationResponse.model_validate(reservation).model_copy(
+        update={"remaining_quantity": remaining_quantity}
+    )
+
+
+async def _raise_reservation_not_open(product_service: ProductService, product_id: int, reservation_id: int):
+    """
+    Explain why a release/commit matched no open reservation
+    
+    Raises:
+        HTTPException: 404 if the reservation does not belong to the product,
+            409 if it was already committed or released
+    """
+    reservation = await product_service.get_reservation(reservation_id)
+    if reservation is None or reservation.product_id != product_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Không tìm thấy phiếu giữ hàng có ID: {reservation_id}"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Phiếu giữ hàng {reservation_id} đã ở trạng thái {reservation.status.value}"
+    )
+
+
+@router.post(
+    "/{product_id}/reserve",
+    response_model=StockReservationResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Reserve stock",
+    description="Atomically take stock for a pending order (requires JWT token)"
+)
+async def reserve_stock(
+    product_id: int,
+    reservation_data: StockReservationCreate,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Reserve product stock (Requires authentication)
+    
+    The check and the decrement are one conditional UPDATE in the database,
+    so concurrent orders can never oversell. The reservation is released
+    automatically after **ttl_seconds** unless it is committed.
+    
+    **Request Body:**
+    - **quantity**: Quantity to reserve (> 0)
+    - **reference**: Optional idempotency key, e.g. a checkout ID; repeating
+      a request with the same reference returns the existing reservation (200)
+    - **ttl_seconds**: Optional lifetime (default RESERVATION_TTL)
+    
+    **Errors:**
+    - 401: Not logged in or invalid token
+    - 404: Product not found
+    - 409: Not enough stock, or reference used for another product
+    - 503: Redis unavailable (hot products only)
+    """
+    product_service = ProductService(db)
+    try:
+        reservation, remaining = await product_service.reserve_stock(product_id, reservation_data)
+    except (RedisError, OSError):
+        # Hot products are only reserved from their Redis counter
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Không thể giữ hàng lúc này, vui lòng thử lại"
+        )
+
+    if reservation is None:
+        if remaining is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Không tìm thấy sản phẩm có ID: {product_id}"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Sản phẩm không đủ số lượng. Còn lại: {remaining}, Yêu cầu: {reservation_data.quantity}"
+        )
+
+    if reservation.product_id != product_id:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Mã tham chiếu '{reservation_data.reference}' đã được dùng cho sản phẩm khác"
+        )
+
+    if remaining is None:
+        # Idempotent repeat of an earlier request
+        response.status_code = status.HTTP_200_OK
+
+    return _reservation_response(reservation, remaining)
+
+
+@router.post(
+    "/{product_id}/release",
+    response_model=StockReservationResponse,
+    summary="Release reservation",
+    description="Give the stock of an open reservation back (requires JWT token)"
+)
+async def release_reservation(
+    product_id: int,
+    action: StockReservationAction,
+    db: Session = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Release an open reservation, e.g. when the order failed (Requires authentication)
+    
+    **Errors:**
+    - 401: Not logged in or invalid token
+    - 404: Reservation not found for this product
+    - 409: Reservation already committed or released
+    """
+    product_service = ProductService(db)
+    reservation, remaining = await product_service.release_reservation(product_id, action.reservation_id)
+    if reservation is None:
+        await _raise_reservation_not_open(product_service, product_id, action.reservation_id)
+    return _reservation_response(reservation, remaining)
+
+
+@router.post(
+    "/{product_id}/commit",
+    response_model=StockReservationResponse,
+    summary="Commit reservation",
+    description="Make an open reservation final (requires JWT token)"
+)
+async def commit_reservation(
+    product_id: int,
+    action: StockReservationAction,
+    db: Session = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Commit an open reservation once the order is stored (Requires authentication)
+    Repeating the commit of a committed reservation returns it again
+    
+    **Errors:**
+    - 401: Not logged in or invalid token
+    - 404: Reservation not found for this product
+    - 409: Reservation already released (e.g. expired)
+    """
+    product_service = ProductService(db)
+    reservation = await product_service.commit_reservation(product_id, action.reservation_id)
+    if reservation is None:
+        await _raise_reservation_not_open(product_service, product_id, action.reservation_id)
+    return _reservation_response(reservation)
@@ -20,12 +20,126 @@ class Settings(BaseSettings):
     # User Service Configuration
     USER_SERVICE_URL: str = "http://localhost:8001"
 
+    # Shared HTTP Client (pooled keep-alive connections to other services)
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE: int = 20  # Idle connections kept open for reuse
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle connection is kept
+    HTTP_CLIENT_HTTP2: bool = False  # Requires the h2 package (httpx[http2])
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 1.0
+    HTTP_CLIENT_TIMEOUT: float = 5.0  # Default for upstreams without their own timeout
+    USER_SERVICE_TIMEOUT: float = 5.0
+
+    # Local JWT Verification
+    # "remote": validate every token via User Service /validate-token
+    # "local": verify signature and expiry here, only fetch User Service's deny-list
+    AUTH_MODE: str = "remote"
+    JWT_SECRET_KEY: str = "your-secret-key-change-this-in-production-min-32-characters"  # User Service SECRET_KEY (HS* only)
+    JWT_ALGORITHM: str = "HS256"  # User Service ALGORITHM; RS*/ES* verify with its JWKS, no secret needed
+    JWKS_URL: str = ""  # Default: {USER_SERVICE_URL}/.well-known/jwks.json
+    JWKS_TTL: float = 300.0  # Seconds between key set refreshes
+    JWKS_MIN_REFRESH_INTERVAL: float = 10.0  # Min seconds between refreshes for unknown kids
+    AUTH_DENYLIST_TTL: float = 30.0  # Seconds between deny-list refreshes
+    AUTH_DENYLIST_RETRY: float = 5.0  # Seconds before retrying a failed refresh
+    AUTH_DENYLIST_MAX_STALE: float = 300.0  # Reject tokens when the list is older than this
+    INTERNAL_SERVICE_TOKEN: str = "your-internal-service-token-change-this-in-production"  # User Service INTERNAL_SERVICE_TOKEN
+
+    # Token Validation Cache (User Service /validate-token results)
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_TTL: float = 60.0  # Max seconds a valid result is reused (never past the token's exp)
+    TOKEN_CACHE_NEGATIVE_TTL: float = 5.0  # Seconds an invalid result is reused
+    TOKEN_CACHE_MAX_ITEMS: int = 10000  # Local entries per worker (LRU)
+    TOKEN_CACHE_REDIS_URL: str = ""  # e.g. redis://redis:6379/0 to share results; empty = per process only
+    TOKEN_CACHE_REDIS_TIMEOUT: float = 0.5
+
+    # User Events (user.deactivated purges cached tokens)
+    USER_EVENTS_ENABLED: bool = True
+    USER_EVENTS_EXCHANGE: str = "user_events"
+
+    # RabbitMQ Configuration (product change events)
+    RABBITMQ_HOST: str = "localhost"
+    RABBITMQ_PORT: int = 5672
+    RABBITMQ_USER: str = "guest"
+    RABBITMQ_PASSWORD: str = "guest"
+    RABBITMQ_EXCHANGE: str = "product_events"
+    PRODUCT_EVENTS_ENABLED: bool = True
+
     # Redis Configuration
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = ""
     CACHE_TTL: int = 300  # 5 minutes default
+    CACHE_CODEC: str = "orjson"  # "json", "orjson" or "msgpack"
+    REDIS_MAX_CONNECTIONS: int = 50  # Shared asyncio connection pool per worker
+    # Fail fast and fall back to the database when Redis is slow
+    REDIS_SOCKET_TIMEOUT: float = 1.0
+    REDIS_CONNECT_TIMEOUT: float = 1.0
+
+    CACHE_CLEAR_BATCH_SIZE: int = 500  # Keys per SCAN/UNLINK round-trip in clear_all
+
+    # Listing pages are invalidated by bumping the catalog version,
+    # the TTL only bounds how long orphaned pages stay in Redis
+    LISTING_CACHE_TTL: int = 300
+
+    # Cache Stampede Protection
+    CACHE_STALE_TTL: int = 60  # Serve expired entries this long while one request refreshes
+    CACHE_EARLY_REFRESH_BETA: float = 1.0  # Probabilistic early refresh, 0 disables
+    CACHE_LOCK_ENABLED: bool = False  # Cross-process fill lock in Redis
+    CACHE_LOCK_TIMEOUT_MS: int = 5000
+    CACHE_LOCK_WAIT_MS: int = 2000
+
+    # Local Cache Configuration (in-process tier in front of Redis, per worker)
+    LOCAL_CACHE_ENABLED: bool = True
+    LOCAL_CACHE_MAX_ITEMS: int = 10000
+    LOCAL_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64 MB per worker
+    # Safe to keep long: writes are broadcast on the invalidation channel
+    LOCAL_CACHE_TTL: int = 300
+
+    # Cache Invalidation Bus (Redis pub/sub shared by all workers and replicas)
+    CACHE_INVALIDATION_ENABLED: bool = True
+    CACHE_INVALIDATION_CHANNEL: str = "product-service:cache-invalidation"
+
+    # Cache Write Policy and Warming
+    CACHE_WRITE_MODE: str = "invalidate"  # "invalidate" or "write_through"
+    CACHE_WARM_ENABLED: bool = True  # Preload hot products on startup
+    CACHE_WARM_TOP_N: int = 1000
+    CACHE_WARM_BATCH_SIZE: int = 100  # Products per MGET / IN query / pipeline
+    HOT_PRODUCTS_FLUSH_INTERVAL: float = 10.0  # Seconds between access count flushes to Redis
+    HOT_PRODUCTS_TTL: int = 86400  # Ranking is dropped after a day without traffic
+
+    # Suggest Index (in-process autocomplete, per worker)
+    SUGGEST_INDEX_ENABLED: bool = True
+    SUGGEST_INDEX_MAX_BYTES: int = 32 * 1024 * 1024  # 32 MB per worker
+    SUGGEST_INDEX_BUILD_BATCH_SIZE: int = 1000  # Rows per round-trip of the startup scan
+
+    # HTTP Caching (Cache-Control of GET /products and GET /products/{id})
+    HTTP_CACHE_MAX_AGE: int = 0  # Browsers revalidate with ETag on every use
+    HTTP_CACHE_S_MAXAGE: int = 30  # Shared caches (CDN, nginx) may serve this long
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = 60
+
+    # Stock Reservations
+    RESERVATION_TTL: int = 900  # Seconds before an uncommitted reservation gives its stock back
+    RESERVATION_SWEEP_INTERVAL: float = 30.0  # Seconds between expired reservation sweeps
+    RESERVATION_SWEEP_BATCH_SIZE: int = 100
+
+    # Hot Stock (flash sales): available quantity of these products lives in
+    # Redis and is written to the database in batches instead of per reservation
+    # Can be set via environment variable as comma-separated IDs, e.g. HOT_STOCK_PRODUCT_IDS="1,42"
+    HOT_STOCK_ENABLED: bool = False
+    HOT_STOCK_PRODUCT_IDS: Union[List[int], str] = []
+    HOT_STOCK_RECONCILE_INTERVAL: float = 1.0  # Seconds between batched writes to the database
+    HOT_STOCK_LOCK_TIMEOUT: float = 10.0  # Max seconds a reconcile/counter load holds or waits for the lock
+
+    # Batch Lookup Configuration
+    BATCH_MAX_IDS: int = 100
+
+    # Bulk Import Configuration
+    BULK_UPSERT_CHUNK_SIZE: int = 1000  # Rows validated and written per transaction
+    BULK_UPSERT_MAX_ERRORS: int = 1000  # Row errors listed in the report, the rest are only counted
+    EXPORT_BATCH_SIZE: int = 1000  # Rows per round-trip and per streamed chunk of the export
+
+    # Change Feed Configuration
+    CHANGES_MAX_LIMIT: int = 1000  # Maximum products per page of GET /products/changes
 
     # Application Configuration
     APP_NAME: str = "Product Service"
@@ -53,6 +167,16 @@ class Settings(BaseSettings):
             return v if v else "*"
         return "*"
 
+    @field_validator('HOT_STOCK_PRODUCT_IDS', mode='before')
+    @classmethod
+    def parse_hot_stock_product_ids(cls, v: Any) -> List[int]:
+        """Parse HOT_STOCK_PRODUCT_IDS from comma-separated string or list"""
+        if isinstance(v, str):
+            return [int(product_id) for product_id in v.split(',') if product_id.strip()]
+        if isinstance(v, int):
+            return [v]
+        return list(v or [])
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -2,6 +2,6 @@
 Database module for Product Service
 """
 
-from app.database.database import Base, get_db, engine
+from app.database.database import Base, get_db, engine, SessionLocal
 
-__all__ = ["Base", "get_db", "engine"]
+__all__ = ["Base", "get_db", "engine", "SessionLocal"]
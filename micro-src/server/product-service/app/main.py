@@ -10,6 +10,16 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from app.config import settings
 from app.api import products
 from app.utils.tracing import setup_tracing
+from app.utils.cache import cache_manager
+from app.utils.cache_bus import cache_invalidation_subscriber
+from app.utils.http_client import http_client
+from app.utils.rabbitmq import rabbitmq_publisher
+from app.utils.token_cache import token_validation_cache
+from app.utils.user_events import user_events_consumer
+from app.services.cache_warmer import cache_warmer
+from app.services.reservation_sweeper import reservation_sweeper
+from app.services.hot_stock_reconciler import hot_stock_reconciler
+from app.services.suggest_indexer import suggest_index, suggest_indexer
 
 # Create FastAPI application
 app = FastAPI(
@@ -22,17 +32,28 @@ app = FastAPI(
     Authentication is delegated to User Service via REST API.
     
     ### Endpoints:
-    - **GET /products** - Get all products (public)
+    - **GET /products** - List products with filters and sorting (public)
     - **GET /products/{id}** - Get product by ID (public)
+    - **GET /products/batch?ids=1,2,3** - Get many products by ID (public)
+    - **GET /products/search?q=...** - Search products by relevance (public)
+    - **GET /products/suggest?q=...** - Autocomplete from the in-memory index (public)
+    - **POST /products/suggest/rebuild** - Rebuild the suggest index (requires JWT)
+    - **GET /products/export** - Stream the whole catalog as NDJSON/CSV (requires JWT)
+    - **GET /products/changes?updated_since=...** - Incremental sync of changed products (public)
     - **POST /products** - Create new product (requires JWT)
+    - **POST /products/bulk** - Create or update products from NDJSON/CSV (requires JWT)
     - **PUT /products/{id}** - Update product (requires JWT)
     - **DELETE /products/{id}** - Delete product (requires JWT)
+    - **POST /products/{id}/reserve** - Atomically reserve stock (requires JWT)
+    - **POST /products/{id}/release** / **commit** - Finish a reservation (requires JWT)
+    - **GET /products/hot-stock** - Hot stock reconciliation report (requires JWT)
     - **GET /health** - Health check endpoint
     
     ### Architecture:
     - Independent microservice with its own database
     - Authentication via User Service REST API
     - Clean Architecture with Repository Pattern
+    - product.created/updated/deleted events published to RabbitMQ
     """,
     docs_url="/docs",
     redoc_url="/redoc",
@@ -45,6 +66,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
 )
 
 # Include routers
@@ -82,13 +104,15 @@ def root():
     summary="Health check",
     description="Check health status of Product Service"
 )
-def health_check():
+async def health_check():
     """
     Health check endpoint
     """
-    from app.utils.cache import cache_manager
-    
-    redis_status = "healthy" if cache_manager.healthcheck() else "unavailable"
+    redis_status = "healthy" if await cache_manager.healthcheck() else "unavailable"
+    if settings.PRODUCT_EVENTS_ENABLED:
+        rabbitmq_status = "healthy" if await rabbitmq_publisher.healthcheck() else "unavailable"
+    else:
+        rabbitmq_status = "disabled"
     
     return {
         "status": "healthy",
@@ -100,6 +124,16 @@ def health_check():
             "host": settings.REDIS_HOST,
             "port": settings.REDIS_PORT,
         },
+        "rabbitmq": {
+            "status": rabbitmq_status,
+            "host": settings.RABBITMQ_HOST,
+            "port": settings.RABBITMQ_PORT,
+            "exchange": settings.RABBITMQ_EXCHANGE,
+        },
+        "local_cache": cache_manager.stats(),
+        "listing_cache": cache_manager.listing_stats(),
+        "suggest_index": suggest_index.stats(),
+        "token_cache": token_validation_cache.stats(),
     }
 
 
@@ -112,8 +146,64 @@ async def startup_event():
     print(f"📖 ReDoc Documentation: http://localhost:{settings.PORT}/redoc")
     print(f"🔐 User Service URL: {settings.USER_SERVICE_URL}")
 
+    await cache_manager.connect()
+
+    # Pooled connections to User Service
+    await http_client.start()
+
+    # Reuse token validation results; purge them when a user is deactivated
+    await token_validation_cache.connect()
+    if settings.USER_EVENTS_ENABLED:
+        try:
+            await user_events_consumer.start()
+        except Exception as e:
+            print(f"⚠️ User events unavailable, cached tokens are only dropped on expiry: {e}")
+
+    # Connect to RabbitMQ for product change events
+    if settings.PRODUCT_EVENTS_ENABLED:
+        try:
+            await rabbitmq_publisher.connect()
+            print("✅ RabbitMQ connected successfully")
+        except Exception as e:
+            print(f"⚠️ RabbitMQ unavailable, product events won't be published: {e}")
+
+    # Keep the local cache tier and suggest index in sync with writes from other processes
+    cache_invalidation_subscriber.add_listener(suggest_indexer.on_invalidation)
+    await cache_invalidation_subscriber.start()
+
+    # Build the suggest index from a streaming scan without delaying startup
+    await suggest_indexer.start()
+
+    # Preload hot products without delaying startup
+    await cache_warmer.start()
+
+    # Give back stock of abandoned reservations
+    await reservation_sweeper.start()
+
+    # Flash-sale products: Redis stock counters, batched database writes
+    await hot_stock_reconciler.start()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Event handler when application shuts down"""
     print(f"🛑 {settings.APP_NAME} is shutting down...")
+
+    await reservation_sweeper.stop()
+    await hot_stock_reconciler.stop()
+    await cache_warmer.stop()
+    await suggest_indexer.stop()
+    await cache_invalidation_subscriber.stop()
+    await cache_manager.close()
+    await token_validation_cache.close()
+    await http_client.close()
+
+    try:
+        await user_events_consumer.close()
+    except Exception as e:
+        print(f"❌ Error closing user events connection: {e}")
+
+    try:
+        await rabbitmq_publisher.close()
+    except Exception as e:
+        print(f"❌ Error closing RabbitMQ connection: {e}")
@@ -3,5 +3,6 @@ Models module for Product Service
 """
 
 from app.models.product import Product
+from app.models.stock_reservation import ReservationStatus, StockReservation
 
-__all__ = ["Product"]
+__all__ = ["Product", "ReservationStatus", "StockReservation"]
@@ -5,7 +5,7 @@ Manages product information
 
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import Column, Integer, String, Numeric, DateTime
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, Index, text
 from sqlalchemy.orm import validates
 
 from app.database import Base
@@ -26,6 +26,12 @@ class Product(Base):
     """
 
     __tablename__ = "products"
+    __table_args__ = (
+        # Listing filters and sort orders (migration 003)
+        Index("ix_products_price_id", "price", "id"),
+        Index("ix_products_updated_at_id", "updated_at", "id"),
+        Index("ix_products_in_stock_id", "id", postgresql_where=text("quantity > 0")),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     name = Column(String(255), nullable=False, index=True)
@@ -0,0 +1,76 @@
+"""
+Stock Reservation Model - SQLAlchemy Model for stock_reservations table
+Tracks stock taken from a product until the order is committed or released
+"""
+
+import enum
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Index, text
+
+from app.database import Base
+
+
+class ReservationStatus(str, enum.Enum):
+    """Reservation status enumeration"""
+    RESERVED = "reserved"
+    COMMITTED = "committed"
+    RELEASED = "released"
+
+
+class StockReservation(Base):
+    """
+    Stock reservation of a product
+    
+    The reserved quantity is subtracted from the product when the reservation
+    is made; releasing it adds the quantity back, committing it makes it final.
+    
+    Attributes:
+        id (int): Primary key, auto-increment
+        product_id (int): Reserved product
+        quantity (int): Reserved quantity, > 0
+        status (ReservationStatus): reserved, committed or released
+        reference (str): Caller's idempotency key (e.g. checkout ID), unique
+        expires_at (datetime): Reserved stock is released after this time
+        created_at (datetime): Reservation time
+        updated_at (datetime): Last status change
+    """
+
+    __tablename__ = "stock_reservations"
+    __table_args__ = (
+        # Expired reservation sweep only looks at open reservations
+        Index(
+            "ix_stock_reservations_open_expires_at",
+            "expires_at",
+            postgresql_where=text("status = 'RESERVED'"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    product_id = Column(
+        Integer,
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    quantity = Column(Integer, nullable=False)
+    status = Column(
+        Enum(ReservationStatus),
+        nullable=False,
+        default=ReservationStatus.RESERVED
+    )
+    reference = Column(String(100), nullable=True, unique=True)
+    expires_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """String representation of StockReservation model"""
+        return (
+            f"<StockReservation(id={self.id}, product_id={self.product_id}, "
+            f"quantity={self.quantity}, status={self.status})>"
+        )
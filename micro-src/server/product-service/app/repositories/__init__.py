@@ -4,5 +4,6 @@ Repositories module for Product Service
 
 from app.repositories.base import BaseRepository
 from app.repositories.product_repository import ProductRepository
+from app.repositories.stock_reservation_repository import StockReservationRepository
 
-__all__ = ["BaseRepository", "ProductRepository"]
+__all__ = ["BaseRepository", "ProductRepository", "StockReservationRepository"]
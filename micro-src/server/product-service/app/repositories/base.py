@@ -31,9 +31,15 @@ class BaseRepository(Generic[ModelType]):
         """Get entity by ID"""
         return self.db.query(self.model).filter(self.model.id == id).first()
 
+    def get_by_ids(self, ids: List[int]) -> List[ModelType]:
+        """Get entities by IDs with a single IN query"""
+        if not ids:
+            return []
+        return self.db.query(self.model).filter(self.model.id.in_(ids)).all()
+
     def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        """Get all entities with pagination"""
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        """Get all entities with pagination, ordered by ID"""
+        return self.db.query(self.model).order_by(self.model.id).offset(skip).limit(limit).all()
 
     def create(self, obj_data: Dict[str, Any]) -> ModelType:
         """
@@ -2,11 +2,46 @@
 Product Repository - Data Access Layer for Product model
 """
 
+import re
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import or_, text, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from app.models import Product
 from app.repositories.base import BaseRepository
 
+# Indexed by migration 002 (ix_products_search_vector); keep both identical.
+# Name matches weigh more than description matches in the ranking
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+_SEARCH_TERM = re.compile(r"\w+")
+
+# Dialects with INSERT ... ON CONFLICT support
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Columns a bulk import row may leave out; the stored value is then kept
+_UPSERT_OPTIONAL_COLUMNS = ("description",)
+
+# Listing sort orders; ID is always the tie-breaker so pages are stable.
+# Each leading column has a (column, id) index from migration 003
+_SORT_COLUMNS = {
+    "id": (Product.id.asc(),),
+    "name": (Product.name.asc(), Product.id.asc()),
+    "price": (Product.price.asc(), Product.id.asc()),
+    "-price": (Product.price.desc(), Product.id.desc()),
+    "updated_at": (Product.updated_at.asc(), Product.id.asc()),
+    "-updated_at": (Product.updated_at.desc(), Product.id.desc()),
+}
+
 
 class ProductRepository(BaseRepository[Product]):
     """
@@ -22,3 +57,305 @@ class ProductRepository(BaseRepository[Product]):
             db: Database session
         """
         super().__init__(Product, db)
+
+    def get_recently_updated_ids(self, limit: int) -> List[int]:
+        """
+        Get IDs of the most recently updated products
+        
+        Args:
+            limit: Maximum number of IDs
+            
+        Returns:
+            Product IDs, newest first
+        """
+        rows = (
+            self.db.query(Product.id)
+            .order_by(Product.updated_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [row.id for row in rows]
+
+    def get_changed_since(
+        self,
+        updated_since: datetime,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100
+    ) -> List[Product]:
+        """
+        Get products changed at or after a point in time, oldest change first
+        Keyset-paginated on (updated_at, id), served by ix_products_updated_at_id
+        
+        Args:
+            updated_since: Only products updated at or after this time
+            after: (updated_at, id) of the last product already read
+            limit: Maximum number of products to return
+            
+        Returns:
+            List of products ordered by (updated_at, id)
+        """
+        query = self.db.query(Product).filter(Product.updated_at >= updated_since)
+        if after is not None:
+            query = query.filter(tuple_(Product.updated_at, Product.id) > after)
+        return (
+            query
+            .order_by(Product.updated_at, Product.id)
+            .limit(limit)
+            .all()
+        )
+
+    def get_filtered(
+        self,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        in_stock: Optional[bool] = None,
+        name_prefix: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+        sort: str = "id",
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> List[Product]:
+        """
+        Get products matching all given filters, in the given order
+        
+        Args:
+            min_price: Minimum price (inclusive)
+            max_price: Maximum price (inclusive)
+            in_stock: True for quantity > 0, False for sold out products
+            name_prefix: Case-insensitive name prefix
+            updated_since: Only products updated at or after this time
+            sort: One of "id", "name", "price", "-price", "updated_at", "-updated_at"
+            skip: Number of products to skip
+            limit: Maximum number of products to return
+            after_id: Keyset cursor, only valid with sort="id"
+            
+        Returns:
+            List of products
+        """
+        query = self.db.query(Product)
+
+        if min_price is not None:
+            query = query.filter(Product.price >= min_price)
+        if max_price is not None:
+            query = query.filter(Product.price <= max_price)
+        if in_stock is not None:
+            query = query.filter(Product.quantity > 0 if in_stock else Product.quantity == 0)
+        if name_prefix:
+            # Escape LIKE wildcards; ILIKE 'x%' is served by the trigram index
+            escaped = name_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query = query.filter(Product.name.ilike(f"{escaped}%", escape="\\"))
+        if updated_since is not None:
+            query = query.filter(Product.updated_at >= updated_since)
+        if after_id is not None:
+            query = query.filter(Product.id > after_id)
+
+        return (
+            query
+            .order_by(*_SORT_COLUMNS[sort])
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def supports_bulk_upsert(self) -> bool:
+        """
+        Check whether the database dialect supports bulk_upsert
+        
+        Returns:
+            True on PostgreSQL and SQLite
+        """
+        return self.db.get_bind().dialect.name in _UPSERT_INSERTS
+
+    def bulk_upsert(self, rows: List[dict]) -> Tuple[List[int], List[int]]:
+        """
+        Insert or update many products in one transaction
+        
+        Rows with an ID update that product or create it with that ID;
+        rows without an ID are always created. Writes are multi-row
+        INSERT ... ON CONFLICT (id) DO UPDATE statements, batched by the
+        driver, instead of one INSERT and refresh per product.
+        When the same ID appears twice, the last row wins.
+        An optional column missing from a row (e.g. no description column
+        in the CSV) leaves the stored value unchanged instead of clearing it.
+        
+        Args:
+            rows: Validated product dicts (name, price, quantity and
+                optional id, description)
+            
+        Returns:
+            Tuple of (created IDs, updated IDs)
+        
+        Raises:
+            NotImplementedError: If the dialect is not supported
+                (check supports_bulk_upsert first)
+        """
+        now = datetime.utcnow()
+        keyed = {}
+        new_rows = []
+        for row in rows:
+            values = {
+                "name": row["name"],
+                "price": row["price"],
+                "quantity": row["quantity"],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for column in _UPSERT_OPTIONAL_COLUMNS:
+                if column in row:
+                    values[column] = row[column]
+
+            if row.get("id") is None:
+                new_rows.append({"description": None, **values})
+            else:
+                keyed[row["id"]] = {"id": row["id"], **values}
+
+        dialect = self.db.get_bind().dialect.name
+        insert = _UPSERT_INSERTS.get(dialect)
+        if insert is None:
+            raise NotImplementedError(f"Bulk upsert is not supported on {dialect}")
+
+        # One statement per column set: each only overwrites the columns its rows carry
+        keyed_groups: Dict[Tuple[str, ...], List[dict]] = {}
+        for values in keyed.values():
+            keyed_groups.setdefault(tuple(sorted(values)), []).append(values)
+
+        try:
+            existing = set()
+            if keyed:
+                existing = {
+                    row.id for row in self.db.query(Product.id).filter(Product.id.in_(list(keyed)))
+                }
+                for columns, group in keyed_groups.items():
+                    statement = insert(Product)
+                    statement = statement.on_conflict_do_update(
+                        index_elements=[Product.id],
+                        set_={
+                            column: statement.excluded[column]
+                            for column in columns if column not in ("id", "created_at")
+                        }
+                    )
+                    self.db.execute(statement, group)
+
+                if dialect == "postgresql":
+                    # Explicit IDs do not advance the sequence; keep later inserts from colliding
+                    self.db.execute(text(
+                        "SELECT setval(pg_get_serial_sequence('products', 'id'), "
+                        "GREATEST((SELECT MAX(id) FROM products), 1))"
+                    ))
+
+            created_ids = [product_id for product_id in keyed if product_id not in existing]
+            if new_rows:
+                result = self.db.execute(
+                    insert(Product).returning(Product.id, sort_by_parameter_order=True),
+                    new_rows
+                )
+                created_ids.extend(result.scalars().all())
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return created_ids, [product_id for product_id in keyed if product_id in existing]
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator:
+        """
+        Stream all products ordered by ID as plain rows
+        Rows are fetched in batches from a server-side cursor and are not
+        tracked by the session, so memory stays flat for any catalog size.
+        On PostgreSQL the single query sees one consistent snapshot.
+        
+        Args:
+            batch_size: Rows fetched per round-trip
+            
+        Returns:
+            Iterator of rows with the Product column attributes
+        """
+        return (
+            self.db.query(
+                Product.id,
+                Product.name,
+                Product.description,
+                Product.price,
+                Product.quantity,
+                Product.created_at,
+                Product.updated_at,
+            )
+            .order_by(Product.id)
+            .yield_per(batch_size)
+        )
+
+    def iter_search_fields(self, batch_size: int = 1000) -> Iterator[Tuple[int, str, Optional[str]]]:
+        """
+        Stream (id, name, description) of all products
+        Rows are fetched in batches from a server-side cursor, so the whole
+        catalog is never held in memory at once
+        
+        Args:
+            batch_size: Rows fetched per round-trip
+            
+        Returns:
+            Iterator of (id, name, description) tuples
+        """
+        return (
+            self.db.query(Product.id, Product.name, Product.description)
+            .order_by(Product.id)
+            .yield_per(batch_size)
+        )
+
+    def search(self, query: str, skip: int = 0, limit: int = 20) -> List[Product]:
+        """
+        Search products by name and description, best matches first
+        
+        On PostgreSQL every term is prefix-matched against the full-text
+        index ("lap" finds "laptop"), and the name is also matched by
+        trigram similarity so small typos still find the product. Both
+        conditions are served by GIN indexes instead of a sequential scan.
+        
+        Args:
+            query: Search text from the user
+            skip: Number of results to skip
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of matching products ordered by relevance
+        """
+        terms = _SEARCH_TERM.findall(query.lower())
+        if not terms:
+            return []
+
+        if self.db.get_bind().dialect.name != "postgresql":
+            # Development databases without tsvector/pg_trgm
+            conditions = [Product.name.ilike(f"%{term}%") for term in terms]
+            return (
+                self.db.query(Product)
+                .filter(or_(*conditions))
+                .order_by(Product.id)
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
+
+        # Terms are plain word characters, so they are safe inside to_tsquery
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        plain = " ".join(terms)
+
+        return (
+            self.db.query(Product)
+            .filter(text(
+                f"({SEARCH_VECTOR_SQL}) @@ to_tsquery('simple', :tsquery) "
+                "OR products.name % :plain"
+            ))
+            .order_by(
+                text(
+                    f"ts_rank_cd({SEARCH_VECTOR_SQL}, to_tsquery('simple', :tsquery)) "
+                    "+ similarity(products.name, :plain) DESC"
+                ),
+                Product.id
+            )
+            .params(tsquery=tsquery, plain=plain)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
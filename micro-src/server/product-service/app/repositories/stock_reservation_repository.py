@@ -0,0 +1,300 @@
+"""
+Stock Reservation Repository - Data Access Layer for stock reservations
+Stock changes are single conditional UPDATE statements: the database checks
+and changes the quantity atomically, with no read-modify-write in Python
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import Product, ReservationStatus, StockReservation
+from app.repositories.base import BaseRepository
+
+# Columns returned by stock updates, enough to refresh the product cache
+_PRODUCT_COLUMNS = tuple(Product.__table__.c)
+
+
+class StockReservationRepository(BaseRepository[StockReservation]):
+    """
+    Repository for StockReservation model
+    Reserves, releases and commits product stock
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize StockReservationRepository
+        
+        Args:
+            db: Database session
+        """
+        super().__init__(StockReservation, db)
+
+    def get_by_reference(self, reference: str) -> Optional[StockReservation]:
+        """
+        Get reservation by the caller's idempotency key
+        
+        Args:
+            reference: Reservation reference
+        
+        Returns:
+            Reservation if found, None otherwise
+        """
+        return self.db.query(StockReservation).filter(StockReservation.reference == reference).first()
+
+    def reserve(
+        self,
+        product_id: int,
+        quantity: int,
+        expires_at: datetime,
+        reference: Optional[str] = None
+    ) -> Tuple[Optional[StockReservation], Optional[Row]]:
+        """
+        Take stock from a product and record the reservation in one transaction
+        
+        UPDATE products SET quantity = quantity - :n WHERE id = :id AND
+        quantity >= :n RETURNING ... - concurrent reservations serialize on
+        the row lock only for the duration of that statement and can never
+        take the quantity below zero.
+        
+        Args:
+            product_id: Product ID
+            quantity: Quantity to reserve
+            expires_at: When the reservation is released if not committed
+            reference: Optional idempotency key; an existing reservation
+                with this reference is returned instead of reserving again
+        
+        Returns:
+            Tuple of (reservation, updated product row). The product row is
+            None when an existing reservation was returned; both are None when
+            the product does not exist or has not enough stock.
+        """
+        if reference is not None:
+            existing = self.get_by_reference(reference)
+            if existing is not None:
+                return existing, None
+
+        now = datetime.utcnow()
+        try:
+            product = self.db.execute(
+                update(Product)
+                .where(Product.id == product_id, Product.quantity >= quantity)
+                .values(quantity=Product.quantity - quantity, updated_at=now)
+                .returning(*_PRODUCT_COLUMNS)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if product is None:
+                self.db.rollback()
+                return None, None
+
+            reservation = StockReservation(
+                product_id=product_id,
+                quantity=quantity,
+                status=ReservationStatus.RESERVED,
+                reference=reference,
+                expires_at=expires_at,
+                created_at=now,
+                updated_at=now,
+            )
+            self.db.add(reservation)
+            self.db.commit()
+        except IntegrityError:
+            # Same reference reserved concurrently: the rollback returns the stock
+            self.db.rollback()
+            existing = self.get_by_reference(reference) if reference is not None else None
+            if existing is None:
+                raise
+            return existing, None
+
+        self.db.refresh(reservation)
+        return reservation, product
+
+    def add_reservation(
+        self,
+        product_id: int,
+        quantity: int,
+        expires_at: datetime,
+        reference: Optional[str] = None
+    ) -> Tuple[StockReservation, bool]:
+        """
+        Record a reservation whose stock was already taken elsewhere
+        (hot products, see app.utils.hot_stock); the product row is not touched
+        
+        Args:
+            product_id: Product ID
+            quantity: Reserved quantity
+            expires_at: When the reservation is released if not committed
+            reference: Optional idempotency key
+        
+        Returns:
+            Tuple of (reservation, created); created is False when a
+            reservation with this reference already existed
+        """
+        now = datetime.utcnow()
+        reservation = StockReservation(
+            product_id=product_id,
+            quantity=quantity,
+            status=ReservationStatus.RESERVED,
+            reference=reference,
+            expires_at=expires_at,
+            created_at=now,
+            updated_at=now,
+        )
+        try:
+            self.db.add(reservation)
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            existing = self.get_by_reference(reference) if reference is not None else None
+            if existing is None:
+                raise
+            return existing, False
+
+        self.db.refresh(reservation)
+        return reservation, True
+
+    def release(
+        self,
+        product_id: int,
+        reservation_id: int,
+        restock: bool = True
+    ) -> Tuple[Optional[StockReservation], Optional[Row]]:
+        """
+        Release an open reservation and give its stock back to the product
+        
+        The status change is conditional (only while still reserved), so a
+        reservation is released at most once even when a caller and the
+        expiry sweep race.
+        
+        Args:
+            product_id: Product ID
+            reservation_id: Reservation ID
+            restock: Give the stock back to the product row; False when the
+                caller gives it back elsewhere (hot products)
+        
+        Returns:
+            Tuple of (released reservation, updated product row or None
+            when restock is False), or (None, None) if no open reservation matched
+        """
+        now = datetime.utcnow()
+        try:
+            released = self.db.execute(
+                update(StockReservation)
+                .where(
+                    StockReservation.id == reservation_id,
+                    StockReservation.product_id == product_id,
+                    StockReservation.status == ReservationStatus.RESERVED,
+                )
+                .values(status=ReservationStatus.RELEASED, updated_at=now)
+                .returning(StockReservation.quantity)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if released is None:
+                self.db.rollback()
+                return None, None
+
+            product = None
+            if restock:
+                product = self.db.execute(
+                    update(Product)
+                    .where(Product.id == product_id)
+                    .values(quantity=Product.quantity + released.quantity, updated_at=now)
+                    .returning(*_PRODUCT_COLUMNS)
+                    .execution_options(synchronize_session=False)
+                ).first()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return self.get_by_id(reservation_id), product
+
+    def commit(self, product_id: int, reservation_id: int) -> Optional[StockReservation]:
+        """
+        Make an open reservation final; its stock is not given back
+        Committing an already committed reservation succeeds again, so
+        callers can retry after a lost response
+        
+        Args:
+            product_id: Product ID
+            reservation_id: Reservation ID
+        
+        Returns:
+            Committed reservation, or None if no open or committed
+            reservation matched
+        """
+        result = self.db.execute(
+            update(StockReservation)
+            .where(
+                StockReservation.id == reservation_id,
+                StockReservation.product_id == product_id,
+                StockReservation.status == ReservationStatus.RESERVED,
+            )
+            .values(status=ReservationStatus.COMMITTED, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        reservation = self.get_by_id(reservation_id)
+        if result.rowcount == 0 and (
+            reservation is None
+            or reservation.product_id != product_id
+            or reservation.status != ReservationStatus.COMMITTED
+        ):
+            return None
+        return reservation
+
+    def get_expired(self, now: datetime, limit: int = 100) -> List[Tuple[int, int]]:
+        """
+        Get open reservations past their expiry
+        
+        Args:
+            now: Current time
+            limit: Maximum number of reservations
+        
+        Returns:
+            List of (reservation ID, product ID), oldest expiry first
+        """
+        rows = (
+            self.db.query(StockReservation.id, StockReservation.product_id)
+            .filter(
+                StockReservation.status == ReservationStatus.RESERVED,
+                StockReservation.expires_at < now,
+            )
+            .order_by(StockReservation.expires_at)
+            .limit(limit)
+            .all()
+        )
+        return [(row.id, row.product_id) for row in rows]
+
+    def apply_stock_deltas(self, deltas: Dict[int, int]) -> List[Row]:
+        """
+        Write batched stock changes of hot products in one transaction
+        One UPDATE per product per batch instead of one per reservation
+        
+        Args:
+            deltas: Signed quantity change per product ID
+        
+        Returns:
+            Updated product rows (deleted products are skipped)
+        """
+        now = datetime.utcnow()
+        products = []
+        try:
+            for product_id, delta in sorted(deltas.items()):
+                product = self.db.execute(
+                    update(Product)
+                    .where(Product.id == product_id)
+                    .values(quantity=Product.quantity + delta, updated_at=now)
+                    .returning(*_PRODUCT_COLUMNS)
+                    .execution_options(synchronize_session=False)
+                ).first()
+                if product is not None:
+                    products.append(product)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return products
@@ -2,6 +2,38 @@
 Schemas module for Product Service
 """
 
-from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse
+from app.schemas.product import (
+    ProductCreate,
+    ProductUpdate,
+    ProductUpsert,
+    ProductResponse,
+    ProductSort,
+    ProductListFilters,
+    ProductSuggestion,
+    SuggestIndexStats,
+    StockReservationCreate,
+    StockReservationAction,
+    StockReservationResponse,
+    HotStockProductReport,
+    HotStockReport,
+    BulkUpsertRowError,
+    BulkUpsertReport,
+)
 
-__all__ = ["ProductCreate", "ProductUpdate", "ProductResponse"]
+__all__ = [
+    "ProductCreate",
+    "ProductUpdate",
+    "ProductUpsert",
+    "ProductResponse",
+    "ProductSort",
+    "ProductListFilters",
+    "ProductSuggestion",
+    "SuggestIndexStats",
+    "StockReservationCreate",
+    "StockReservationAction",
+    "StockReservationResponse",
+    "HotStockProductReport",
+    "HotStockReport",
+    "BulkUpsertRowError",
+    "BulkUpsertReport",
+]
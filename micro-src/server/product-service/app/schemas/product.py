@@ -2,11 +2,14 @@
 Product Schemas - Pydantic models for request/response validation
 """
 
+import enum
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
 from pydantic import BaseModel, Field, field_validator
 
+from app.models.stock_reservation import ReservationStatus
+
 
 class ProductBase(BaseModel):
     """Base schema for Product with common attributes"""
@@ -21,6 +24,14 @@ class ProductCreate(ProductBase):
     pass
 
 
+class ProductUpsert(ProductBase):
+    """Schema for one row of a bulk import (updates the product if the ID exists)"""
+    # Bounded by the column types, so overflowing rows fail validation instead of a whole chunk
+    id: Optional[int] = Field(None, gt=0, le=2147483647, description="Product ID, omit to create a new product")
+    price: Decimal = Field(..., gt=0, max_digits=10, decimal_places=2, description="Product price (must be > 0)")
+    quantity: int = Field(..., ge=0, le=2147483647, description="Stock quantity (must be >= 0)")
+
+
 class ProductUpdate(BaseModel):
     """Schema for product update (all fields optional)"""
     name: Optional[str] = Field(None, min_length=1, max_length=255, description="Product name")
@@ -36,3 +47,124 @@ class ProductResponse(ProductBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ProductSort(str, enum.Enum):
+    """Sort orders of the product listing ("-" prefix: descending)"""
+    ID = "id"
+    NAME = "name"
+    PRICE = "price"
+    PRICE_DESC = "-price"
+    UPDATED_AT = "updated_at"
+    UPDATED_AT_DESC = "-updated_at"
+
+
+class ProductListFilters(BaseModel):
+    """Server-side filters and sort order of the product listing"""
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
+    in_stock: Optional[bool] = None
+    name_prefix: Optional[str] = None
+    updated_since: Optional[datetime] = None
+    sort: ProductSort = ProductSort.ID
+
+    # Keep sort as its plain string value for the repository
+    model_config = {"use_enum_values": True}
+
+
+class ProductSuggestion(BaseModel):
+    """Schema for an autocomplete suggestion"""
+    id: int
+    name: str
+
+
+class SuggestIndexStats(BaseModel):
+    """Schema for suggest index statistics"""
+    ready: bool
+    products: int
+    terms: int
+    bytes: int
+    max_bytes: int
+    truncated: bool
+
+
+class StockReservationCreate(BaseModel):
+    """Schema for reserving product stock"""
+    quantity: int = Field(..., gt=0, description="Quantity to reserve (must be > 0)")
+    reference: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=100,
+        description="Idempotency key (e.g. checkout ID); retries return the same reservation"
+    )
+    ttl_seconds: Optional[int] = Field(
+        None,
+        gt=0,
+        le=86400,
+        description="Release the stock after this many seconds unless committed"
+    )
+
+
+class StockReservationAction(BaseModel):
+    """Schema for releasing or committing a reservation"""
+    reservation_id: int = Field(..., gt=0, description="Reservation ID")
+
+
+class StockReservationResponse(BaseModel):
+    """Schema for stock reservation response"""
+    id: int
+    product_id: int
+    quantity: int
+    status: ReservationStatus
+    reference: Optional[str] = None
+    expires_at: datetime
+    created_at: datetime
+    updated_at: datetime
+    remaining_quantity: Optional[int] = Field(
+        None,
+        description="Product stock after this call, when it changed the stock"
+    )
+
+    model_config = {"from_attributes": True}
+
+
+class HotStockProductReport(BaseModel):
+    """Schema for the Redis/database comparison of one hot product"""
+    product_id: int
+    redis_quantity: Optional[int] = Field(None, description="Available quantity in Redis (None if not loaded)")
+    db_quantity: Optional[int] = Field(None, description="Quantity stored in the database (None if deleted)")
+    pending_delta: int = Field(..., description="Change not yet written to the database")
+    drift: Optional[int] = Field(
+        None,
+        description="redis_quantity - (db_quantity + pending_delta), 0 when in sync"
+    )
+
+
+class HotStockReport(BaseModel):
+    """Schema for the hot stock reconciliation report"""
+    enabled: bool
+    reconcile_interval: float
+    runs: int = Field(..., description="Reconciliation runs of this instance")
+    failures: int
+    products_reconciled: int
+    units_reconciled: int = Field(..., description="Absolute stock change written by this instance")
+    last_reconciled_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    products: List[HotStockProductReport]
+
+
+class BulkUpsertRowError(BaseModel):
+    """Schema for a rejected row of a bulk import"""
+    line: int = Field(..., description="Line of the row in the upload (1-based)")
+    errors: List[str]
+
+
+class BulkUpsertReport(BaseModel):
+    """Schema for the result of a bulk import"""
+    received: int
+    inserted: int
+    updated: int
+    failed: int
+    errors: List[BulkUpsertRowError]
+    errors_truncated: bool = Field(False, description="More rows failed than are listed in errors")
+
@@ -0,0 +1,123 @@
+"""
+Cache Warmer - Preloads hot products into the cache
+Runs in the background after startup so a deploy or Redis restart
+does not send every first read to the database
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import SessionLocal
+from app.repositories import ProductRepository
+from app.services.product_service import _load_products_data
+from app.utils.cache import CacheManager, cache_manager
+
+logger = logging.getLogger(__name__)
+
+
+def _load_recent_product_ids(limit: int) -> List[int]:
+    """
+    Load IDs of recently updated products
+    
+    Args:
+        limit: Maximum number of IDs
+        
+    Returns:
+        Product IDs, newest first
+    """
+    with SessionLocal() as db:
+        return ProductRepository(db).get_recently_updated_ids(limit)
+
+
+class CacheWarmer:
+    """
+    Background task that warms the product cache on startup
+    and periodically flushes product access counts to Redis
+    """
+
+    def __init__(self, cache: CacheManager):
+        """
+        Initialize cache warmer
+        
+        Args:
+            cache: Cache manager to warm
+        """
+        self.cache = cache
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """
+        Start warming and access count flushing in a background task
+        Startup is not delayed: requests are served while the cache warms
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the background task and flush the remaining access counts
+        """
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.cache.flush_access_counts()
+
+    async def _run(self):
+        """
+        Warm the cache once, then flush access counts periodically
+        """
+        if settings.CACHE_WARM_ENABLED:
+            try:
+                await self.warm()
+            except Exception as e:
+                logger.error(f"❌ Cache warming failed: {e}")
+
+        while True:
+            await asyncio.sleep(settings.HOT_PRODUCTS_FLUSH_INTERVAL)
+            await self.cache.flush_access_counts()
+
+    async def warm(self, top_n: Optional[int] = None) -> int:
+        """
+        Preload the most read products, topped up with recently updated ones
+        
+        Each batch costs one MGET; only products missing from Redis are
+        loaded with one IN query and written back in one pipeline.
+        
+        Args:
+            top_n: Number of products to warm (default from settings)
+        
+        Returns:
+            Number of products now cached
+        """
+        top_n = top_n or settings.CACHE_WARM_TOP_N
+        product_ids = await self.cache.get_hot_product_ids(top_n)
+
+        # Fresh ranking (new Redis, first deploy): fall back to recent products
+        if len(product_ids) < top_n:
+            recent_ids = await run_in_threadpool(_load_recent_product_ids, top_n)
+            product_ids = list(dict.fromkeys(product_ids + recent_ids))[:top_n]
+
+        warmed = 0
+        batch_size = settings.CACHE_WARM_BATCH_SIZE
+        for start in range(0, len(product_ids), batch_size):
+            batch = product_ids[start:start + batch_size]
+            found = await self.cache.get_or_load_products_many(
+                batch,
+                lambda missing_ids: run_in_threadpool(_load_products_data, missing_ids)
+            )
+            warmed += len(found)
+
+        logger.info(f"🔥 Cache warmed with {warmed} products")
+        return warmed
+
+
+# Global cache warmer instance
+cache_warmer = CacheWarmer(cache_manager)
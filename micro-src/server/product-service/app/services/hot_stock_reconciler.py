@@ -0,0 +1,103 @@
+"""
+Hot Stock Reconciler - Writes Redis stock counters of hot products to the database
+Reservations of hot products only touch Redis; this task applies their net
+change per product in one transaction per interval, so a flash sale costs
+one row update per product per interval instead of one per reservation
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.product_service import ProductService
+
+logger = logging.getLogger(__name__)
+
+
+class HotStockReconciler:
+    """
+    Background task that loads hot stock counters on startup
+    and periodically reconciles them to the database
+    """
+
+    def __init__(self):
+        """Initialize hot stock reconciler"""
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "runs": 0,
+            "failures": 0,
+            "products_reconciled": 0,
+            "units_reconciled": 0,
+            "last_reconciled_at": None,
+            "last_error": None,
+        }
+
+    async def start(self):
+        """
+        Load counters and start reconciling in a background task
+        """
+        if not settings.HOT_STOCK_ENABLED:
+            return
+
+        try:
+            with SessionLocal() as db:
+                loaded = await ProductService(db).load_hot_stock()
+            logger.info(f"🔥 Loaded hot stock counters for {loaded} products")
+        except Exception as e:
+            # Counters are also loaded on the first reservation
+            logger.error(f"❌ Failed to load hot stock counters: {e}")
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the background task and write what is still pending
+        """
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            await self.reconcile()
+
+    async def _run(self):
+        """
+        Reconcile periodically until cancelled
+        """
+        while True:
+            await asyncio.sleep(settings.HOT_STOCK_RECONCILE_INTERVAL)
+            await self.reconcile()
+
+    async def reconcile(self) -> int:
+        """
+        Write one batch of pending hot stock changes
+        
+        Returns:
+            Number of products updated
+        """
+        self.stats["runs"] += 1
+        try:
+            with SessionLocal() as db:
+                products, units = await ProductService(db).reconcile_hot_stock()
+        except Exception as e:
+            self.stats["failures"] += 1
+            self.stats["last_error"] = str(e)
+            logger.error(f"❌ Hot stock reconciliation failed: {e}")
+            return 0
+
+        self.stats["last_reconciled_at"] = datetime.utcnow()
+        if products:
+            self.stats["products_reconciled"] += products
+            self.stats["units_reconciled"] += units
+            logger.info(f"🔥 Reconciled {units} stock units of {products} hot products")
+        return products
+
+
+# Global hot stock reconciler instance
+hot_stock_reconciler = HotStockReconciler()
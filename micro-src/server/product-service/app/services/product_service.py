@@ -1,20 +1,208 @@
 """
 Product Service - Business Logic for Product Management
-Handles product CRUD operations with Redis caching
+Handles product CRUD operations with Redis caching and publishes change events to RabbitMQ
+Database calls run in the threadpool so cache and DB I/O never block the event loop
 """
 
+import csv
+import io
 import logging
-from typing import List, Optional
+import zlib
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.models import Product
-from app.schemas import ProductCreate, ProductUpdate
-from app.repositories import ProductRepository
+from app.database import SessionLocal
+from app.models import Product, StockReservation
+from app.schemas import (
+    ProductCreate,
+    ProductUpdate,
+    ProductUpsert,
+    ProductListFilters,
+    StockReservationCreate,
+)
+from app.repositories import ProductRepository, StockReservationRepository
+from app.config import settings
+from app.services.suggest_indexer import suggest_indexer
+from app.utils import hot_stock
+from app.utils.bulk_import import ParsedRow
 from app.utils.cache import cache_manager
+from app.utils.codecs import render_json
+from app.utils.metrics import HOT_STOCK_RECONCILED_UNITS
+from app.utils.pagination import Cursor
+from app.utils.rabbitmq import (
+    PRODUCT_CREATED,
+    PRODUCT_DELETED,
+    PRODUCT_UPDATED,
+    publish_product_event,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _product_to_dict(product: Product) -> dict:
+    """
+    Convert Product model to a cacheable dict of plain values
+    Values and key order match how ProductResponse renders them (price as
+    exact decimal string, timestamps in ISO format), so any cache codec can
+    store them as-is and the JSON-encoded dict is a valid response body
+    
+    Args:
+        product: Product model
+        
+    Returns:
+        Product data dict
+    """
+    return {
+        "name": product.name,
+        "description": product.description,
+        "price": str(product.price),
+        "quantity": product.quantity,
+        "id": product.id,
+        "created_at": product.created_at.isoformat(),
+        "updated_at": product.updated_at.isoformat(),
+    }
+
+
+def _search_fields(product: Product) -> Dict[int, dict]:
+    """
+    Get the suggest-indexed fields of a product for the invalidation bus
+    
+    Args:
+        product: Product model
+        
+    Returns:
+        Name and description keyed by product ID
+    """
+    return {product.id: {"name": product.name, "description": product.description}}
+
+
+def _load_product_data(product_id: int) -> Optional[dict]:
+    """
+    Load product data from the database for the cache
+    Uses its own session: the load may outlive the request that started it
+    
+    Args:
+        product_id: Product ID
+        
+    Returns:
+        Product data dict or None if not found
+    """
+    with SessionLocal() as db:
+        product = ProductRepository(db).get_by_id(product_id)
+        return _product_to_dict(product) if product else None
+
+
+def _load_products_data(product_ids: List[int]) -> Dict[int, dict]:
+    """
+    Load many products from the database for the cache with one IN query
+    Uses its own session, like _load_product_data
+    
+    Args:
+        product_ids: Product IDs
+        
+    Returns:
+        Dict of product ID to product data for existing products
+    """
+    with SessionLocal() as db:
+        products = ProductRepository(db).get_by_ids(product_ids)
+        return {product.id: _product_to_dict(product) for product in products}
+
+
+# Column order of CSV exports; the bulk import accepts the same file back
+EXPORT_CSV_COLUMNS = ("id", "name", "description", "price", "quantity", "created_at", "updated_at")
+
+
+def _render_export_batch(rows: List[dict], export_format: str, header: bool) -> bytes:
+    """
+    Render product dicts as NDJSON or CSV
+    
+    Args:
+        rows: Product data dicts
+        export_format: "ndjson" or "csv"
+        header: Start with the CSV header row
+        
+    Returns:
+        UTF-8 bytes of the rendered lines
+    """
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_COLUMNS, lineterminator="\n")
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+    return b"".join(render_json(row) + b"\n" for row in rows)
+
+
+def iter_product_export(export_format: str, compress: bool = False) -> Iterator[bytes]:
+    """
+    Stream the whole catalog as NDJSON or CSV
+    
+    A plain generator: StreamingResponse runs it in the threadpool, one
+    chunk of EXPORT_BATCH_SIZE rows at a time. It uses its own session
+    because the response outlives the request's session.
+    
+    Args:
+        export_format: "ndjson" or "csv"
+        compress: Gzip the stream
+        
+    Returns:
+        Iterator of body chunks
+    """
+    batch_size = settings.EXPORT_BATCH_SIZE
+    # wbits=31 writes a gzip header, so the output is a regular .gz file
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    header = True
+    exported = 0
+
+    def emit(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    with SessionLocal() as db:
+        batch = []
+        for row in ProductRepository(db).iter_all(batch_size):
+            batch.append(_product_to_dict(row))
+            if len(batch) >= batch_size:
+                yield emit(_render_export_batch(batch, export_format, header))
+                exported += len(batch)
+                header = False
+                batch = []
+
+        if batch or header:
+            yield emit(_render_export_batch(batch, export_format, header))
+            exported += len(batch)
+
+    if compressor:
+        yield compressor.flush()
+    logger.info(f"Exported {exported} products as {export_format}{' (gzip)' if compress else ''}")
+
+
+async def _publish_product_events(event: str, products: List[dict]):
+    """
+    Publish one change event per product
+    Publishing failures are logged and never fail the write
+    
+    Args:
+        event: Event name / routing key
+        products: Product data dicts
+    """
+    if not settings.PRODUCT_EVENTS_ENABLED or not products:
+        return
+
+    try:
+        for product in products:
+            await publish_product_event(event, product)
+        logger.info(f"✅ Published {len(products)} {event} event(s)")
+    except Exception as e:
+        logger.error(f"❌ Failed to publish {event} events: {e}")
+
+
 class ProductService:
     """
     Service class for product management logic
@@ -30,60 +218,151 @@ class ProductService:
         """
         self.db = db
         self.product_repository = ProductRepository(db)
+        self.reservation_repository = StockReservationRepository(db)
 
-    def get_all_products(self, skip: int = 0, limit: int = 100) -> List[Product]:
+    async def get_all_products(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        filters: Optional[ProductListFilters] = None
+    ) -> List[dict]:
         """
-        Get all products with pagination
+        Get products with optional filters and sorting,
+        with offset or keyset pagination
+        Pages are cached under the current catalog version
         
         Args:
-            skip: Number of products to skip
+            skip: Number of products to skip (ignored when a cursor is given)
             limit: Maximum number of products to return
+            cursor: Keyset cursor of the last product of the previous page
+                (only valid with the default sort by ID)
+            filters: Filters and sort order (default: all products by ID)
             
         Returns:
-            List of products
+            List of product data dicts
         """
-        return self.product_repository.get_all(skip=skip, limit=limit)
+        filters = filters or ProductListFilters()
+        after_id = cursor.id if cursor else None
+        if after_id is not None:
+            skip = 0
+
+        def load_page() -> List[dict]:
+            products = self.product_repository.get_filtered(
+                **filters.model_dump(),
+                skip=skip,
+                limit=limit,
+                after_id=after_id
+            )
+            return [_product_to_dict(product) for product in products]
 
-    def get_product_by_id(self, product_id: int) -> Optional[Product]:
+        return await cache_manager.get_or_load_listing(
+            {
+                "skip": skip,
+                "limit": limit,
+                "after": after_id,
+                **filters.model_dump(mode="json", exclude_none=True),
+            },
+            lambda: run_in_threadpool(load_page)
+        )
+
+    async def get_changed_products(
+        self,
+        updated_since: datetime,
+        cursor: Optional[Cursor] = None,
+        limit: int = 100
+    ) -> List[Product]:
         """
-        Get product by ID with Redis caching
+        Get products changed since a point in time, for incremental sync
+        Not cached: consumers poll it to see changes as soon as they commit
         
         Args:
-            product_id: Product ID
+            updated_since: Only products updated at or after this time
+            cursor: Keyset cursor of the last product already read
+            limit: Maximum number of products to return
             
         Returns:
-            Product if found, None otherwise
+            List of products ordered by (updated_at, id)
         """
-        # Try to get from cache first
-        cached_product = cache_manager.get_product(product_id)
-        if cached_product:
-            logger.info(f"Returning cached product for ID: {product_id}")
-            # Convert dict back to Product model
-            product = Product(**cached_product)
-            return product
+        after = (cursor.updated_at, cursor.id) if cursor and cursor.updated_at else None
+        return await run_in_threadpool(
+            self.product_repository.get_changed_since,
+            updated_since,
+            after,
+            limit
+        )
+
+    async def search_products(self, query: str, skip: int = 0, limit: int = 20) -> List[dict]:
+        """
+        Search products by relevance
+        Result pages are cached under the current catalog version, like listings
         
-        # If not in cache, get from database
-        product = self.product_repository.get_by_id(product_id)
+        Args:
+            query: Search text
+            skip: Number of results to skip
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of product data dicts, best matches first
+        """
+        query = " ".join(query.split())
+
+        def load_page() -> List[dict]:
+            products = self.product_repository.search(query, skip=skip, limit=limit)
+            return [_product_to_dict(product) for product in products]
+
+        return await cache_manager.get_or_load_listing(
+            {"search": query.lower(), "skip": skip, "limit": limit},
+            lambda: run_in_threadpool(load_page)
+        )
+
+    async def get_product_json(self, product_id: int) -> Optional[Tuple[bytes, str]]:
+        """
+        Get product by ID as a pre-rendered JSON document
+        Cache hits are returned without decoding or re-validating the product
         
-        # Cache the result if found
-        if product:
-            product_dict = {
-                "id": product.id,
-                "name": product.name,
-                "description": product.description,
-                "price": float(product.price),
-                "quantity": product.quantity,
-                "created_at": product.created_at,
-                "updated_at": product.updated_at,
-            }
-            cache_manager.set_product(product_id, product_dict)
-            logger.info(f"Cached product ID: {product_id} from database")
+        Args:
+            product_id: Product ID
+            
+        Returns:
+            Tuple of (ProductResponse JSON bytes, updated_at ISO string)
+            if found, None otherwise
+        """
+        cache_manager.record_access([product_id])
+        return await cache_manager.get_or_load_product_json(
+            product_id,
+            lambda: run_in_threadpool(_load_product_data, product_id)
+        )
+
+    async def get_products_by_ids(self, product_ids: List[int]) -> List[dict]:
+        """
+        Get many products by ID
+        Cache hits come from one MGET, misses from one IN query,
+        and the misses are written back to the cache in one pipeline
         
-        return product
+        Args:
+            product_ids: Product IDs (duplicates are ignored)
+            
+        Returns:
+            List of product data dicts in request order, missing products omitted
+        """
+        unique_ids = list(dict.fromkeys(product_ids))
+        cache_manager.record_access(unique_ids)
+
+        def load_missing(missing_ids: List[int]) -> Dict[int, dict]:
+            products = self.product_repository.get_by_ids(missing_ids)
+            return {product.id: _product_to_dict(product) for product in products}
+
+        found = await cache_manager.get_or_load_products_many(
+            unique_ids,
+            lambda missing_ids: run_in_threadpool(load_missing, missing_ids)
+        )
+        return [found[product_id] for product_id in unique_ids if product_id in found]
 
-    def create_product(self, product_data: ProductCreate) -> Product:
+    async def create_product(self, product_data: ProductCreate) -> Product:
         """
-        Create new product
+        Create new product and publish product.created
+        In write-through mode the new product is cached right away
         
         Args:
             product_data: Product creation data
@@ -92,15 +371,178 @@ class ProductService:
             Created product
         """
         product_dict = product_data.model_dump()
-        return self.product_repository.create(product_dict)
+        product = await run_in_threadpool(self.product_repository.create, product_dict)
+        if settings.CACHE_WRITE_MODE == "write_through":
+            await cache_manager.set_product(product.id, _product_to_dict(product))
+        suggest_indexer.index_product(product.id, product.name, product.description)
+        await cache_manager.bump_catalog_version()
+        # Lets other replicas add the new product to their suggest index
+        await cache_manager.publish_invalidation([product.id], search_fields=_search_fields(product))
+        await _publish_product_events(PRODUCT_CREATED, [_product_to_dict(product)])
+        return product
+
+    def supports_bulk_upsert(self) -> bool:
+        """
+        Check whether the database supports bulk imports
+        
+        Returns:
+            True if bulk_upsert_products can write to this database
+        """
+        return self.product_repository.supports_bulk_upsert()
+
+    async def bulk_upsert_products(self, rows: AsyncIterator[ParsedRow]) -> dict:
+        """
+        Create or update products from a streamed upload
+        
+        Rows are validated and written in chunks of BULK_UPSERT_CHUNK_SIZE,
+        one transaction per chunk, so memory stays flat for uploads of any
+        size. Invalid rows are reported and skipped; a chunk the database
+        rejects is split in halves until the offending rows are isolated, so
+        the valid rows are still written and only the bad ones are reported
+        with the database error. Caches are invalidated once per
+        chunk and listings once per upload.
+        
+        Args:
+            rows: Parsed upload rows as (line, row, error) tuples
+            
+        Returns:
+            Import report (see BulkUpsertReport)
+        """
+        report = {
+            "received": 0,
+            "inserted": 0,
+            "updated": 0,
+            "failed": 0,
+            "errors": [],
+            "errors_truncated": False,
+        }
+        chunk = []
+
+        try:
+            async for line, row, error in rows:
+                report["received"] += 1
+                if error:
+                    self._report_row_error(report, line, [error])
+                    continue
+
+                try:
+                    # Only fields present in the row: a missing description is kept, not cleared
+                    chunk.append((line, ProductUpsert.model_validate(row).model_dump(exclude_unset=True)))
+                except ValidationError as e:
+                    self._report_row_error(report, line, [
+                        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+                        for err in e.errors()
+                    ])
+                    continue
+
+                if len(chunk) >= settings.BULK_UPSERT_CHUNK_SIZE:
+                    await self._upsert_chunk(chunk, report)
+                    chunk = []
+
+            if chunk:
+                await self._upsert_chunk(chunk, report)
+        finally:
+            # Also runs when the upload is cut off, for the chunks already written
+            if report["inserted"] or report["updated"]:
+                await cache_manager.bump_catalog_version()
+
+        logger.info(
+            f"Bulk upsert: {report['received']} rows, {report['inserted']} created, "
+            f"{report['updated']} updated, {report['failed']} failed"
+        )
+        return report
+
+    async def _upsert_chunk(self, chunk: List[tuple], report: dict):
+        """
+        Write one chunk of validated rows and invalidate their caches
+        
+        Args:
+            chunk: List of (line, product dict) tuples
+            report: Import report to update
+        """
+        created_ids, updated_ids = await self._write_rows(chunk, report)
+        if not created_ids and not updated_ids:
+            return
+
+        report["inserted"] += len(created_ids)
+        report["updated"] += len(updated_ids)
+
+        # Created IDs are broadcast too, so other replicas index them for suggestions
+        changed_ids = updated_ids + created_ids
+        await cache_manager.invalidate_products(changed_ids)
+        suggest_indexer.reindex_products(changed_ids)
+
+        hot_ids = [product_id for product_id in changed_ids if hot_stock.is_hot(product_id)]
+        if hot_ids:
+            await self._reset_hot_stock(hot_ids)
+
+        if settings.PRODUCT_EVENTS_ENABLED:
+            # Events carry the stored rows, read back with one IN query per chunk
+            products = await run_in_threadpool(_load_products_data, changed_ids)
+            created = set(created_ids)
+            await _publish_product_events(
+                PRODUCT_CREATED, [data for product_id, data in products.items() if product_id in created]
+            )
+            await _publish_product_events(
+                PRODUCT_UPDATED, [data for product_id, data in products.items() if product_id not in created]
+            )
+
+    async def _write_rows(self, rows: List[tuple], report: dict) -> Tuple[List[int], List[int]]:
+        """
+        Upsert rows in one transaction, bisecting on a database error
+        
+        A rejected batch is retried as two halves, recursively, so one bad
+        row costs O(log n) extra transactions and the rest are still written.
+        A single row that still fails is reported with the database error.
+        
+        Args:
+            rows: List of (line, product dict) tuples
+            report: Import report to update
+            
+        Returns:
+            Tuple of (created IDs, updated IDs)
+        """
+        try:
+            return await run_in_threadpool(
+                self.product_repository.bulk_upsert,
+                [product for _, product in rows]
+            )
+        except SQLAlchemyError as e:
+            if len(rows) == 1:
+                reason = str(getattr(e, "orig", None) or e).strip().splitlines()[0]
+                logger.warning(f"Bulk upsert rejected line {rows[0][0]}: {reason}")
+                self._report_row_error(report, rows[0][0], [f"Không thể lưu sản phẩm vào cơ sở dữ liệu: {reason}"])
+                return [], []
+            logger.warning(f"Bulk upsert of {len(rows)} rows failed, retrying in halves: {e}")
 
-    def update_product(
+        middle = len(rows) // 2
+        first_created, first_updated = await self._write_rows(rows[:middle], report)
+        second_created, second_updated = await self._write_rows(rows[middle:], report)
+        return first_created + second_created, first_updated + second_updated
+
+    @staticmethod
+    def _report_row_error(report: dict, line: int, errors: List[str]):
+        """
+        Count a rejected row and list it while the report has room
+        
+        Args:
+            report: Import report to update
+            line: Line of the row in the upload
+            errors: Error messages
+        """
+        report["failed"] += 1
+        if len(report["errors"]) < settings.BULK_UPSERT_MAX_ERRORS:
+            report["errors"].append({"line": line, "errors": errors})
+        else:
+            report["errors_truncated"] = True
+
+    async def update_product(
         self,
         product_id: int,
         product_data: ProductUpdate
     ) -> Optional[Product]:
         """
-        Update product and invalidate cache
+        Update product, refresh or invalidate its cache entry and publish product.updated
         
         Args:
             product_id: Product ID
@@ -111,18 +553,349 @@ class ProductService:
         """
         # Only include fields that were actually provided
         update_dict = product_data.model_dump(exclude_unset=True)
-        product = self.product_repository.update(product_id, update_dict)
+        product = await run_in_threadpool(self.product_repository.update, product_id, update_dict)
         
-        # Invalidate cache after update
         if product:
-            cache_manager.invalidate_product(product_id)
-            logger.info(f"Invalidated cache for updated product ID: {product_id}")
+            # Write-through keeps the next read a cache hit
+            text_changed = "name" in update_dict or "description" in update_dict
+            search_fields = _search_fields(product) if text_changed else None
+            if settings.CACHE_WRITE_MODE == "write_through":
+                await cache_manager.write_through_product(
+                    product_id, _product_to_dict(product), text_changed, search_fields
+                )
+            else:
+                await cache_manager.invalidate_product(product_id, text_changed, search_fields)
+            suggest_indexer.index_product(product.id, product.name, product.description)
+            await cache_manager.bump_catalog_version()
+            if "quantity" in update_dict and hot_stock.is_hot(product_id):
+                await self._reset_hot_stock([product_id])
+            logger.info(f"Updated cache ({settings.CACHE_WRITE_MODE}) for product ID: {product_id}")
+            await _publish_product_events(PRODUCT_UPDATED, [_product_to_dict(product)])
         
         return product
 
-    def delete_product(self, product_id: int) -> bool:
+    async def reserve_stock(
+        self,
+        product_id: int,
+        reservation_data: StockReservationCreate
+    ) -> Tuple[Optional[StockReservation], Optional[int]]:
+        """
+        Reserve product stock with one conditional UPDATE
+        
+        Args:
+            product_id: Product ID
+            reservation_data: Quantity, optional idempotency reference and TTL
+            
+        Returns:
+            (reservation, remaining stock) on success; (existing reservation,
+            None) for a repeated reference; (None, available stock) when the
+            stock is insufficient; (None, None) when the product does not exist
+        """
+        ttl = reservation_data.ttl_seconds or settings.RESERVATION_TTL
+        expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+        if hot_stock.is_hot(product_id):
+            return await self._reserve_hot_stock(product_id, reservation_data, expires_at)
+
+        reservation, product = await run_in_threadpool(
+            self.reservation_repository.reserve,
+            product_id,
+            reservation_data.quantity,
+            expires_at,
+            reservation_data.reference
+        )
+
+        if reservation is None:
+            # Failure path only: tell "not found" from "not enough stock"
+            existing = await run_in_threadpool(self.product_repository.get_by_id, product_id)
+            return None, existing.quantity if existing else None
+
+        if product is None:
+            return reservation, None
+
+        await self._apply_stock_change(product)
+        logger.info(
+            f"Reserved {reservation.quantity} of product ID {product_id} "
+            f"(reservation {reservation.id}, {product.quantity} left)"
+        )
+        return reservation, product.quantity
+
+    async def release_reservation(
+        self,
+        product_id: int,
+        reservation_id: int
+    ) -> Tuple[Optional[StockReservation], Optional[int]]:
+        """
+        Release an open reservation and give its stock back
+        
+        Args:
+            product_id: Product ID
+            reservation_id: Reservation ID
+            
+        Returns:
+            (released reservation, remaining stock), or (None, None) if no
+            open reservation of this product matched
+        """
+        if hot_stock.is_hot(product_id):
+            return await self._release_hot_stock(product_id, reservation_id)
+
+        reservation, product = await run_in_threadpool(
+            self.reservation_repository.release, product_id, reservation_id
+        )
+        if reservation is None:
+            return None, None
+
+        if product is None:
+            # Product deleted meanwhile, nothing to give back
+            return reservation, None
+
+        await self._apply_stock_change(product)
+        logger.info(f"Released reservation {reservation_id} of product ID {product_id}")
+        return reservation, product.quantity
+
+    async def _reserve_hot_stock(
+        self,
+        product_id: int,
+        reservation_data: StockReservationCreate,
+        expires_at: datetime
+    ) -> Tuple[Optional[StockReservation], Optional[int]]:
+        """
+        Reserve stock of a hot product from its Redis counter
+        
+        The product row is not locked or updated: the Lua script decides,
+        only the reservation row is inserted, and the reconciler writes the
+        net change to the database in batches. The cached product and
+        product.updated events follow at reconciliation.
+        
+        Args:
+            product_id: Product ID
+            reservation_data: Quantity, optional idempotency reference and TTL
+            expires_at: When the reservation is released if not committed
+            
+        Returns:
+            Same as reserve_stock
+        """
+        quantity = reservation_data.quantity
+        reference = reservation_data.reference
+        if reference is not None:
+            existing = await run_in_threadpool(self.reservation_repository.get_by_reference, reference)
+            if existing is not None:
+                return existing, None
+
+        reserved, remaining = await hot_stock.reserve(product_id, quantity)
+        if reserved is None:
+            # First reservation since startup or a Redis restart
+            async with hot_stock.exclusive():
+                product = await run_in_threadpool(self.product_repository.get_by_id, product_id)
+                if product is None:
+                    return None, None
+                await hot_stock.load(product_id, product.quantity)
+            reserved, remaining = await hot_stock.reserve(product_id, quantity)
+        if not reserved:
+            return None, remaining
+
+        try:
+            reservation, created = await run_in_threadpool(
+                self.reservation_repository.add_reservation, product_id, quantity, expires_at, reference
+            )
+        except Exception:
+            await hot_stock.restock(product_id, quantity)
+            raise
+
+        if not created:
+            # Same reference reserved concurrently, give our units back
+            await hot_stock.restock(product_id, quantity)
+            return reservation, None
+
+        logger.info(
+            f"Reserved {quantity} of hot product ID {product_id} "
+            f"(reservation {reservation.id}, {remaining} left)"
+        )
+        return reservation, remaining
+
+    async def _release_hot_stock(
+        self,
+        product_id: int,
+        reservation_id: int
+    ) -> Tuple[Optional[StockReservation], Optional[int]]:
+        """
+        Release a reservation of a hot product into its Redis counter
+        
+        Args:
+            product_id: Product ID
+            reservation_id: Reservation ID
+            
+        Returns:
+            Same as release_reservation
+        """
+        reservation, _ = await run_in_threadpool(
+            self.reservation_repository.release, product_id, reservation_id, False
+        )
+        if reservation is None:
+            return None, None
+
+        try:
+            remaining = await hot_stock.restock(product_id, reservation.quantity)
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis error releasing hot reservation {reservation_id}: {e}")
+            remaining = None
+
+        if remaining is None:
+            # No counter to give the stock back to: write it to the database
+            products = await run_in_threadpool(
+                self.reservation_repository.apply_stock_deltas, {product_id: reservation.quantity}
+            )
+            for product in products:
+                await self._apply_stock_change(product)
+                remaining = product.quantity
+
+        logger.info(f"Released reservation {reservation_id} of hot product ID {product_id}")
+        return reservation, remaining
+
+    async def _reset_hot_stock(self, product_ids: List[int]):
+        """
+        Set hot product counters after their quantity was written directly
+        
+        Quantities are read under the hot stock lock: a reconcile that already
+        took pending changes has written them to the row by then, and changes
+        still pending are kept on top of the stored quantity.
+        
+        Args:
+            product_ids: Hot product IDs whose quantity was written
+        """
+        try:
+            async with hot_stock.exclusive():
+                products = await run_in_threadpool(_load_products_data, product_ids)
+                for product_id, data in products.items():
+                    await hot_stock.load(product_id, data["quantity"], overwrite=True)
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis error resetting hot stock of product IDs {product_ids}: {e}")
+
+    async def load_hot_stock(self) -> int:
+        """
+        Initialize missing Redis counters of the configured hot products
+        
+        Returns:
+            Number of counters checked
+        """
+        product_ids = settings.HOT_STOCK_PRODUCT_IDS
+        if not settings.HOT_STOCK_ENABLED or not product_ids:
+            return 0
+
+        async with hot_stock.exclusive():
+            products = await run_in_threadpool(_load_products_data, product_ids)
+            for product_id, data in products.items():
+                await hot_stock.load(product_id, data["quantity"])
+        return len(products)
+
+    async def reconcile_hot_stock(self) -> Tuple[int, int]:
+        """
+        Write pending hot stock changes to the database in one transaction
+        Safe to run in every replica: each change is taken from Redis once,
+        under the lock that keeps counter loads from reading the row meanwhile
+        
+        Returns:
+            Tuple of (products updated, absolute units written)
+        """
+        async with hot_stock.exclusive():
+            deltas = await hot_stock.take_pending()
+            if not deltas:
+                return 0, 0
+
+            try:
+                products = await run_in_threadpool(self.reservation_repository.apply_stock_deltas, deltas)
+            except Exception:
+                await hot_stock.put_back_pending(deltas)
+                raise
+
+        for product in products:
+            await self._apply_stock_change(product)
+
+        units = sum(abs(delta) for delta in deltas.values())
+        HOT_STOCK_RECONCILED_UNITS.inc(units)
+        return len(products), units
+
+    async def get_hot_stock_report(self) -> List[dict]:
+        """
+        Compare Redis counters of hot products with the database
+        
+        A counter is in sync when it equals the database quantity plus the
+        changes still pending reconciliation; a batch being written at the
+        moment of the report can show as a transient drift.
+        
+        Returns:
+            One report dict per configured hot product
+        """
+        product_ids = settings.HOT_STOCK_PRODUCT_IDS
+        counters = await hot_stock.snapshot(product_ids)
+        products = await run_in_threadpool(_load_products_data, product_ids)
+
+        report = []
+        for product_id in product_ids:
+            redis_quantity, pending_delta = counters.get(product_id, (None, 0))
+            db_quantity = products[product_id]["quantity"] if product_id in products else None
+            drift = None
+            if redis_quantity is not None and db_quantity is not None:
+                drift = redis_quantity - (db_quantity + pending_delta)
+            report.append({
+                "product_id": product_id,
+                "redis_quantity": redis_quantity,
+                "db_quantity": db_quantity,
+                "pending_delta": pending_delta,
+                "drift": drift,
+            })
+        return report
+
+    async def commit_reservation(self, product_id: int, reservation_id: int) -> Optional[StockReservation]:
+        """
+        Make an open reservation final (the order went through)
+        The stock was already taken when reserving, so caches are untouched
+        
+        Args:
+            product_id: Product ID
+            reservation_id: Reservation ID
+            
+        Returns:
+            Committed reservation (also when it was committed before), or None
+            if no open or committed reservation of this product matched
+        """
+        return await run_in_threadpool(self.reservation_repository.commit, product_id, reservation_id)
+
+    async def get_reservation(self, reservation_id: int) -> Optional[StockReservation]:
+        """
+        Get reservation by ID
+        
+        Args:
+            reservation_id: Reservation ID
+            
+        Returns:
+            Reservation if found, None otherwise
+        """
+        return await run_in_threadpool(self.reservation_repository.get_by_id, reservation_id)
+
+    async def _apply_stock_change(self, product):
+        """
+        Propagate a stock change returned by a conditional UPDATE
+        
+        The UPDATE ... RETURNING row is the committed state, so in
+        write-through mode it replaces the cache entry without another read.
+        Listing pages are not invalidated per reservation: under checkout
+        load that would disable the listing cache, so listed quantities may
+        lag by up to LISTING_CACHE_TTL. The invalidation is flagged as
+        stock-only, so other replicas do not re-index the product for suggestions.
+        
+        Args:
+            product: Product row returned by the stock update
+        """
+        product_data = _product_to_dict(product)
+        if settings.CACHE_WRITE_MODE == "write_through":
+            await cache_manager.write_through_product(product.id, product_data, text_changed=False)
+        else:
+            await cache_manager.invalidate_product(product.id, text_changed=False)
+        await _publish_product_events(PRODUCT_UPDATED, [product_data])
+
+    async def delete_product(self, product_id: int) -> bool:
         """
-        Delete product and invalidate cache
+        Delete product, invalidate cache and publish product.deleted
         
         Args:
             product_id: Product ID
@@ -130,11 +903,17 @@ class ProductService:
         Returns:
             True if deleted, False if not found
         """
-        success = self.product_repository.delete(product_id)
+        success = await run_in_threadpool(self.product_repository.delete, product_id)
         
         # Invalidate cache after deletion
         if success:
-            cache_manager.invalidate_product(product_id)
+            await cache_manager.invalidate_product(product_id, search_fields={product_id: None})
+            await cache_manager.remove_hot_products([product_id])
+            if hot_stock.is_hot(product_id):
+                await hot_stock.remove([product_id])
+            suggest_indexer.remove_product(product_id)
+            await cache_manager.bump_catalog_version()
             logger.info(f"Invalidated cache for deleted product ID: {product_id}")
+            await _publish_product_events(PRODUCT_DELETED, [{"id": product_id}])
         
         return success
@@ -0,0 +1,100 @@
+"""
+Reservation Sweeper - Gives back stock of reservations that were never committed
+Runs in the background so a crashed or abandoned checkout cannot hold stock forever
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import SessionLocal
+from app.repositories import StockReservationRepository
+from app.services.product_service import ProductService
+
+logger = logging.getLogger(__name__)
+
+
+def _load_expired_reservations(limit: int) -> List[Tuple[int, int]]:
+    """
+    Load open reservations past their expiry
+    
+    Args:
+        limit: Maximum number of reservations
+        
+    Returns:
+        List of (reservation ID, product ID)
+    """
+    with SessionLocal() as db:
+        return StockReservationRepository(db).get_expired(datetime.utcnow(), limit)
+
+
+class ReservationSweeper:
+    """
+    Background task that periodically releases expired reservations
+    Safe to run in every replica: a reservation is released at most once
+    """
+
+    def __init__(self):
+        """Initialize reservation sweeper"""
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """
+        Start sweeping in a background task
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the background task
+        """
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        """
+        Sweep periodically until cancelled
+        """
+        while True:
+            await asyncio.sleep(settings.RESERVATION_SWEEP_INTERVAL)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"❌ Reservation sweep failed: {e}")
+
+    async def sweep(self) -> int:
+        """
+        Release one batch of expired reservations
+        
+        Returns:
+            Number of reservations released by this call
+        """
+        expired = await run_in_threadpool(
+            _load_expired_reservations, settings.RESERVATION_SWEEP_BATCH_SIZE
+        )
+        if not expired:
+            return 0
+
+        released = 0
+        with SessionLocal() as db:
+            product_service = ProductService(db)
+            for reservation_id, product_id in expired:
+                reservation, _ = await product_service.release_reservation(product_id, reservation_id)
+                if reservation is not None:
+                    released += 1
+
+        logger.info(f"⏰ Released {released} expired stock reservations")
+        return released
+
+
+# Global reservation sweeper instance
+reservation_sweeper = ReservationSweeper()
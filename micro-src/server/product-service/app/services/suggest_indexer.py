@@ -0,0 +1,219 @@
+"""
+Suggest Indexer - Keeps the in-process suggest index in sync with the database
+Builds the index from a streaming scan on startup and applies changes
+made by this process or announced by other replicas on the invalidation bus
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import SessionLocal
+from app.repositories import ProductRepository
+from app.utils.search_index import SuggestIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _build_from_database(index: SuggestIndex) -> dict:
+    """
+    Build the index from a streaming scan of the products table
+    
+    Args:
+        index: Index to rebuild
+        
+    Returns:
+        Index statistics
+    """
+    with SessionLocal() as db:
+        rows = ProductRepository(db).iter_search_fields(settings.SUGGEST_INDEX_BUILD_BATCH_SIZE)
+        return index.build(rows)
+
+
+def _refresh_from_database(index: SuggestIndex, product_ids: List[int]):
+    """
+    Re-index products from the database, removing those that no longer exist
+    
+    Args:
+        index: Index to update
+        product_ids: Product IDs to refresh
+    """
+    with SessionLocal() as db:
+        products = {product.id: product for product in ProductRepository(db).get_by_ids(product_ids)}
+
+    for product_id in product_ids:
+        product = products.get(product_id)
+        if product is None:
+            index.remove(product_id)
+        else:
+            index.upsert(product.id, product.name, product.description)
+
+
+class SuggestIndexer:
+    """
+    Owns the suggest index of this worker
+    """
+
+    def __init__(self, index: SuggestIndex):
+        """
+        Initialize indexer
+        
+        Args:
+            index: Index kept in sync
+        """
+        self.index = index
+        self._build_task: Optional[asyncio.Task] = None
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        # Products changed while a build was scanning, re-indexed after the swap
+        self._changed_during_build: Optional[Set[int]] = None
+
+    async def start(self):
+        """
+        Build the index in a background task
+        Suggestions are unavailable until the first build completes
+        """
+        if not settings.SUGGEST_INDEX_ENABLED:
+            logger.info("Suggest index disabled")
+            return
+
+        if self._build_task is None or self._build_task.done():
+            self._build_task = asyncio.create_task(self.rebuild())
+            self._build_task.add_done_callback(self._task_done)
+
+    async def stop(self):
+        """
+        Cancel pending build and refresh tasks
+        """
+        tasks = [task for task in (self._build_task, *self._refresh_tasks) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._build_task = None
+
+    async def rebuild(self) -> dict:
+        """
+        Rebuild the whole index from the database
+        The old index keeps serving suggestions until the new one is swapped in
+        
+        Returns:
+            Index statistics
+        """
+        self._changed_during_build = set()
+        try:
+            stats = await run_in_threadpool(_build_from_database, self.index)
+        finally:
+            changed, self._changed_during_build = self._changed_during_build, None
+
+        # The scan may have missed writes that happened while it was running
+        if changed:
+            await run_in_threadpool(_refresh_from_database, self.index, list(changed))
+            stats = self.index.stats()
+
+        if stats["truncated"]:
+            logger.warning(
+                f"⚠️ Suggest index is over SUGGEST_INDEX_MAX_BYTES, "
+                f"only {stats['products']} products indexed"
+            )
+        logger.info(f"✅ Suggest index built: {stats['products']} products, {stats['terms']} terms")
+        return stats
+
+    def index_product(self, product_id: int, name: str, description: Optional[str]):
+        """
+        Add or replace a product written by this process or announced on the bus
+        
+        Args:
+            product_id: Product ID
+            name: Product name
+            description: Product description
+        """
+        if settings.SUGGEST_INDEX_ENABLED:
+            self._track_change([product_id])
+            self.index.upsert(product_id, name, description)
+
+    def remove_product(self, product_id: int):
+        """
+        Remove a product deleted by this process or announced on the bus
+        
+        Args:
+            product_id: Product ID
+        """
+        if settings.SUGGEST_INDEX_ENABLED:
+            self._track_change([product_id])
+            self.index.remove(product_id)
+
+    def on_invalidation(
+        self,
+        product_ids: Optional[List[int]],
+        text_changed: bool = True,
+        search_fields: Optional[Dict[int, Optional[dict]]] = None
+    ):
+        """
+        Invalidation bus listener: re-index products changed by other replicas
+        Products whose name and description came with the message are updated
+        in place; only the others (e.g. bulk imports) are read back
+        
+        Args:
+            product_ids: Changed product IDs, None when the whole cache was cleared
+            text_changed: False for stock-only writes, which leave the index as is
+            search_fields: Name and description per product ID, None for
+                deleted products
+        """
+        # Clearing the cache or selling stock does not change the indexed text
+        if not product_ids or not text_changed:
+            return
+
+        search_fields = search_fields or {}
+        missing = []
+        for product_id in product_ids:
+            if product_id not in search_fields:
+                missing.append(product_id)
+            elif search_fields[product_id] is None:
+                self.remove_product(product_id)
+            else:
+                fields = search_fields[product_id]
+                self.index_product(product_id, fields.get("name", ""), fields.get("description"))
+        self.reindex_products(missing)
+
+    def reindex_products(self, product_ids: List[int]):
+        """
+        Re-index products from the database in the background
+        Used for batches, where reading them back once beats per-product updates
+        
+        Args:
+            product_ids: Changed product IDs
+        """
+        if not settings.SUGGEST_INDEX_ENABLED or not product_ids:
+            return
+
+        self._track_change(product_ids)
+        task = asyncio.create_task(run_in_threadpool(_refresh_from_database, self.index, product_ids))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _track_change(self, product_ids: List[int]):
+        """
+        Remember changed products while a build is running
+        
+        Args:
+            product_ids: Changed product IDs
+        """
+        if self._changed_during_build is not None:
+            self._changed_during_build.update(product_ids)
+
+    def _task_done(self, task: asyncio.Task):
+        """
+        Forget a finished background task and log its failure
+        
+        Args:
+            task: Finished build or refresh task
+        """
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"❌ Suggest index update failed: {task.exception()}")
+
+
+# Global suggest index and indexer of this worker
+suggest_index = SuggestIndex(max_bytes=settings.SUGGEST_INDEX_MAX_BYTES)
+suggest_indexer = SuggestIndexer(suggest_index)
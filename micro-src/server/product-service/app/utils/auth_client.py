@@ -7,6 +7,9 @@ import httpx
 from typing import Optional
 
 from app.config import settings
+from app.utils.http_client import http_client
+from app.utils.jwt_verifier import VerifierUnavailableError, verify_token
+from app.utils.token_cache import token_validation_cache
 
 
 class AuthClient:
@@ -22,6 +25,9 @@ class AuthClient:
     async def validate_token(self, token: str) -> Optional[str]:
         """
         Validate JWT token by calling User Service
+        With AUTH_MODE=local the token is verified here and User Service is
+        only called for tokens without a user ID claim; User Service answers
+        are reused from the token cache
         
         Args:
             token: JWT token to validate
@@ -29,25 +35,47 @@ class AuthClient:
         Returns:
             Username if token is valid, None otherwise
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.user_service_url}/validate-token",
-                    json={"token": token},
-                    timeout=5.0
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("valid"):
-                        return data.get("username")
-                
+        if settings.AUTH_MODE == "local":
+            try:
+                result = await verify_token(token)
+            except VerifierUnavailableError as e:
+                print(f"Error validating token locally: {e}")
                 return None
-                
+            if result is not None:
+                return result.get("username") if result.get("valid") else None
+
+        try:
+            result = await token_validation_cache.get_or_validate(token, self._validate_remote)
         except (httpx.HTTPError, httpx.TimeoutException) as e:
             print(f"Error validating token with User Service: {e}")
             return None
 
+        if result is not None and result.get("valid"):
+            return result.get("username")
+        return None
+
+    async def _validate_remote(self, token: str) -> Optional[dict]:
+        """
+        Call User Service /validate-token
+        
+        Args:
+            token: JWT token to validate
+            
+        Returns:
+            User Service response, or None if it answered with an error
+            status (not cached)
+        """
+        # Shared pooled client: connections to User Service are reused
+        response = await http_client.client.post(
+            f"{self.user_service_url}/validate-token",
+            json={"token": token},
+            timeout=http_client.timeout(settings.USER_SERVICE_TIMEOUT)
+        )
+        
+        if response.status_code == 200:
+            return response.json()
+        return None
+
     def validate_token_sync(self, token: str) -> Optional[str]:
         """
         Validate JWT token by calling User Service (synchronous version)
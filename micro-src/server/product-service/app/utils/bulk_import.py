@@ -0,0 +1,247 @@
+"""
+Bulk Import - Streaming parser for product uploads
+Reads NDJSON or CSV from the request body chunk by chunk, so an upload of
+any size is never held in memory; malformed lines become row errors instead
+of failing the whole import
+"""
+
+import csv
+import json
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+# Content types accepted by the bulk import endpoint
+UPLOAD_FORMATS = {
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json": "ndjson",
+    "text/csv": "csv",
+}
+
+# Longer lines are reported as errors instead of being buffered
+MAX_LINE_BYTES = 64 * 1024
+
+REQUIRED_CSV_COLUMNS = ("name", "price", "quantity")
+OPTIONAL_CSV_COLUMNS = ("id", "description")
+
+# (line number, parsed row or None, error message or None)
+ParsedRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+class BulkImportError(ValueError):
+    """Raised when an upload cannot be imported at all (e.g. invalid CSV header)"""
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Optional[bytes]]:
+    """
+    Split a byte stream into lines
+    
+    Args:
+        chunks: Request body chunks
+    
+    Returns:
+        Async iterator of raw lines, None for a line longer than MAX_LINE_BYTES
+    """
+    buffer = bytearray()
+    skipping = False
+
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            line = bytes(buffer[start:end + 1])
+            start = end + 1
+            if skipping:
+                # Tail of a line already reported as too long
+                skipping = False
+                continue
+            yield None if len(line) > MAX_LINE_BYTES else line
+        del buffer[:start]
+
+        if len(buffer) > MAX_LINE_BYTES:
+            if not skipping:
+                yield None
+                skipping = True
+            buffer.clear()
+
+    if buffer and not skipping:
+        yield bytes(buffer)
+
+
+def _decode(line: bytes, line_number: int) -> str:
+    """Decode one line as UTF-8, dropping a leading byte order mark"""
+    text = line.decode("utf-8")
+    if line_number == 1:
+        text = text.lstrip("\ufeff")
+    return text
+
+
+async def _iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """
+    Parse one JSON object per line, blank lines are skipped
+    
+    Args:
+        chunks: Request body chunks
+    
+    Returns:
+        Async iterator of parsed rows
+    """
+    line_number = 0
+    async for line in _iter_lines(chunks):
+        line_number += 1
+        if line is None:
+            yield line_number, None, "Dòng quá dài"
+            continue
+
+        try:
+            text = _decode(line, line_number).strip()
+        except UnicodeDecodeError:
+            yield line_number, None, "Dòng không phải UTF-8 hợp lệ"
+            continue
+        if not text:
+            continue
+
+        try:
+            row = json.loads(text)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"JSON không hợp lệ: {e.msg}"
+            continue
+
+        if isinstance(row, dict):
+            yield line_number, row, None
+        else:
+            yield line_number, None, "Mỗi dòng phải là một đối tượng JSON"
+
+
+def _parse_csv_header(text: str) -> List[str]:
+    """
+    Parse and check the CSV header row
+    
+    Args:
+        text: Header line
+    
+    Returns:
+        Lowercase column names
+    
+    Raises:
+        BulkImportError: If a required column is missing
+    """
+    columns = [column.strip().lower() for column in next(csv.reader([text]), [])]
+    missing = [column for column in REQUIRED_CSV_COLUMNS if column not in columns]
+    if missing:
+        raise BulkImportError(f"Tiêu đề CSV thiếu cột: {', '.join(missing)}")
+    return columns
+
+
+def _csv_record_to_row(columns: List[str], text: str) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Map one CSV record to a row dict, empty cells are left out
+    
+    Args:
+        columns: Column names from the header
+        text: Complete record, possibly spanning several lines
+    
+    Returns:
+        Tuple of (row, None) or (None, error message)
+    """
+    try:
+        values = next(csv.reader([text], strict=True), [])
+    except csv.Error as e:
+        return None, f"CSV không hợp lệ: {e}"
+
+    if len(values) != len(columns):
+        return None, f"Số cột ({len(values)}) không khớp với tiêu đề ({len(columns)})"
+
+    row: Dict[str, str] = {}
+    for column, value in zip(columns, values):
+        if column in REQUIRED_CSV_COLUMNS or column in OPTIONAL_CSV_COLUMNS:
+            if column != "description":
+                value = value.strip()
+            if value:
+                row[column] = value
+    return row, None
+
+
+async def _iter_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """
+    Parse CSV with a header row (name, price, quantity and optional id, description)
+    Quoted fields may span lines; a record ends on a line that closes all quotes
+    
+    Args:
+        chunks: Request body chunks
+    
+    Returns:
+        Async iterator of parsed rows
+    
+    Raises:
+        BulkImportError: If the header is missing or invalid
+    """
+    columns: Optional[List[str]] = None
+    record: List[str] = []
+    record_line = 0
+    quotes = 0
+    line_number = 0
+
+    async for line in _iter_lines(chunks):
+        line_number += 1
+        if not record:
+            record_line = line_number
+
+        error = None
+        if line is None:
+            error = "Dòng quá dài"
+        else:
+            try:
+                text = _decode(line, line_number)
+            except UnicodeDecodeError:
+                error = "Dòng không phải UTF-8 hợp lệ"
+
+        if error:
+            if columns is None:
+                raise BulkImportError(f"Tiêu đề CSV không hợp lệ: {error}")
+            # Drop the record the bad line belongs to
+            yield record_line, None, error
+            record, quotes = [], 0
+            continue
+
+        record.append(text)
+        # Doubled quotes inside a field keep the count even
+        quotes += text.count('"')
+        if quotes % 2:
+            continue
+
+        full_text = "".join(record)
+        record, quotes = [], 0
+        if not full_text.strip():
+            continue
+
+        if columns is None:
+            columns = _parse_csv_header(full_text)
+            continue
+
+        row, error = _csv_record_to_row(columns, full_text)
+        yield record_line, row, error
+
+    if columns is None:
+        raise BulkImportError("Tệp CSV không có tiêu đề")
+    if record:
+        yield record_line, None, "Trường trong ngoặc kép chưa được đóng"
+
+
+def iter_upload_rows(chunks: AsyncIterator[bytes], upload_format: str) -> AsyncIterator[ParsedRow]:
+    """
+    Parse an uploaded product file as it streams in
+    
+    Args:
+        chunks: Request body chunks
+        upload_format: "ndjson" or "csv"
+    
+    Returns:
+        Async iterator of (line number, row, error) tuples;
+        exactly one of row and error is set
+    """
+    if upload_format == "csv":
+        return _iter_csv(chunks)
+    return _iter_ndjson(chunks)
@@ -1,45 +1,110 @@
 """
 Redis Cache Manager
 Handles caching operations for Product Service
+Two tiers: in-process LRU (per worker) in front of Redis
+Uses the asyncio Redis client so cache calls never block the event loop
+Protects the database from cache stampedes (single-flight, early refresh)
 """
 
+import asyncio
 import json
 import logging
-from typing import Optional, Any
-import redis
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+import redis.asyncio as aioredis
 from redis.exceptions import RedisError
 
 from app.config import settings
+from app.utils import codecs
+from app.utils.local_cache import LocalCache
+from app.utils.metrics import CACHE_COALESCED, CACHE_REQUESTS, LISTING_CACHE_REQUESTS
 
 logger = logging.getLogger(__name__)
 
+# Bumped on every catalog write; listing pages are keyed by it
+CATALOG_VERSION_KEY = "catalog:version"
+
+# Product access counts shared by all processes, used to pick products to warm
+HOT_PRODUCTS_KEY = "products:hot"
+
+# Delete the lock only if it still holds our token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class CacheManager:
     """
     Redis cache manager for Product Service
     Handles caching with TTL and invalidation
+    Hot products are additionally kept in a local in-process tier
     """
 
     def __init__(self):
-        """Initialize Redis connection"""
-        try:
-            self.redis_client = redis.Redis(
-                host=settings.REDIS_HOST,
-                port=settings.REDIS_PORT,
-                db=settings.REDIS_DB,
-                password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
-                decode_responses=True,
-                socket_timeout=5,
-                socket_connect_timeout=5,
+        """Initialize local cache tier and Redis connection pool"""
+        # Identifies this process on the invalidation channel
+        self.instance_id = uuid.uuid4().hex
+        # In-flight loader tasks per cache key (single-flight)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Bumped on every invalidation seen by this process
+        self._invalidation_epoch = 0
+        self.listing_hits = 0
+        self.listing_misses = 0
+        # Product reads since the last flush to HOT_PRODUCTS_KEY
+        self._access_counts: Counter = Counter()
+        self.local_cache: Optional[LocalCache] = None
+        if settings.LOCAL_CACHE_ENABLED:
+            self.local_cache = LocalCache(
+                max_items=settings.LOCAL_CACHE_MAX_ITEMS,
+                max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+                ttl=settings.LOCAL_CACHE_TTL,
             )
-            # Test connection
-            self.redis_client.ping()
+
+        # Connections are opened lazily, so creating the pool does no I/O
+        self.pool = aioredis.ConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+            # Values are binary codec payloads
+            decode_responses=False,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        )
+        self.redis_client: Optional[aioredis.Redis] = aioredis.Redis(connection_pool=self.pool)
+        self.codec = codecs.get_codec(settings.CACHE_CODEC)
+
+    async def connect(self):
+        """
+        Check Redis connection on startup
+        The client is kept even if Redis is down, so the cache recovers
+        as soon as Redis comes back
+        """
+        try:
+            await self.redis_client.ping()
             logger.info(
                 f"✅ Redis connected successfully at {settings.REDIS_HOST}:{settings.REDIS_PORT}"
             )
-        except RedisError as e:
+        except (RedisError, OSError) as e:
             logger.error(f"❌ Failed to connect to Redis: {e}")
-            self.redis_client = None
+
+    async def close(self):
+        """
+        Close Redis connection pool
+        """
+        if self.redis_client:
+            await self.redis_client.aclose()
+            await self.pool.disconnect()
+            logger.info("✅ Redis connection pool closed")
 
     def _get_product_key(self, product_id: int) -> str:
         """
@@ -47,48 +112,296 @@ class CacheManager:
         
         Args:
             product_id: Product ID
-            
+        
         Returns:
             Cache key string
         """
         return f"product:{product_id}"
 
-    def get_product(self, product_id: int) -> Optional[dict]:
+    async def get_or_load_product_json(
+        self,
+        product_id: int,
+        loader: Callable[[], Awaitable[Optional[dict]]]
+    ) -> Optional[Tuple[bytes, str]]:
+        """
+        Get product as a rendered JSON document, loading it at most once per key on a miss
+        
+        Concurrent misses for the same product share a single loader call
+        (optionally coordinated across processes with a Redis lock).
+        Entries close to or past their logical expiry are still served while
+        one background task refreshes them (probabilistic early refresh and
+        stale-while-revalidate).
+        
+        The bytes are exactly what FastAPI would render for the product, so
+        they can be sent as the response body without any (de)serialization.
+        The update time comes along for HTTP validators (ETag, Last-Modified).
+        
+        Args:
+            product_id: Product ID
+            loader: Coroutine factory returning fresh product data or None
+        
+        Returns:
+            Tuple of (product JSON bytes, updated_at ISO string),
+            or None if the product does not exist
+        """
+        entry = await self._get_or_load_entry(product_id, loader)
+        return (entry["json"], entry["data"]["updated_at"]) if entry is not None else None
+
+    async def _get_or_load_entry(
+        self,
+        product_id: int,
+        loader: Callable[[], Awaitable[Optional[dict]]]
+    ) -> Optional[dict]:
         """
-        Get product from cache
+        Get cache entry, loading it through the single-flight path on a miss
         
         Args:
             product_id: Product ID
-            
+            loader: Coroutine factory returning fresh product data or None
+        
         Returns:
-            Product data dict or None if not in cache
+            Cache entry or None if the product does not exist
         """
+        entry = await self._get_entry(product_id)
+
+        if entry is not None:
+            if self._should_refresh(entry):
+                CACHE_REQUESTS.labels(tier="any", result="stale").inc()
+                task = self._start_load(product_id, loader, refresh=True)
+                task.add_done_callback(self._log_refresh_error)
+            return entry
+
+        return await asyncio.shield(self._start_load(product_id, loader, refresh=False))
+
+    async def _get_entry(self, product_id: int) -> Optional[dict]:
+        """
+        Get cache entry (data plus freshness metadata) from local tier or Redis
+        
+        Args:
+            product_id: Product ID
+        
+        Returns:
+            Entry dict with "data", "json", "exp" and "delta" keys, or None if not cached
+        """
+        key = self._get_product_key(product_id)
+
+        if self.local_cache:
+            entry = self.local_cache.get(key)
+            if entry is not None:
+                CACHE_REQUESTS.labels(tier="local", result="hit").inc()
+                logger.debug(f"✅ Local cache HIT for product ID: {product_id}")
+                return entry
+            CACHE_REQUESTS.labels(tier="local", result="miss").inc()
+
         if not self.redis_client:
             return None
 
         try:
-            key = self._get_product_key(product_id)
-            cached_data = self.redis_client.get(key)
-            
+            cached_data = await self.redis_client.get(key)
+
             if cached_data:
+                CACHE_REQUESTS.labels(tier="redis", result="hit").inc()
                 logger.info(f"✅ Cache HIT for product ID: {product_id}")
-                return json.loads(cached_data)
-            
+                entry = self._decode_entry(cached_data)
+                if entry is not None:
+                    if self.local_cache:
+                        self.local_cache.set(key, entry, len(cached_data) + len(entry["json"]))
+                    return entry
+
+            CACHE_REQUESTS.labels(tier="redis", result="miss").inc()
             logger.info(f"❌ Cache MISS for product ID: {product_id}")
             return None
-        except RedisError as e:
+        except (RedisError, OSError) as e:
             logger.error(f"Redis GET error for product {product_id}: {e}")
             return None
 
-    def set_product(self, product_id: int, product_data: dict, ttl: Optional[int] = None) -> bool:
+    def _should_refresh(self, entry: dict) -> bool:
+        """
+        Decide whether a cached entry should be recomputed now
+        
+        Uses probabilistic early expiration (XFetch): the closer the entry is
+        to its logical expiry and the slower it was to compute, the more likely
+        a request triggers the refresh, so refreshes spread out before the
+        TTL boundary instead of all happening on it.
+        
+        Args:
+            entry: Cache entry
+        
+        Returns:
+            True if the entry should be refreshed
+        """
+        gap = entry["delta"] * settings.CACHE_EARLY_REFRESH_BETA * -math.log(1.0 - random.random())
+        return time.time() + gap >= entry["exp"]
+
+    def _start_load(
+        self,
+        product_id: int,
+        loader: Callable[[], Awaitable[Optional[dict]]],
+        refresh: bool
+    ) -> "asyncio.Task[Optional[dict]]":
+        """
+        Start a loader task for a product, or join the one already running
+        
+        Args:
+            product_id: Product ID
+            loader: Coroutine factory returning fresh product data or None
+            refresh: True when refreshing an entry that is still being served
+        
+        Returns:
+            Task resolving to the cache entry of the loaded product
+        """
+        key = self._get_product_key(product_id)
+        task = self._inflight.get(key)
+        if task is not None:
+            CACHE_COALESCED.inc()
+            return task
+
+        # A separate task, so a cancelled request does not cancel the load
+        # other requests are waiting on
+        task = asyncio.create_task(self._load_and_store(product_id, loader, refresh))
+        self._inflight[key] = task
+        task.add_done_callback(
+            lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None
+        )
+        return task
+
+    async def _load_and_store(
+        self,
+        product_id: int,
+        loader: Callable[[], Awaitable[Optional[dict]]],
+        refresh: bool
+    ) -> Optional[dict]:
+        """
+        Run the loader and write the result to the cache
+        
+        Args:
+            product_id: Product ID
+            loader: Coroutine factory returning fresh product data or None
+            refresh: True when refreshing an entry that is still being served
+        
+        Returns:
+            Cache entry of the loaded product or None
+        """
+        key = self._get_product_key(product_id)
+        lock_token = None
+
+        if settings.CACHE_LOCK_ENABLED and self.redis_client:
+            lock_token = await self._acquire_lock(key)
+            if lock_token is None:
+                # Another process is already loading this product
+                if refresh:
+                    return None
+                entry = await self._wait_for_fill(key)
+                if entry is not None:
+                    return entry
+
+        try:
+            epoch = self._invalidation_epoch
+            started = time.monotonic()
+            data = await loader()
+            delta = time.monotonic() - started
+            if data is None:
+                return None
+
+            entry, payload = self._build_entry(data, time.time() + settings.CACHE_TTL, delta)
+
+            # Skip the write if the product was invalidated while loading,
+            # the loaded row may predate that write
+            if epoch == self._invalidation_epoch:
+                await self._store_entry(key, entry, payload, settings.CACHE_TTL)
+            return entry
+        finally:
+            if lock_token is not None:
+                await self._release_lock(key, lock_token)
+
+    async def _acquire_lock(self, key: str) -> Optional[str]:
+        """
+        Try to acquire the cross-process fill lock for a cache key
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Lock token if acquired, None if another process holds the lock.
+            On Redis errors a token is returned so loading is never blocked.
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis_client.set(
+                f"lock:{key}",
+                token,
+                nx=True,
+                px=settings.CACHE_LOCK_TIMEOUT_MS,
+            )
+            return token if acquired else None
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis LOCK error for {key}: {e}")
+            return token
+
+    async def _release_lock(self, key: str, token: str):
+        """
+        Release the fill lock if we still own it
+        
+        Args:
+            key: Cache key
+            token: Token returned by _acquire_lock
+        """
+        try:
+            await self.redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis UNLOCK error for {key}: {e}")
+
+    async def _wait_for_fill(self, key: str) -> Optional[dict]:
+        """
+        Wait for the lock holder to populate a cache key
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cache entry, or None if it did not appear within CACHE_LOCK_WAIT_MS
+        """
+        deadline = time.monotonic() + settings.CACHE_LOCK_WAIT_MS / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            try:
+                cached_data = await self.redis_client.get(key)
+            except (RedisError, OSError):
+                return None
+            if cached_data:
+                return self._decode_entry(cached_data)
+        return None
+
+    @staticmethod
+    def _log_refresh_error(task: "asyncio.Task"):
+        """
+        Log failures of background refresh tasks
+        
+        Args:
+            task: Finished refresh task
+        """
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background cache refresh failed: {task.exception()}")
+
+    async def set_product(
+        self,
+        product_id: int,
+        product_data: dict,
+        ttl: Optional[int] = None,
+        delta: float = 0.0
+    ) -> bool:
         """
         Store product in cache with TTL
         
+        The entry is logically fresh for `ttl` seconds and kept in Redis for
+        another CACHE_STALE_TTL seconds so it can be served while refreshing.
+        
         Args:
             product_id: Product ID
             product_data: Product data to cache
             ttl: Time to live in seconds (default from settings)
-            
+            delta: Seconds it took to load the data (drives early refresh)
+        
         Returns:
             True if successful, False otherwise
         """
@@ -96,91 +409,600 @@ class CacheManager:
             return False
 
         try:
-            key = self._get_product_key(product_id)
             ttl = ttl or settings.CACHE_TTL
-            
-            # Convert datetime objects to ISO format strings for JSON serialization
-            serializable_data = self._prepare_for_json(product_data)
-            
-            self.redis_client.setex(
-                key,
-                ttl,
-                json.dumps(serializable_data)
-            )
-            logger.info(f"✅ Cached product ID: {product_id} with TTL: {ttl}s")
+            entry, payload = self._build_entry(product_data, time.time() + ttl, delta)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Cache encode error for product {product_id}: {e}")
+            return False
+
+        return await self._store_entry(self._get_product_key(product_id), entry, payload, ttl)
+
+    async def _store_entry(self, key: str, entry: dict, payload: bytes, ttl: int) -> bool:
+        """
+        Write an encoded entry to Redis and the local tier
+        
+        Args:
+            key: Cache key
+            entry: Entry dict
+            payload: Encoded entry
+            ttl: Logical time to live in seconds
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self.redis_client.setex(key, ttl + settings.CACHE_STALE_TTL, payload)
+            if self.local_cache:
+                self.local_cache.set(key, entry, len(payload) + len(entry["json"]))
+            logger.info(f"✅ Cached {key} with TTL: {ttl}s")
+            return True
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis SET error for {key}: {e}")
+            return False
+
+    async def get_products_many(self, product_ids: List[int]) -> Dict[int, dict]:
+        """
+        Get many products from cache in one round-trip
+        Local tier first, then a single MGET for the rest
+        
+        Args:
+            product_ids: Product IDs
+        
+        Returns:
+            Dict of product ID to product data for fresh cached products only;
+            missing and expired products are left for the caller to load
+        """
+        found: Dict[int, dict] = {}
+        remaining = []
+        now = time.time()
+
+        for product_id in product_ids:
+            entry = None
+            if self.local_cache:
+                entry = self.local_cache.get(self._get_product_key(product_id))
+                CACHE_REQUESTS.labels(tier="local", result="hit" if entry else "miss").inc()
+            if entry is not None and entry["exp"] > now:
+                found[product_id] = dict(entry["data"])
+            else:
+                remaining.append(product_id)
+
+        if not remaining or not self.redis_client:
+            return found
+
+        try:
+            keys = [self._get_product_key(product_id) for product_id in remaining]
+            values = await self.redis_client.mget(keys)
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis MGET error for {len(remaining)} products: {e}")
+            return found
+
+        for product_id, key, cached_data in zip(remaining, keys, values):
+            if not cached_data:
+                CACHE_REQUESTS.labels(tier="redis", result="miss").inc()
+                continue
+            entry = self._decode_entry(cached_data)
+            if entry is None:
+                CACHE_REQUESTS.labels(tier="redis", result="miss").inc()
+                continue
+            CACHE_REQUESTS.labels(tier="redis", result="hit").inc()
+            if self.local_cache:
+                self.local_cache.set(key, entry, len(cached_data) + len(entry["json"]))
+            if entry["exp"] > now:
+                found[product_id] = dict(entry["data"])
+
+        return found
+
+    async def get_or_load_products_many(
+        self,
+        product_ids: List[int],
+        loader: Callable[[List[int]], Awaitable[Dict[int, dict]]]
+    ) -> Dict[int, dict]:
+        """
+        Get many products from cache, loading all misses with one loader call
+        
+        Args:
+            product_ids: Product IDs
+            loader: Coroutine factory taking the missing IDs and returning
+                a dict of product ID to product data for those that exist
+        
+        Returns:
+            Dict of product ID to product data for existing products
+        """
+        found = await self.get_products_many(product_ids)
+
+        missing_ids = [product_id for product_id in product_ids if product_id not in found]
+        if missing_ids:
+            epoch = self._invalidation_epoch
+            started = time.monotonic()
+            loaded = await loader(missing_ids)
+            if epoch == self._invalidation_epoch:
+                await self.set_products_many(loaded, delta=time.monotonic() - started)
+            found.update(loaded)
+
+        return found
+
+    async def set_products_many(
+        self,
+        products: Dict[int, dict],
+        ttl: Optional[int] = None,
+        delta: float = 0.0
+    ) -> bool:
+        """
+        Store many products in cache with a single pipelined round-trip
+        
+        Args:
+            products: Dict of product ID to product data
+            ttl: Time to live in seconds (default from settings)
+            delta: Seconds it took to load the data (drives early refresh)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not products or not self.redis_client:
+            return False
+
+        ttl = ttl or settings.CACHE_TTL
+        exp = time.time() + ttl
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for product_id, product_data in products.items():
+                    key = self._get_product_key(product_id)
+                    entry, payload = self._build_entry(product_data, exp, delta)
+                    pipe.setex(key, ttl + settings.CACHE_STALE_TTL, payload)
+                    if self.local_cache:
+                        self.local_cache.set(key, entry, len(payload) + len(entry["json"]))
+                await pipe.execute()
+            logger.info(f"✅ Cached {len(products)} products with TTL: {ttl}s")
             return True
-        except (RedisError, TypeError, ValueError) as e:
-            logger.error(f"Redis SET error for product {product_id}: {e}")
+        except (RedisError, OSError, TypeError, ValueError) as e:
+            logger.error(f"Redis pipeline SET error for {len(products)} products: {e}")
             return False
 
-    def invalidate_product(self, product_id: int) -> bool:
+    async def write_through_product(
+        self,
+        product_id: int,
+        product_data: dict,
+        text_changed: bool = True,
+        search_fields: Optional[Dict[int, Optional[dict]]] = None
+    ) -> bool:
         """
-        Invalidate (delete) product from cache
+        Replace a product in the cache with freshly written data
+        Other processes drop their local copy and pick up the new entry from Redis
         
         Args:
             product_id: Product ID
-            
+            product_data: Product data as stored in the database
+            text_changed: False if name and description are unchanged
+                (e.g. a stock change), so other replicas skip re-indexing
+            search_fields: Indexed fields to broadcast (see publish_invalidation)
+        
         Returns:
             True if successful, False otherwise
         """
+        # Loads started before the write must not overwrite the new entry
+        self._invalidation_epoch += 1
+        if not await self.set_product(product_id, product_data):
+            # Never leave the old value behind
+            await self.invalidate_product(product_id, text_changed, search_fields)
+            return False
+
+        await self.publish_invalidation([product_id], text_changed, search_fields)
+        logger.info(f"✅ Cache written through for product ID: {product_id}")
+        return True
+
+    async def invalidate_product(
+        self,
+        product_id: int,
+        text_changed: bool = True,
+        search_fields: Optional[Dict[int, Optional[dict]]] = None
+    ) -> bool:
+        """
+        Invalidate (delete) product from both cache tiers
+        
+        Args:
+            product_id: Product ID
+            text_changed: False if name and description are unchanged
+            search_fields: Indexed fields to broadcast (see publish_invalidation)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        key = self._get_product_key(product_id)
+        self._invalidation_epoch += 1
+        if self.local_cache:
+            self.local_cache.delete(key)
+
         if not self.redis_client:
             return False
 
         try:
-            key = self._get_product_key(product_id)
-            result = self.redis_client.delete(key)
+            result = await self.redis_client.delete(key)
+            await self.publish_invalidation([product_id], text_changed, search_fields)
             if result:
                 logger.info(f"✅ Cache invalidated for product ID: {product_id}")
             return bool(result)
-        except RedisError as e:
+        except (RedisError, OSError) as e:
             logger.error(f"Redis DELETE error for product {product_id}: {e}")
             return False
 
-    def clear_all(self) -> bool:
+    async def invalidate_products(self, product_ids: List[int]) -> int:
+        """
+        Invalidate many products from both cache tiers
+        Keys are removed with batched UNLINK calls and other processes are
+        told with a single invalidation message, instead of one DELETE and
+        one PUBLISH per product
+        
+        Args:
+            product_ids: Product IDs
+        
+        Returns:
+            Number of Redis entries removed
+        """
+        if not product_ids:
+            return 0
+
+        keys = [self._get_product_key(product_id) for product_id in product_ids]
+        self._invalidation_epoch += 1
+        if self.local_cache:
+            for key in keys:
+                self.local_cache.delete(key)
+
+        if not self.redis_client:
+            return 0
+
+        try:
+            batch_size = settings.CACHE_CLEAR_BATCH_SIZE
+            removed = 0
+            for start in range(0, len(keys), batch_size):
+                removed += await self.redis_client.unlink(*keys[start:start + batch_size])
+            await self.publish_invalidation(product_ids)
+            logger.info(f"✅ Cache invalidated for {len(product_ids)} products ({removed} cached)")
+            return removed
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis UNLINK error for {len(product_ids)} products: {e}")
+            return 0
+
+    async def clear_all(self) -> bool:
         """
         Clear all product caches
         
+        Walks the keyspace incrementally with SCAN and removes keys in batches
+        with UNLINK (memory is reclaimed in a background thread), so Redis is
+        never blocked by one huge KEYS/DEL. Listing pages are dropped in O(1)
+        by bumping the catalog version.
+        
         Returns:
             True if successful, False otherwise
         """
+        self._invalidation_epoch += 1
+        if self.local_cache:
+            self.local_cache.clear()
+
         if not self.redis_client:
             return False
 
         try:
-            # Get all product keys
-            keys = self.redis_client.keys("product:*")
-            if keys:
-                self.redis_client.delete(*keys)
-                logger.info(f"✅ Cleared {len(keys)} product cache entries")
+            batch_size = settings.CACHE_CLEAR_BATCH_SIZE
+            cleared = 0
+            batch = []
+
+            async for key in self.redis_client.scan_iter(match="product:*", count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    cleared += await self.redis_client.unlink(*batch)
+                    batch = []
+
+            if batch:
+                cleared += await self.redis_client.unlink(*batch)
+
+            logger.info(f"✅ Cleared {cleared} product cache entries")
+            await self.bump_catalog_version()
+            await self.publish_invalidation(None)
             return True
-        except RedisError as e:
+        except (RedisError, OSError) as e:
             logger.error(f"Redis CLEAR error: {e}")
             return False
 
-    def _prepare_for_json(self, data: Any) -> Any:
+    def record_access(self, product_ids: Iterable[int]):
+        """
+        Count product reads in memory
+        Counts are sent to Redis in one pipeline by flush_access_counts
+        
+        Args:
+            product_ids: IDs of the products that were read
+        """
+        self._access_counts.update(product_ids)
+
+    async def flush_access_counts(self) -> int:
+        """
+        Add in-memory access counts to the shared hot products ranking
+        
+        Returns:
+            Number of products flushed
+        """
+        counts, self._access_counts = self._access_counts, Counter()
+        if not counts or not self.redis_client:
+            return 0
+
+        # Keep some headroom over the warm set so new products can climb
+        keep = settings.CACHE_WARM_TOP_N * 10
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for product_id, count in counts.items():
+                    pipe.zincrby(HOT_PRODUCTS_KEY, count, product_id)
+                pipe.zremrangebyrank(HOT_PRODUCTS_KEY, 0, -keep - 1)
+                pipe.expire(HOT_PRODUCTS_KEY, settings.HOT_PRODUCTS_TTL)
+                await pipe.execute()
+            return len(counts)
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis ZINCRBY error for {len(counts)} products: {e}")
+            return 0
+
+    async def get_hot_product_ids(self, limit: int) -> List[int]:
+        """
+        Get the most read products across all processes
+        
+        Args:
+            limit: Maximum number of IDs
+        
+        Returns:
+            Product IDs, most read first
+        """
+        if not self.redis_client or limit <= 0:
+            return []
+
+        try:
+            members = await self.redis_client.zrevrange(HOT_PRODUCTS_KEY, 0, limit - 1)
+            return [int(member) for member in members]
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis ZREVRANGE error for hot products: {e}")
+            return []
+
+    async def remove_hot_products(self, product_ids: Iterable[int]):
+        """
+        Remove products from the hot products ranking
+        
+        Args:
+            product_ids: IDs of deleted products
+        """
+        product_ids = list(product_ids)
+        if not product_ids or not self.redis_client:
+            return
+
+        try:
+            await self.redis_client.zrem(HOT_PRODUCTS_KEY, *product_ids)
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis ZREM error for hot products: {e}")
+
+    def _get_listing_key(self, version: int, params: dict) -> str:
+        """
+        Generate cache key for a product listing page
+        
+        Args:
+            version: Catalog version the page was computed under
+            params: Listing parameters (pagination and filters)
+        
+        Returns:
+            Cache key string
+        """
+        query = urlencode(sorted((k, v) for k, v in params.items() if v is not None))
+        return f"products:list:v{version}:{query}"
+
+    async def get_catalog_version(self) -> Optional[int]:
+        """
+        Get current catalog version
+        Listing pages are cached under the version they were computed for
+        
+        Returns:
+            Catalog version, or None if Redis is unavailable
+        """
+        if not self.redis_client:
+            return None
+
+        try:
+            version = await self.redis_client.get(CATALOG_VERSION_KEY)
+            return int(version) if version else 0
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis GET error for catalog version: {e}")
+            return None
+
+    async def bump_catalog_version(self) -> Optional[int]:
         """
-        Prepare data for JSON serialization
-        Converts datetime objects to ISO format strings
+        Invalidate all cached listing pages in O(1)
+        Old pages are never read again and expire with their TTL
+        
+        Returns:
+            New catalog version, or None if Redis is unavailable
+        """
+        if not self.redis_client:
+            return None
+
+        try:
+            return await self.redis_client.incr(CATALOG_VERSION_KEY)
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis INCR error for catalog version: {e}")
+            return None
+
+    async def get_or_load_listing(
+        self,
+        params: dict,
+        loader: Callable[[], Awaitable[List[dict]]]
+    ) -> List[dict]:
+        """
+        Get a product listing page from cache, loading it on a miss
         
         Args:
-            data: Data to prepare
-            
+            params: Listing parameters (pagination and filters)
+            loader: Coroutine factory returning the page as a list of dicts
+        
         Returns:
-            JSON-serializable data
+            List of product data dicts
         """
-        if isinstance(data, dict):
-            return {
-                key: self._prepare_for_json(value)
-                for key, value in data.items()
-            }
-        elif isinstance(data, list):
-            return [self._prepare_for_json(item) for item in data]
-        elif hasattr(data, 'isoformat'):  # datetime objects
-            return data.isoformat()
+        version = await self.get_catalog_version()
+        if version is None:
+            return await loader()
+
+        key = self._get_listing_key(version, params)
+
+        if self.local_cache:
+            items = self.local_cache.get(key)
+            if items is not None:
+                self._record_listing_lookup(hit=True)
+                return items
+
+        try:
+            cached_data = await self.redis_client.get(key)
+            entry = self._decode_entry(cached_data) if cached_data else None
+            if entry is not None:
+                self._record_listing_lookup(hit=True)
+                items = entry["data"]
+                if self.local_cache:
+                    self.local_cache.set(key, items, len(cached_data))
+                return items
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis GET error for listing {key}: {e}")
+
+        self._record_listing_lookup(hit=False)
+        items = await loader()
+
+        # Stored under the version read before loading: if a write bumped it
+        # meanwhile, this page is simply never read again
+        try:
+            _, payload = self._build_entry(items, 0.0, 0.0)
+            await self.redis_client.setex(key, settings.LISTING_CACHE_TTL, payload)
+            if self.local_cache:
+                self.local_cache.set(key, items, len(payload))
+        except (RedisError, OSError, TypeError) as e:
+            logger.error(f"Redis SET error for listing {key}: {e}")
+
+        return items
+
+    def _record_listing_lookup(self, hit: bool):
+        """
+        Count a listing cache lookup
+        
+        Args:
+            hit: True for a cache hit, False for a miss
+        """
+        result = "hit" if hit else "miss"
+        LISTING_CACHE_REQUESTS.labels(result=result).inc()
+        if hit:
+            self.listing_hits += 1
+        else:
+            self.listing_misses += 1
+
+    async def publish_invalidation(
+        self,
+        product_ids: Optional[Iterable[int]],
+        text_changed: bool = True,
+        search_fields: Optional[Dict[int, Optional[dict]]] = None
+    ) -> bool:
+        """
+        Broadcast invalidation to every product-service process
+        Subscribers drop the products from their local tier
+        
+        Args:
+            product_ids: Product IDs to invalidate, None to clear everything
+            text_changed: False if only stock or price changed; the message
+                is flagged so the suggest index of other replicas is left alone
+            search_fields: Name and description after the write per product
+                ID, None for a deleted product; other replicas update their
+                suggest index from it instead of reading the product back
+        
+        Returns:
+            True if published, False otherwise
+        """
+        if not self.redis_client or not settings.CACHE_INVALIDATION_ENABLED:
+            return False
+
+        message = {"origin": self.instance_id}
+        if product_ids is None:
+            message["all"] = True
         else:
-            return data
+            message["ids"] = list(product_ids)
+            if not text_changed:
+                message["text_changed"] = False
+            if search_fields:
+                message["search"] = {str(product_id): fields for product_id, fields in search_fields.items()}
+
+        try:
+            await self.redis_client.publish(
+                settings.CACHE_INVALIDATION_CHANNEL,
+                json.dumps(message)
+            )
+            return True
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis PUBLISH error for invalidation {message}: {e}")
+            return False
+
+    def evict_local(self, product_ids: Optional[Iterable[int]]) -> int:
+        """
+        Drop products from the local tier only
+        
+        Args:
+            product_ids: Product IDs to drop, None to clear the whole tier
+        
+        Returns:
+            Number of evicted entries
+        """
+        self._invalidation_epoch += 1
+        if not self.local_cache:
+            return 0
+
+        if product_ids is None:
+            return self.local_cache.clear()
+
+        return sum(
+            self.local_cache.delete(self._get_product_key(product_id))
+            for product_id in product_ids
+        )
+
+    def _build_entry(self, data: Any, exp: float, delta: float) -> Tuple[dict, bytes]:
+        """
+        Build a cache entry and serialize it with the configured codec
+        
+        Args:
+            data: Value to cache
+            exp: Logical expiry as epoch seconds
+            delta: Seconds it took to load the value
+        
+        Returns:
+            Tuple of (entry dict, payload bytes)
+        """
+        body = self.codec.encode(data)
+        entry = {
+            "data": data,
+            "json": body if self.codec.renders_json else codecs.render_json(data),
+            "exp": exp,
+            "delta": delta,
+        }
+        return entry, codecs.header(self.codec, exp, delta) + body
 
-    def healthcheck(self) -> bool:
+    def _decode_entry(self, payload: bytes) -> Optional[dict]:
+        """
+        Deserialize a cache entry written by any codec
+        
+        Args:
+            payload: Payload bytes from Redis
+        
+        Returns:
+            Entry dict, or None if the payload has an unknown schema or codec
+        """
+        unpacked = codecs.unpack(payload)
+        if unpacked is None:
+            return None
+        data, exp, delta, codec = unpacked
+        return {
+            "data": data,
+            # JSON codecs store the rendered document as the body itself
+            "json": payload[codecs.HEADER_SIZE:] if codec.renders_json else codecs.render_json(data),
+            "exp": exp,
+            "delta": delta,
+        }
+
+    async def healthcheck(self) -> bool:
         """
         Check if Redis is healthy
         
@@ -191,10 +1013,35 @@ class CacheManager:
             return False
 
         try:
-            return self.redis_client.ping()
-        except RedisError:
+            return await self.redis_client.ping()
+        except (RedisError, OSError):
             return False
 
+    def stats(self) -> dict:
+        """
+        Get local cache tier statistics
+        
+        Returns:
+            Dict with local tier counters (empty if the tier is disabled)
+        """
+        if not self.local_cache:
+            return {"enabled": False}
+        return {"enabled": True, **self.local_cache.stats()}
+
+    def listing_stats(self) -> dict:
+        """
+        Get listing cache statistics for this worker
+        
+        Returns:
+            Dict with hit/miss counters and hit ratio
+        """
+        lookups = self.listing_hits + self.listing_misses
+        return {
+            "hits": self.listing_hits,
+            "misses": self.listing_misses,
+            "hit_ratio": round(self.listing_hits / lookups, 4) if lookups else 0.0,
+        }
+
 
 # Global cache manager instance
 cache_manager = CacheManager()
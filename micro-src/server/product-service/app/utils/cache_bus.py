@@ -0,0 +1,153 @@
+"""
+Cache Invalidation Bus - Redis pub/sub subscriber
+Drops locally cached products when any product-service process writes them
+"""
+
+import asyncio
+import json
+import logging
+from typing import Callable, Dict, List, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.utils.cache import CacheManager, cache_manager
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidationSubscriber:
+    """
+    Background subscriber for the cache invalidation channel
+    One instance runs per worker process, started on application startup
+    """
+
+    def __init__(self, cache: CacheManager, reconnect_delay: float = 1.0):
+        """
+        Initialize subscriber
+
+        Args:
+            cache: Cache manager whose local tier is kept in sync
+            reconnect_delay: Initial delay in seconds before reconnecting
+        """
+        self.cache = cache
+        self.reconnect_delay = reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[Optional[List[int]], bool, Dict[int, Optional[dict]]], None]] = []
+
+    def add_listener(self, listener: Callable[[Optional[List[int]], bool, Dict[int, Optional[dict]]], None]):
+        """
+        Register a callback for invalidations published by other processes
+
+        Args:
+            listener: Called with the invalidated product IDs, or None when
+                the whole cache was cleared, whether name or description
+                may have changed (False for stock-only writes), and the
+                name and description sent with the message per product ID
+                (None for deleted products, missing when not sent)
+        """
+        self._listeners.append(listener)
+
+    async def start(self):
+        """
+        Start listening in a background task
+        """
+        if not settings.CACHE_INVALIDATION_ENABLED or not (self.cache.local_cache or self._listeners):
+            logger.info("Cache invalidation bus disabled")
+            return
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        """
+        Stop the background task
+        """
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self):
+        """
+        Subscribe to the invalidation channel and reconnect on failure
+        """
+        delay = self.reconnect_delay
+
+        while True:
+            client = aioredis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+                decode_responses=True,
+            )
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+                # Pub/sub is at-most-once: anything published while we were
+                # disconnected is lost, so start from an empty local tier
+                self.cache.evict_local(None)
+                delay = self.reconnect_delay
+                logger.info(
+                    f"✅ Subscribed to cache invalidation channel "
+                    f"'{settings.CACHE_INVALIDATION_CHANNEL}'"
+                )
+
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.handle_message(message["data"])
+
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError) as e:
+                logger.error(f"❌ Cache invalidation subscriber error: {e}")
+            finally:
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except (RedisError, OSError):
+                    pass
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    def handle_message(self, data: str):
+        """
+        Apply an invalidation message to the local tier
+
+        Args:
+            data: JSON message published by CacheManager.publish_invalidation
+        """
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed invalidation message: {data!r}")
+            return
+
+        # Our own writes were already evicted locally
+        if message.get("origin") == self.cache.instance_id:
+            return
+
+        product_ids = None if message.get("all") else message.get("ids", [])
+        evicted = self.cache.evict_local(product_ids)
+
+        if evicted:
+            logger.debug(f"Evicted {evicted} local cache entries from invalidation bus")
+
+        # Messages without the flag (older publishers) may have changed anything
+        text_changed = message.get("text_changed", True)
+        try:
+            search_fields = {int(product_id): fields for product_id, fields in message.get("search", {}).items()}
+        except (AttributeError, TypeError, ValueError):
+            search_fields = {}
+        for listener in self._listeners:
+            listener(product_ids, text_changed, search_fields)
+
+
+# Global subscriber instance
+cache_invalidation_subscriber = CacheInvalidationSubscriber(cache_manager)
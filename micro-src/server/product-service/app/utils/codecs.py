@@ -0,0 +1,175 @@
+"""
+Cache Codecs - Pluggable serialization for cached values
+Every payload starts with a fixed header carrying the schema version and
+the codec id, so entries written by another codec or an older schema are
+decoded correctly or treated as cache misses
+"""
+
+import json
+import logging
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of cached values changes; older entries become misses
+SCHEMA_VERSION = 1
+
+# Header: schema version, codec id, logical expiry (epoch seconds), load time (seconds)
+_HEADER = struct.Struct(">BBdf")
+HEADER_SIZE = _HEADER.size
+
+
+class Codec:
+    """
+    Base class for cache codecs
+    """
+
+    id: int = 0
+    name: str = ""
+    # True if the encoded body is the JSON document itself
+    renders_json: bool = False
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize value to bytes"""
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        """Deserialize bytes to value"""
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """Standard library JSON codec (always available)"""
+
+    id = 1
+    name = "json"
+    renders_json = True
+
+    def encode(self, value: Any) -> bytes:
+        # Same output as FastAPI's JSONResponse
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """orjson codec - fastest JSON encoder/decoder"""
+
+    id = 2
+    name = "orjson"
+    renders_json = True
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack codec - compact binary encoding"""
+
+    id = 3
+    name = "msgpack"
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+# Codecs whose library is installed, by id
+CODECS: Dict[int, Codec] = {
+    codec.id: codec
+    for codec, available in (
+        (JsonCodec(), True),
+        (OrjsonCodec(), orjson is not None),
+        (MsgpackCodec(), msgpack is not None),
+    )
+    if available
+}
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Get codec by name, falling back to JSON if its library is not installed
+
+    Args:
+        name: Codec name ("json", "orjson" or "msgpack")
+
+    Returns:
+        Codec instance
+    """
+    for codec in CODECS.values():
+        if codec.name == name:
+            return codec
+
+    logger.warning(f"⚠️ Cache codec '{name}' is not available, falling back to json")
+    return CODECS[JsonCodec.id]
+
+
+def render_json(value: Any) -> bytes:
+    """
+    Render value as a compact JSON document
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    codec = CODECS.get(OrjsonCodec.id) or CODECS[JsonCodec.id]
+    return codec.encode(value)
+
+
+def header(codec: Codec, exp: float = 0.0, delta: float = 0.0) -> bytes:
+    """
+    Build payload header
+
+    Args:
+        codec: Codec used for the body
+        exp: Logical expiry as epoch seconds (0 if unused)
+        delta: Seconds it took to compute the value
+
+    Returns:
+        Header bytes
+    """
+    return _HEADER.pack(SCHEMA_VERSION, codec.id, exp, delta)
+
+
+def unpack(payload: bytes) -> Optional[Tuple[Any, float, float, Codec]]:
+    """
+    Decode payload written as header() followed by the encoded body
+
+    Args:
+        payload: Payload bytes
+
+    Returns:
+        Tuple of (value, exp, delta, codec), or None if the payload has
+        another schema version, an unknown codec or is corrupt
+    """
+    if len(payload) < _HEADER.size:
+        return None
+
+    version, codec_id, exp, delta = _HEADER.unpack_from(payload)
+    codec = CODECS.get(codec_id)
+    if version != SCHEMA_VERSION or codec is None:
+        return None
+
+    try:
+        return codec.decode(payload[HEADER_SIZE:]), exp, delta, codec
+    except ValueError:
+        return None
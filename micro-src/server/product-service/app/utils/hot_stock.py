@@ -0,0 +1,272 @@
+"""
+Hot Stock Counters - Available quantity of flash-sale products in Redis
+Reservations of hot products are checked and decremented by a Lua script,
+so they never queue on the product row lock in the database; the net change
+per product is collected in a pending hash and written to the database in
+batches by the reconciler
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.utils.cache import cache_manager
+from app.utils.metrics import HOT_STOCK_RESERVATIONS
+
+logger = logging.getLogger(__name__)
+
+# Available quantity of one hot product: hot_stock:qty:{product_id}
+QUANTITY_KEY_PREFIX = "hot_stock:qty:"
+
+# Signed quantity change per product not yet written to the database
+PENDING_KEY = "hot_stock:pending"
+
+# Held while the reconciler writes taken changes, and while a counter is set from the database
+LOCK_KEY = "hot_stock:lock"
+
+# Seconds between attempts to take a held lock
+_LOCK_RETRY_DELAY = 0.01
+
+# Delete the lock only if it still holds our token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Take n units if available; the change is recorded for reconciliation in the same step
+# Returns {1, remaining}, {0, available} or {-1, 0} when the counter is not loaded
+_RESERVE_SCRIPT = """
+local available = redis.call("get", KEYS[1])
+if not available then
+    return {-1, 0}
+end
+local n = tonumber(ARGV[1])
+if tonumber(available) < n then
+    return {0, tonumber(available)}
+end
+redis.call("hincrby", KEYS[2], ARGV[2], -n)
+return {1, redis.call("decrby", KEYS[1], n)}
+"""
+
+# Give n units back; returns the new quantity or -1 when the counter is not loaded
+_RESTOCK_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return -1
+end
+redis.call("hincrby", KEYS[2], ARGV[2], ARGV[1])
+return redis.call("incrby", KEYS[1], ARGV[1])
+"""
+
+# Set the counter from the database quantity plus changes not written there yet
+# ARGV[2] == "1" only sets a missing counter; returns the counter value
+_LOAD_SCRIPT = """
+if ARGV[2] == "1" then
+    local current = redis.call("get", KEYS[1])
+    if current then
+        return tonumber(current)
+    end
+end
+local pending = tonumber(redis.call("hget", KEYS[2], ARGV[3]) or "0")
+local quantity = tonumber(ARGV[1]) + pending
+redis.call("set", KEYS[1], quantity)
+return quantity
+"""
+
+# Read and clear all pending changes atomically, so every change is applied once
+_TAKE_PENDING_SCRIPT = """
+local pending = redis.call("hgetall", KEYS[1])
+redis.call("del", KEYS[1])
+return pending
+"""
+
+
+def is_hot(product_id: int) -> bool:
+    """
+    Check whether a product's stock is managed in Redis
+    
+    Args:
+        product_id: Product ID
+    
+    Returns:
+        True if hot stock mode is enabled and the product is configured as hot
+    """
+    return settings.HOT_STOCK_ENABLED and product_id in settings.HOT_STOCK_PRODUCT_IDS
+
+
+def _quantity_key(product_id: int) -> str:
+    """Redis key of a hot product's available quantity"""
+    return f"{QUANTITY_KEY_PREFIX}{product_id}"
+
+
+@asynccontextmanager
+async def exclusive() -> AsyncIterator[None]:
+    """
+    Hold the hot stock lock, shared by all replicas
+    
+    Between take_pending and the database write, changes are in neither
+    Redis nor the database. Setting a counter from the database in that
+    window would miss them, so counter loads and reconciliation never
+    overlap. The lock expires after HOT_STOCK_LOCK_TIMEOUT seconds even if
+    its holder dies.
+    
+    Raises:
+        TimeoutError: If the lock was not acquired within HOT_STOCK_LOCK_TIMEOUT
+        RedisError: If Redis is unavailable
+    """
+    token = uuid.uuid4().hex
+    timeout_ms = int(settings.HOT_STOCK_LOCK_TIMEOUT * 1000)
+    deadline = time.monotonic() + settings.HOT_STOCK_LOCK_TIMEOUT
+    while not await cache_manager.redis_client.set(LOCK_KEY, token, nx=True, px=timeout_ms):
+        if time.monotonic() >= deadline:
+            raise TimeoutError("Hết thời gian chờ khóa hot stock")
+        await asyncio.sleep(_LOCK_RETRY_DELAY)
+
+    try:
+        yield
+    finally:
+        try:
+            await cache_manager.redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, LOCK_KEY, token)
+        except (RedisError, OSError) as e:
+            logger.error(f"Redis error releasing hot stock lock: {e}")
+
+
+async def reserve(product_id: int, quantity: int) -> Tuple[Optional[bool], int]:
+    """
+    Take stock from a hot product's counter
+    
+    Args:
+        product_id: Product ID
+        quantity: Quantity to reserve
+    
+    Returns:
+        (True, remaining) if reserved, (False, available) if the stock is
+        insufficient, (None, 0) if the counter is not loaded
+    
+    Raises:
+        RedisError: If Redis is unavailable; hot stock is never silently
+            taken from the database instead
+    """
+    status, value = await cache_manager.redis_client.eval(
+        _RESERVE_SCRIPT, 2, _quantity_key(product_id), PENDING_KEY, quantity, product_id
+    )
+    if status < 0:
+        return None, 0
+    HOT_STOCK_RESERVATIONS.labels(result="reserved" if status else "insufficient").inc()
+    return bool(status), value
+
+
+async def restock(product_id: int, quantity: int) -> Optional[int]:
+    """
+    Give stock back to a hot product's counter (released reservation)
+    
+    Args:
+        product_id: Product ID
+        quantity: Quantity to give back
+    
+    Returns:
+        New available quantity, or None if the counter is not loaded
+    """
+    value = await cache_manager.redis_client.eval(
+        _RESTOCK_SCRIPT, 2, _quantity_key(product_id), PENDING_KEY, quantity, product_id
+    )
+    return None if value < 0 else value
+
+
+async def load(product_id: int, db_quantity: int, overwrite: bool = False) -> int:
+    """
+    Initialize a hot product's counter from the database
+    Call under exclusive(), with the quantity read after acquiring it
+    
+    Args:
+        product_id: Product ID
+        db_quantity: Quantity currently stored in the database
+        overwrite: Replace an existing counter (the quantity was set by an update)
+    
+    Returns:
+        Counter value
+    """
+    return await cache_manager.redis_client.eval(
+        _LOAD_SCRIPT, 2, _quantity_key(product_id), PENDING_KEY,
+        db_quantity, "0" if overwrite else "1", product_id
+    )
+
+
+async def remove(product_ids: Iterable[int]):
+    """
+    Drop the counters and pending changes of deleted products
+    
+    Args:
+        product_ids: Product IDs
+    """
+    product_ids = list(product_ids)
+    if not product_ids or not cache_manager.redis_client:
+        return
+
+    try:
+        async with cache_manager.redis_client.pipeline(transaction=True) as pipe:
+            pipe.unlink(*[_quantity_key(product_id) for product_id in product_ids])
+            pipe.hdel(PENDING_KEY, *product_ids)
+            await pipe.execute()
+    except (RedisError, OSError) as e:
+        logger.error(f"Redis error removing hot stock of {len(product_ids)} products: {e}")
+
+
+async def take_pending() -> Dict[int, int]:
+    """
+    Take all quantity changes not yet written to the database
+    Call under exclusive() and hold it until they are written or put back
+    
+    Returns:
+        Signed quantity change per product ID
+    """
+    values = await cache_manager.redis_client.eval(_TAKE_PENDING_SCRIPT, 1, PENDING_KEY)
+    pending = {int(values[i]): int(values[i + 1]) for i in range(0, len(values), 2)}
+    return {product_id: delta for product_id, delta in pending.items() if delta}
+
+
+async def put_back_pending(deltas: Dict[int, int]):
+    """
+    Return changes taken by take_pending after writing them failed
+    
+    Args:
+        deltas: Signed quantity change per product ID
+    """
+    async with cache_manager.redis_client.pipeline(transaction=True) as pipe:
+        for product_id, delta in deltas.items():
+            pipe.hincrby(PENDING_KEY, product_id, delta)
+        await pipe.execute()
+
+
+async def snapshot(product_ids: Iterable[int]) -> Dict[int, Tuple[Optional[int], int]]:
+    """
+    Read counters and pending changes for a report
+    
+    Args:
+        product_ids: Product IDs
+    
+    Returns:
+        (counter or None, pending change) per product ID
+    """
+    product_ids = list(product_ids)
+    if not product_ids:
+        return {}
+
+    async with cache_manager.redis_client.pipeline(transaction=True) as pipe:
+        pipe.mget([_quantity_key(product_id) for product_id in product_ids])
+        pipe.hmget(PENDING_KEY, product_ids)
+        quantities, pending = await pipe.execute()
+
+    return {
+        product_id: (
+            int(quantity) if quantity is not None else None,
+            int(delta) if delta is not None else 0,
+        )
+        for product_id, quantity, delta in zip(product_ids, quantities, pending)
+    }
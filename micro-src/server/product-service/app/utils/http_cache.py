@@ -0,0 +1,143 @@
+"""
+HTTP Caching - ETag, Last-Modified and Cache-Control for product responses
+Validators are derived from updated_at of the cached products, so a
+conditional request is answered with 304 without touching the database
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+
+from fastapi import Request, Response, status
+
+from app.config import settings
+
+
+def _parse_updated_at(updated_at: str) -> datetime:
+    """Parse a cached updated_at (naive UTC ISO string) as an aware datetime"""
+    return datetime.fromisoformat(updated_at).replace(tzinfo=timezone.utc)
+
+
+def product_etag(product_id: int, updated_at: str) -> str:
+    """
+    Build the ETag of a product
+    Every write sets updated_at, so (id, updated_at) identifies the representation
+    
+    Args:
+        product_id: Product ID
+        updated_at: Cached updated_at ISO string
+    
+    Returns:
+        Quoted strong ETag
+    """
+    micros = int(_parse_updated_at(updated_at).timestamp() * 1_000_000)
+    return f'"p{product_id}-{micros:x}"'
+
+
+def listing_etag(products: Iterable[dict]) -> str:
+    """
+    Build the ETag of a listing page from the (id, updated_at) of its products
+    Changes when a product on the page is updated, added or removed
+    
+    Args:
+        products: Product data dicts of the page
+    
+    Returns:
+        Quoted strong ETag
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    for product in products:
+        digest.update(f"{product['id']}:{product['updated_at']};".encode())
+    return f'"l-{digest.hexdigest()}"'
+
+
+def http_date(updated_at: str) -> str:
+    """
+    Format a cached updated_at as an HTTP date for Last-Modified
+    
+    Args:
+        updated_at: Cached updated_at ISO string
+    
+    Returns:
+        HTTP date string
+    """
+    return format_datetime(_parse_updated_at(updated_at).replace(microsecond=0), usegmt=True)
+
+
+def cache_headers(etag: str, last_modified: Optional[str] = None) -> Dict[str, str]:
+    """
+    Build validator and Cache-Control headers
+    
+    Browsers revalidate (max-age), while a shared cache in front of the
+    service (CDN, nginx) may serve the response for s-maxage and keep
+    serving it while it revalidates in the background.
+    
+    Args:
+        etag: Quoted ETag
+        last_modified: HTTP date of the last change, if meaningful
+    
+    Returns:
+        Response headers
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, "
+            f"s-maxage={settings.HTTP_CACHE_S_MAXAGE}, "
+            f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+        ),
+    }
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of If-None-Match against an ETag (RFC 9110 13.1.2)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[str] = None) -> bool:
+    """
+    Evaluate If-None-Match, or If-Modified-Since when no ETag was sent
+    
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        last_modified: Current Last-Modified HTTP date, if the resource has one
+    
+    Returns:
+        True if the client's copy is current and 304 should be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    """
+    Build a 304 response carrying the same validators as a 200 would
+    
+    Args:
+        headers: Headers from cache_headers
+    
+    Returns:
+        Empty 304 response
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,101 @@
+"""
+Shared HTTP Client - One pooled async client for all inter-service calls
+Created at startup and closed at shutdown, so calls to other services reuse
+keep-alive connections instead of paying TCP (and TLS) setup per request
+"""
+
+import logging
+from typing import Optional
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceHTTPClient:
+    """
+    Lifecycle-managed httpx.AsyncClient shared by the whole process
+    """
+
+    def __init__(self):
+        """Initialize shared HTTP client holder"""
+        self._client: Optional[httpx.AsyncClient] = None
+        self.http2 = False
+
+    async def start(self):
+        """
+        Create the pooled client
+        """
+        if self._client is None:
+            self._client = self._create_client()
+            logger.info(
+                f"✅ HTTP client pool ready (max {settings.HTTP_CLIENT_MAX_CONNECTIONS} connections, "
+                f"HTTP/2 {'on' if self.http2 else 'off'})"
+            )
+
+    async def close(self):
+        """
+        Close the pooled client and its connections
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get the shared client, created on first use if startup did not run
+        (e.g. scripts and tests)
+        
+        Returns:
+            Shared httpx.AsyncClient
+        """
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    @staticmethod
+    def timeout(seconds: float) -> httpx.Timeout:
+        """
+        Build the timeout of one upstream
+        Connecting is bounded separately, so an unreachable service fails fast
+        
+        Args:
+            seconds: Read/write/pool timeout of the upstream
+            
+        Returns:
+            httpx.Timeout for a request
+        """
+        return httpx.Timeout(seconds, connect=min(seconds, settings.HTTP_CLIENT_CONNECT_TIMEOUT))
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        Create an httpx.AsyncClient from settings
+        
+        Returns:
+            New pooled client
+        """
+        limits = httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        )
+        http2 = settings.HTTP_CLIENT_HTTP2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("⚠️ HTTP_CLIENT_HTTP2 needs the 'h2' package, falling back to HTTP/1.1")
+                http2 = False
+
+        self.http2 = http2
+        return httpx.AsyncClient(
+            limits=limits,
+            http2=http2,
+            timeout=ServiceHTTPClient.timeout(settings.HTTP_CLIENT_TIMEOUT),
+        )
+
+
+# Global shared HTTP client instance
+http_client = ServiceHTTPClient()
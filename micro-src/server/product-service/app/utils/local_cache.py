@@ -0,0 +1,148 @@
+"""
+Local Cache - In-process LRU/TTL cache tier
+Sits in front of Redis so hot products are served from worker memory
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class LocalCache:
+    """
+    Size-bounded LRU cache with per-entry TTL
+
+    Bounded both by number of entries and by an approximate byte budget,
+    so every uvicorn worker has a predictable memory ceiling.
+    Thread-safe: sync routes run in FastAPI's threadpool.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int, ttl: int):
+        """
+        Initialize local cache
+
+        Args:
+            max_items: Maximum number of entries kept in memory
+            max_bytes: Approximate memory budget in bytes
+            ttl: Default time to live in seconds
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from local cache
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[int] = None) -> bool:
+        """
+        Store value in local cache, evicting least recently used entries
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Approximate size of the value in bytes
+            ttl: Time to live in seconds (default from constructor)
+
+        Returns:
+            True if stored, False if the value exceeds the memory budget
+        """
+        if size > self.max_bytes or self.max_items <= 0:
+            return False
+
+        expires_at = time.monotonic() + (ttl or self.ttl)
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+
+            while len(self._entries) > self.max_items or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+        return True
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove entry from local cache
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed, False otherwise
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._bytes -= entry[1]
+            return True
+
+    def clear(self) -> int:
+        """
+        Remove all entries
+
+        Returns:
+            Number of removed entries
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return count
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with size, memory usage and hit/miss counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "items": len(self._entries),
+                "max_items": self.max_items,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
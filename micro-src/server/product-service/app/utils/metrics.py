@@ -0,0 +1,39 @@
+"""
+Prometheus Metrics - Custom application metrics for Product Service
+Exposed on /metrics together with the default HTTP instrumentation
+"""
+
+from prometheus_client import Counter
+
+# Cache lookups per tier ("local", "redis", "any") and result ("hit", "miss", "stale")
+CACHE_REQUESTS = Counter(
+    "product_cache_requests_total",
+    "Product cache lookups by tier and result",
+    ["tier", "result"],
+)
+
+# Cache misses that joined a load already in flight instead of querying the database
+CACHE_COALESCED = Counter(
+    "product_cache_coalesced_total",
+    "Product cache loads coalesced into an in-flight load",
+)
+
+# Product listing page lookups by result ("hit", "miss")
+LISTING_CACHE_REQUESTS = Counter(
+    "product_listing_cache_requests_total",
+    "Product listing cache lookups by result",
+    ["result"],
+)
+
+# Hot stock reservations decided in Redis by result ("reserved", "insufficient")
+HOT_STOCK_RESERVATIONS = Counter(
+    "product_hot_stock_reservations_total",
+    "Hot product reservations decided by the Redis counter",
+    ["result"],
+)
+
+# Stock units written to the database by hot stock reconciliation
+HOT_STOCK_RECONCILED_UNITS = Counter(
+    "product_hot_stock_reconciled_units_total",
+    "Absolute stock change written to the database by hot stock reconciliation",
+)
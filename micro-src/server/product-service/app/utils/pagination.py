@@ -0,0 +1,71 @@
+"""
+Cursor Pagination - Opaque keyset cursors for list endpoints
+A cursor encodes the sort key of the last row of a page, so the next page
+is read with an index range scan instead of OFFSET
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import NamedTuple, Optional, Union
+
+
+class Cursor(NamedTuple):
+    """Sort key of the last row of a page"""
+
+    id: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+def encode_cursor(
+    id: int,
+    created_at: Union[datetime, str, None] = None,
+    updated_at: Union[datetime, str, None] = None
+) -> str:
+    """
+    Encode the last row of a page as an opaque cursor
+    
+    Args:
+        id: ID of the last row
+        created_at: Creation time of the last row, if it is part of the sort key
+        updated_at: Update time of the last row, if it is part of the sort key
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = {"id": id}
+    for name, value in (("created_at", created_at), ("updated_at", updated_at)):
+        if value is not None:
+            payload[name] = value if isinstance(value, str) else value.isoformat()
+
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode a cursor produced by encode_cursor
+    
+    Args:
+        cursor: Cursor string from the client
+        
+    Returns:
+        Decoded cursor
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        created_at = payload.get("created_at")
+        updated_at = payload.get("updated_at")
+        return Cursor(
+            id=int(payload["id"]),
+            created_at=datetime.fromisoformat(created_at) if created_at else None,
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError("Invalid cursor") from e
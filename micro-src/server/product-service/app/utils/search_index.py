@@ -0,0 +1,245 @@
+"""
+Suggest Index - In-process prefix index for product autocomplete
+Inverted index over product name and description words, with a sorted
+term list for prefix lookups, so typeahead never touches the database
+"""
+
+import bisect
+import heapq
+import re
+import threading
+import unicodedata
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+_WORD = re.compile(r"\w+")
+
+# Rough per-entry overhead of dicts, sets and tuples, for the memory budget
+_DOC_OVERHEAD = 200
+_POSTING_OVERHEAD = 80
+
+
+def normalize(text: Optional[str]) -> List[str]:
+    """
+    Split text into lowercase words without diacritics
+    "Chuột không dây" -> ["chuot", "khong", "day"], so users can type without accents
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of words
+    """
+    if not text:
+        return []
+    folded = unicodedata.normalize("NFD", text.lower().replace("đ", "d"))
+    folded = "".join(char for char in folded if not unicodedata.combining(char))
+    return _WORD.findall(folded)
+
+
+class SuggestIndex:
+    """
+    Prefix-searchable inverted index of products
+
+    Each word maps to the set of products containing it; a sorted list of
+    all words turns a prefix into a contiguous range found with bisect.
+    Bounded by an approximate byte budget: products that do not fit are
+    not indexed and the index reports itself as truncated.
+    Thread-safe: builds run in the threadpool while requests read.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize empty index
+
+        Args:
+            max_bytes: Approximate memory budget in bytes
+        """
+        self.max_bytes = max_bytes
+        self.ready = False
+        self.truncated = False
+        self._lock = threading.Lock()
+        # product ID -> (name, name words, all words)
+        self._docs: Dict[int, Tuple[str, FrozenSet[str], FrozenSet[str]]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._terms: List[str] = []
+        self._bytes = 0
+
+    @staticmethod
+    def _size_of(name: str, terms: FrozenSet[str]) -> int:
+        """Approximate memory used by one indexed product"""
+        return _DOC_OVERHEAD + len(name) + sum(len(term) + _POSTING_OVERHEAD for term in terms)
+
+    @staticmethod
+    def _document(name: str, description: Optional[str]) -> Tuple[FrozenSet[str], FrozenSet[str], int]:
+        """
+        Tokenize a product
+
+        Returns:
+            Tuple of (name words, all words, approximate size in bytes)
+        """
+        name_terms = frozenset(normalize(name))
+        terms = name_terms | frozenset(normalize(description))
+        return name_terms, terms, SuggestIndex._size_of(name, terms)
+
+    def build(self, products: Iterable[Tuple[int, str, Optional[str]]]) -> dict:
+        """
+        Build a fresh index and swap it in
+        Readers keep using the old index until the new one is complete
+
+        Args:
+            products: Iterable of (id, name, description), e.g. a streaming query
+
+        Returns:
+            Index statistics after the build
+        """
+        docs: Dict[int, Tuple[str, FrozenSet[str], FrozenSet[str]]] = {}
+        postings: Dict[str, Set[int]] = {}
+        total = 0
+        truncated = False
+
+        for product_id, name, description in products:
+            name_terms, terms, size = self._document(name, description)
+            if total + size > self.max_bytes:
+                truncated = True
+                continue
+            docs[product_id] = (name, name_terms, terms)
+            for term in terms:
+                postings.setdefault(term, set()).add(product_id)
+            total += size
+
+        with self._lock:
+            self._docs = docs
+            self._postings = postings
+            self._terms = sorted(postings)
+            self._bytes = total
+            self.truncated = truncated
+            self.ready = True
+
+        return self.stats()
+
+    def upsert(self, product_id: int, name: str, description: Optional[str]) -> bool:
+        """
+        Add or replace one product
+
+        Args:
+            product_id: Product ID
+            name: Product name
+            description: Product description
+
+        Returns:
+            True if indexed, False if it does not fit the memory budget
+        """
+        name_terms, terms, size = self._document(name, description)
+
+        with self._lock:
+            self._remove_locked(product_id)
+            if self._bytes + size > self.max_bytes:
+                self.truncated = True
+                return False
+
+            self._docs[product_id] = (name, name_terms, terms)
+            for term in terms:
+                ids = self._postings.get(term)
+                if ids is None:
+                    self._postings[term] = {product_id}
+                    bisect.insort(self._terms, term)
+                else:
+                    ids.add(product_id)
+            self._bytes += size
+            return True
+
+    def remove(self, product_id: int) -> bool:
+        """
+        Remove one product
+
+        Args:
+            product_id: Product ID
+
+        Returns:
+            True if the product was indexed
+        """
+        with self._lock:
+            return self._remove_locked(product_id)
+
+    def _remove_locked(self, product_id: int) -> bool:
+        """Remove one product, caller holds the lock"""
+        doc = self._docs.pop(product_id, None)
+        if doc is None:
+            return False
+
+        name, _, terms = doc
+        for term in terms:
+            ids = self._postings.get(term)
+            if ids is None:
+                continue
+            ids.discard(product_id)
+            if not ids:
+                del self._postings[term]
+                index = bisect.bisect_left(self._terms, term)
+                if index < len(self._terms) and self._terms[index] == term:
+                    del self._terms[index]
+        self._bytes -= self._size_of(name, terms)
+        return True
+
+    def _matching_ids(self, prefix: str) -> Set[int]:
+        """Products with a word starting with prefix, caller holds the lock"""
+        start = bisect.bisect_left(self._terms, prefix)
+        end = bisect.bisect_left(self._terms, prefix + "\U0010ffff", lo=start)
+        matched: Set[int] = set()
+        for term in self._terms[start:end]:
+            matched |= self._postings[term]
+        return matched
+
+    def suggest(self, query: str, limit: int = 10) -> List[dict]:
+        """
+        Find products whose words start with every word of the query
+
+        Products matching all words in the name rank first, then shorter
+        names, then lower IDs.
+
+        Args:
+            query: Text typed by the user
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of {"id", "name"} dicts
+        """
+        prefixes = normalize(query)
+        if not prefixes:
+            return []
+
+        with self._lock:
+            # Most selective prefix first keeps the intersections small
+            candidate_sets = sorted((self._matching_ids(prefix) for prefix in prefixes), key=len)
+            candidates = set(candidate_sets[0])
+            for ids in candidate_sets[1:]:
+                candidates &= ids
+                if not candidates:
+                    return []
+
+            def rank(product_id: int) -> Tuple[int, int, int]:
+                name, name_terms, _ = self._docs[product_id]
+                in_name = all(
+                    any(term.startswith(prefix) for term in name_terms) for prefix in prefixes
+                )
+                return (0 if in_name else 1, len(name), product_id)
+
+            best = heapq.nsmallest(limit, candidates, key=rank)
+            return [{"id": product_id, "name": self._docs[product_id][0]} for product_id in best]
+
+    def stats(self) -> dict:
+        """
+        Get index statistics
+
+        Returns:
+            Dict with size, memory usage and state
+        """
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "products": len(self._docs),
+                "terms": len(self._terms),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "truncated": self.truncated,
+            }
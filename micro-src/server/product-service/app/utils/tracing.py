@@ -13,6 +13,7 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 from opentelemetry.instrumentation.redis import RedisInstrumentor
+from opentelemetry.instrumentation.aio_pika import AioPikaInstrumentor
 
 
 def setup_tracing(app, service_name: str, service_version: str = "1.0.0"):
@@ -61,6 +62,9 @@ def setup_tracing(app, service_name: str, service_version: str = "1.0.0"):
     
     # Instrument Redis
     RedisInstrumentor().instrument()
+
+    # Instrument RabbitMQ (aio-pika)
+    AioPikaInstrumentor().instrument()
     
     print(f"✅ OpenTelemetry tracing configured for {service_name}")
     print(f"📊 Traces will be sent to: {jaeger_endpoint}")
@@ -4,13 +4,30 @@ set -e
 echo "Waiting for database..."
 sleep 5
 
-# Create versions directory if not exists
-mkdir -p /app/alembic/versions
+# Databases created before the versioned migrations already have the products
+# table, but no revision (or an autogenerated one that no longer exists):
+# mark them as being at 001 so the upgrade only runs the later migrations
+if python - <<'PY'
+import sys
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+from app.config import settings
 
-# Check if migrations exist
-if [ ! "$(ls -A /app/alembic/versions)" ]; then
-    echo "No migrations found, creating initial migration..."
-    alembic revision --autogenerate -m "Create products table"
+engine = create_engine(settings.DATABASE_URL)
+with engine.connect() as conn:
+    tables = inspect(conn).get_table_names()
+    if "products" not in tables:
+        sys.exit(1)
+    current = None
+    if "alembic_version" in tables:
+        current = conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+known = {script.revision for script in ScriptDirectory.from_config(Config("alembic.ini")).walk_revisions()}
+sys.exit(0 if current not in known else 1)
+PY
+then
+    echo "Existing database without a known migration revision, stamping 001..."
+    alembic stamp --purge 001
 fi
 
 echo "Running database migrations..."
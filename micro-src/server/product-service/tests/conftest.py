@@ -0,0 +1,5 @@
+"""Shared test setup for Product Service."""
+import os
+
+# Tests run against in-memory SQLite, not the service's PostgreSQL
+os.environ["DATABASE_URL"] = "sqlite://"
@@ -0,0 +1,153 @@
+"""Tests for bulk product import: upload parsing and upsert."""
+import asyncio
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models.product import Product
+from app.repositories.product_repository import ProductRepository
+from app.utils.bulk_import import BulkImportError, iter_upload_rows
+
+
+def parse(body: bytes, upload_format: str, chunk_size: int = 7):
+    """Parse an upload fed in small chunks, as the request body stream would."""
+    async def chunks():
+        for start in range(0, len(body), chunk_size):
+            yield body[start:start + chunk_size]
+
+    async def collect():
+        return [parsed async for parsed in iter_upload_rows(chunks(), upload_format)]
+
+    return asyncio.run(collect())
+
+
+def test_csv_rows():
+    """CSV rows map to dicts; quoted fields may span lines."""
+    body = b'name,price,quantity,description\nPen,1.50,10,"Blue,\nfine tip"\nCup,3,0,\n'
+
+    assert parse(body, "csv") == [
+        (2, {"name": "Pen", "price": "1.50", "quantity": "10", "description": "Blue,\nfine tip"}, None),
+        (4, {"name": "Cup", "price": "3", "quantity": "0"}, None),
+    ]
+
+
+def test_csv_without_description_column():
+    """A CSV without a description column yields rows without the key."""
+    rows = parse(b"id,name,price,quantity\n5,Pen,2,1\n", "csv")
+
+    assert rows == [(2, {"id": "5", "name": "Pen", "price": "2", "quantity": "1"}, None)]
+
+
+def test_csv_bad_record_is_row_error():
+    """A record with the wrong number of cells is reported, later rows still parse."""
+    rows = parse(b"name,price,quantity\nPen,2\nCup,3,1\n", "csv")
+
+    assert rows[0][0] == 2 and rows[0][1] is None and rows[0][2]
+    assert rows[1] == (3, {"name": "Cup", "price": "3", "quantity": "1"}, None)
+
+
+def test_csv_missing_required_column():
+    """A header without a required column rejects the whole upload."""
+    with pytest.raises(BulkImportError):
+        parse(b"name,price\nPen,2\n", "csv")
+
+
+def test_ndjson_rows():
+    """One object per line; blank lines are skipped, bad lines become errors."""
+    body = b'{"name": "Pen", "price": 2, "quantity": 1}\n\nnot json\n[1]\n{"name": "Cup", "price": 3, "quantity": 0}'
+
+    rows = parse(body, "ndjson")
+
+    assert rows[0] == (1, {"name": "Pen", "price": 2, "quantity": 1}, None)
+    assert [(line, row) for line, row, _ in rows[1:3]] == [(3, None), (4, None)]
+    assert rows[3] == (5, {"name": "Cup", "price": 3, "quantity": 0}, None)
+
+
+@pytest.fixture
+def repository():
+    """Product repository on a fresh in-memory SQLite database."""
+    # One shared connection: the service writes from a threadpool
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        yield ProductRepository(db)
+    finally:
+        db.close()
+
+
+def test_upsert_creates_and_updates(repository):
+    """Rows with an unknown ID or no ID are created, known IDs are updated."""
+    created, updated = repository.bulk_upsert([
+        {"id": 7, "name": "Pen", "price": Decimal("2"), "quantity": 1, "description": "Blue"},
+        {"name": "Cup", "price": Decimal("3"), "quantity": 0},
+    ])
+    assert updated == [] and len(created) == 2
+
+    created, updated = repository.bulk_upsert([
+        {"id": 7, "name": "Red pen", "price": Decimal("2.5"), "quantity": 4, "description": "Red"},
+    ])
+    assert (created, updated) == ([], [7])
+
+    product = repository.db.get(Product, 7)
+    assert (product.name, product.price, product.quantity, product.description) == (
+        "Red pen", Decimal("2.50"), 4, "Red"
+    )
+
+
+def test_upsert_keeps_omitted_description(repository):
+    """A row without description leaves the stored one; an explicit None clears it."""
+    repository.bulk_upsert([
+        {"id": 1, "name": "Pen", "price": Decimal("2"), "quantity": 1, "description": "Blue"},
+        {"id": 2, "name": "Cup", "price": Decimal("3"), "quantity": 1, "description": "Mug"},
+    ])
+
+    repository.bulk_upsert([
+        {"id": 1, "name": "Pen", "price": Decimal("2"), "quantity": 9},
+        {"id": 2, "name": "Cup", "price": Decimal("3"), "quantity": 1, "description": None},
+    ])
+    repository.db.expire_all()
+
+    pen = repository.db.get(Product, 1)
+    assert (pen.quantity, pen.description) == (9, "Blue")
+    assert repository.db.get(Product, 2).description is None
+
+
+def test_upsert_schema_bounds_price():
+    """Prices that would overflow NUMERIC(10,2) fail validation, not the database."""
+    from pydantic import ValidationError
+    from app.schemas import ProductUpsert
+
+    with pytest.raises(ValidationError):
+        ProductUpsert(name="Pen", price=Decimal("123456789.00"), quantity=1)
+    with pytest.raises(ValidationError):
+        ProductUpsert(name="Pen", price=Decimal("1.005"), quantity=1)
+    assert ProductUpsert(name="Pen", price=Decimal("99999999.99"), quantity=1).price == Decimal("99999999.99")
+
+
+def test_rejected_row_does_not_fail_its_chunk(repository):
+    """A row the database rejects is reported alone; the rest of the chunk is written."""
+    from app.services.product_service import ProductService
+
+    service = ProductService(repository.db)
+    bulk_upsert = repository.bulk_upsert
+    # NULL name violates the NOT NULL constraint, failing the whole statement
+    service.product_repository.bulk_upsert = lambda products: bulk_upsert(
+        [dict(p, name=None) if p["name"] == "Bad" else p for p in products]
+    )
+    chunk = [
+        (1, {"name": "Pen", "price": Decimal("2"), "quantity": 1}),
+        (2, {"name": "Bad", "price": Decimal("2"), "quantity": 1}),
+        (3, {"name": "Cup", "price": Decimal("3"), "quantity": 0}),
+    ]
+    report = {"failed": 0, "errors": [], "errors_truncated": False}
+
+    created, updated = asyncio.run(service._write_rows(chunk, report))
+
+    assert (len(created), updated, report["failed"]) == (2, [], 1)
+    assert report["errors"][0]["line"] == 2
+    assert sorted(p.name for p in repository.db.query(Product)) == ["Cup", "Pen"]
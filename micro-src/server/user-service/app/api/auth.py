@@ -2,16 +2,65 @@
 Authentication Routes - Endpoints for registration, login and token validation
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm
+import logging
+import secrets
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
+from app.config import settings
+
 from app.database import get_db
-from app.schemas import UserCreate, UserResponse, Token, TokenValidationRequest, TokenValidationResponse
+from app.schemas import (
+    UserCreate,
+    UserResponse,
+    Token,
+    TokenValidationRequest,
+    TokenValidationResponse,
+    TokenDenyListResponse,
+    JWKSResponse,
+)
 from app.services import AuthService
+from app.utils.password_hasher import PasswordHasherBusyError
+from app.utils.rabbitmq import USER_DEACTIVATED, publish_user_event
+from app.utils.signing_keys import is_asymmetric, signing_key_ring
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Authentication"])
 
+# OAuth2 scheme to get token from header
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
+
+
+def require_internal_service(x_service_token: Optional[str] = Header(None)):
+    """
+    Dependency to restrict an endpoint to other services of the platform
+    
+    Args:
+        x_service_token: Shared INTERNAL_SERVICE_TOKEN sent by the caller
+    
+    Raises:
+        HTTPException: 403 if the token is missing or wrong
+    """
+    if not x_service_token or not secrets.compare_digest(x_service_token, settings.INTERNAL_SERVICE_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Endpoint chỉ dành cho các service nội bộ"
+        )
+
+
+def _busy_exception(error: PasswordHasherBusyError) -> HTTPException:
+    """429 response asking the client to retry once the hashing pool drains"""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=str(error),
+        headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER)},
+    )
+
 
 @router.post(
     "/register",
@@ -20,7 +69,7 @@ router = APIRouter(tags=["Authentication"])
     summary="Register new user",
     description="Create new user account with username and password"
 )
-def register(
+async def register(
     user_data: UserCreate,
     db: Session = Depends(get_db)
 ):
@@ -37,17 +86,20 @@ def register(
     **Errors:**
     - 400: Username already exists
     - 422: Validation error
+    - 429: Password hashing pool saturated (see Retry-After)
     """
     auth_service = AuthService(db)
 
     try:
-        user = auth_service.register_user(user_data)
+        user = await auth_service.register_user(user_data)
         return user
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordHasherBusyError as e:
+        raise _busy_exception(e)
 
 
 @router.post(
@@ -56,7 +108,7 @@ def register(
     summary="Login",
     description="Login and receive JWT access token"
 )
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
@@ -73,6 +125,7 @@ def login(
     
     **Errors:**
     - 401: Username or password incorrect
+    - 429: Password hashing pool saturated (see Retry-After)
     
     **How to use token:**
     ```
@@ -82,7 +135,7 @@ def login(
     auth_service = AuthService(db)
 
     try:
-        token = auth_service.login(form_data.username, form_data.password)
+        token = await auth_service.login(form_data.username, form_data.password)
         return token
     except ValueError as e:
         raise HTTPException(
@@ -90,6 +143,8 @@ def login(
             detail=str(e),
             headers={"WWW-Authenticate": "Bearer"},
         )
+    except PasswordHasherBusyError as e:
+        raise _busy_exception(e)
 
 
 @router.post(
@@ -136,3 +191,105 @@ def validate_token(
             user_id=None,
             message="Token is invalid or expired"
         )
+
+
+@router.get(
+    "/token-denylist",
+    response_model=TokenDenyListResponse,
+    summary="Token deny-list",
+    description="Users whose tokens must be rejected by services that verify JWT locally (internal, requires X-Service-Token)",
+    dependencies=[Depends(require_internal_service)]
+)
+def get_token_denylist(db: Session = Depends(get_db)):
+    """
+    Get the token deny-list
+    
+    **Headers:**
+    - **X-Service-Token**: Shared INTERNAL_SERVICE_TOKEN (403 otherwise)
+    
+    **Response:**
+    - **user_ids**: Users deactivated within the token lifetime; their
+      tokens still carry a valid signature and expiry
+    - **generated_at**: When the list was computed
+    
+    **Use Case:**
+    - Product Service and Order Service verify the JWT signature and expiry
+      themselves (AUTH_MODE=local) and cache this list instead of calling
+      `/validate-token` on every request
+    """
+    auth_service = AuthService(db)
+    return TokenDenyListResponse(
+        user_ids=auth_service.get_denied_user_ids(),
+        generated_at=datetime.utcnow()
+    )
+
+
+@router.get(
+    "/.well-known/jwks.json",
+    response_model=JWKSResponse,
+    summary="Public signing keys",
+    description="JSON Web Key Set for verifying tokens signed with RS256/ES256"
+)
+def get_jwks(response: Response):
+    """
+    Get the public keys that verify access tokens
+    
+    **Response:**
+    - **keys**: One JWK per signing key; tokens name theirs in the `kid` header.
+      Empty when tokens are signed with the shared HS256 `SECRET_KEY`
+    
+    **Use Case:**
+    - Product Service and Order Service verify tokens locally with these
+      keys instead of sharing `SECRET_KEY`; they cache the set and refetch it
+      when a token names an unknown `kid` (key rotation)
+    """
+    response.headers["Cache-Control"] = f"public, max-age={settings.JWKS_CACHE_MAX_AGE}"
+    return JWKSResponse(keys=signing_key_ring.jwks() if is_asymmetric() else [])
+
+
+@router.post(
+    "/me/deactivate",
+    response_model=UserResponse,
+    summary="Deactivate own account",
+    description="Deactivate the current user; all of the user's tokens stop working"
+)
+async def deactivate_me(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+):
+    """
+    Deactivate the current user's account
+    
+    **Response:**
+    - The deactivated user (is_active = false)
+    
+    **Errors:**
+    - 401: Token invalid or expired
+    
+    **Side effects:**
+    - A `user.deactivated` event is published so Order Service and Product
+      Service purge cached validation results of the user's tokens at once
+    """
+    auth_service = AuthService(db)
+
+    user = await run_in_threadpool(auth_service.validate_token_with_user, token)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Không thể xác thực thông tin đăng nhập",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user = await run_in_threadpool(auth_service.deactivate_user, user)
+
+    # Caches expire on their own, so a lost event only delays revocation
+    if settings.USER_EVENTS_ENABLED:
+        try:
+            await publish_user_event(USER_DEACTIVATED, {
+                "user_id": user.id,
+                "username": user.username,
+            })
+        except Exception as e:
+            logger.error(f"❌ Failed to publish {USER_DEACTIVATED} event: {e}")
+
+    return user
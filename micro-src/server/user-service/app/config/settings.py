@@ -19,9 +19,30 @@ class Settings(BaseSettings):
 
     # JWT Configuration
     SECRET_KEY: str = "your-secret-key-change-this-in-production-min-32-characters"
-    ALGORITHM: str = "HS256"
+    ALGORITHM: str = "HS256"  # HS256 (shared SECRET_KEY) or RS256/ES256 (key pairs, published as JWKS)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Asymmetric Signing Keys (RS*/ES* only)
+    JWT_KEYS_DIR: str = ""  # One private key PEM per key ID: <kid>.pem; empty = in-memory dev key
+    JWT_ACTIVE_KID: str = ""  # Key that signs new tokens; empty = last file name in sort order
+    JWKS_CACHE_MAX_AGE: int = 300  # Cache-Control max-age of /.well-known/jwks.json
+
+    # Internal Endpoints (/token-denylist), called by Order/Product Service
+    INTERNAL_SERVICE_TOKEN: str = "your-internal-service-token-change-this-in-production"  # Sent as X-Service-Token
+
+    # Password Hashing (bcrypt in a dedicated process pool)
+    PASSWORD_HASH_WORKERS: int = 2  # Processes per service worker; at most one CPU core each
+    PASSWORD_HASH_MAX_QUEUE: int = 32  # Jobs waiting for a process; more are rejected with 429
+    PASSWORD_HASH_RETRY_AFTER: int = 1  # Retry-After seconds of 429 responses
+
+    # RabbitMQ Configuration (user events)
+    RABBITMQ_HOST: str = "localhost"
+    RABBITMQ_PORT: int = 5672
+    RABBITMQ_USER: str = "guest"
+    RABBITMQ_PASSWORD: str = "guest"
+    RABBITMQ_EXCHANGE: str = "user_events"
+    USER_EVENTS_ENABLED: bool = True  # Publish user.deactivated so other services purge cached tokens
+
     # Application Configuration
     APP_NAME: str = "User Service"
     APP_VERSION: str = "1.0.0"
@@ -9,6 +9,9 @@ from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.config import settings
 from app.api import auth
+from app.utils.password_hasher import password_hasher
+from app.utils.rabbitmq import rabbitmq_publisher
+from app.utils.signing_keys import is_asymmetric, signing_key_ring
 from app.utils.tracing import setup_tracing
 
 # Create FastAPI application
@@ -24,6 +27,9 @@ app = FastAPI(
     - **POST /register** - Register new user account
     - **POST /login** - Login and receive JWT token
     - **POST /validate-token** - Validate JWT token
+    - **GET /token-denylist** - Users whose tokens must be rejected (internal)
+    - **GET /.well-known/jwks.json** - Public keys of RS256/ES256 tokens
+    - **POST /me/deactivate** - Deactivate own account (requires JWT)
     - **GET /health** - Health check endpoint
     
     ### Architecture:
@@ -87,6 +93,7 @@ def health_check():
         "status": "healthy",
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
+        "password_hashing": password_hasher.stats(),
     }
 
 
@@ -98,8 +105,31 @@ async def startup_event():
     print(f"📚 API Documentation: http://localhost:{settings.PORT}/docs")
     print(f"📖 ReDoc Documentation: http://localhost:{settings.PORT}/redoc")
 
+    # Fail fast on missing or invalid signing keys
+    if is_asymmetric():
+        signing_key_ring.load()
+        print(f"🔑 Tokens signed with {settings.ALGORITHM}, public keys at /.well-known/jwks.json")
+
+    # bcrypt runs in its own processes, off the event loop and threadpool
+    password_hasher.start()
+
+    # Connect to RabbitMQ for user events
+    if settings.USER_EVENTS_ENABLED:
+        try:
+            await rabbitmq_publisher.connect()
+            print("✅ RabbitMQ connected successfully")
+        except Exception as e:
+            print(f"⚠️ RabbitMQ unavailable, user events won't be published: {e}")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Event handler when application shuts down"""
     print(f"🛑 {settings.APP_NAME} is shutting down...")
+
+    await password_hasher.close()
+
+    try:
+        await rabbitmq_publisher.close()
+    except Exception as e:
+        print(f"❌ Error closing RabbitMQ connection: {e}")
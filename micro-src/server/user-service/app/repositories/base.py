@@ -32,8 +32,8 @@ class BaseRepository(Generic[ModelType]):
         return self.db.query(self.model).filter(self.model.id == id).first()
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        """Get all entities with pagination"""
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        """Get all entities with pagination, ordered by ID"""
+        return self.db.query(self.model).order_by(self.model.id).offset(skip).limit(limit).all()
 
     def create(self, obj_data: Dict[str, Any]) -> ModelType:
         """
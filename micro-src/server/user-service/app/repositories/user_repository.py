@@ -2,7 +2,8 @@
 User Repository - Data Access Layer for User model
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.models import User
@@ -51,6 +52,22 @@ class UserRepository(BaseRepository[User]):
             User.is_active == True
         ).first()
 
+    def get_deactivated_user_ids(self, since: datetime) -> List[int]:
+        """
+        Get IDs of users deactivated since a point in time
+        
+        Args:
+            since: Oldest deactivation (last update) to include
+            
+        Returns:
+            List of user IDs
+        """
+        rows = self.db.query(User.id).filter(
+            User.is_active == False,
+            User.updated_at >= since
+        ).all()
+        return [row.id for row in rows]
+
     def exists_by_username(self, username: str) -> bool:
         """
         Check if username already exists
@@ -8,7 +8,9 @@ from app.schemas.user import (
     Token,
     TokenData,
     TokenValidationRequest,
-    TokenValidationResponse
+    TokenValidationResponse,
+    TokenDenyListResponse,
+    JWKSResponse
 )
 
 __all__ = [
@@ -17,5 +19,7 @@ __all__ = [
     "Token",
     "TokenData",
     "TokenValidationRequest",
-    "TokenValidationResponse"
+    "TokenValidationResponse",
+    "TokenDenyListResponse",
+    "JWKSResponse"
 ]
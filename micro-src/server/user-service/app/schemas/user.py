@@ -3,7 +3,7 @@ User Schemas - Pydantic models for request/response validation
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -58,3 +58,14 @@ class TokenValidationResponse(BaseModel):
     username: Optional[str] = None
     user_id: Optional[int] = None
     message: Optional[str] = None
+
+
+class TokenDenyListResponse(BaseModel):
+    """Schema for the deny-list of services that verify tokens locally"""
+    user_ids: List[int] = Field(..., description="Users whose unexpired tokens must be rejected")
+    generated_at: datetime
+
+
+class JWKSResponse(BaseModel):
+    """Schema for the public signing keys (JSON Web Key Set, RFC 7517)"""
+    keys: List[Dict[str, Any]] = Field(..., description="Public keys, identified by kid")
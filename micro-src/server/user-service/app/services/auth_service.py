@@ -3,19 +3,19 @@ Auth Service - Business Logic for Authentication
 Handles registration, login, and JWT token generation
 """
 
-from datetime import timedelta
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.models import User
 from app.schemas import UserCreate, Token
 from app.repositories import UserRepository
 from app.utils import (
-    get_password_hash,
-    verify_password,
     create_access_token,
     decode_access_token,
 )
+from app.utils.password_hasher import password_hasher
 from app.config import settings
 
 
@@ -35,9 +35,10 @@ class AuthService:
         self.db = db
         self.user_repository = UserRepository(db)
 
-    def register_user(self, user_data: UserCreate) -> User:
+    async def register_user(self, user_data: UserCreate) -> User:
         """
         Register new user
+        Password hashing runs in the hashing process pool
         
         Args:
             user_data: Registration data (username, password)
@@ -47,16 +48,17 @@ class AuthService:
             
         Raises:
             ValueError: If username already exists
+            PasswordHasherBusyError: If the hashing pool is saturated
         """
         # Check if username already exists
-        if self.user_repository.exists_by_username(user_data.username):
+        if await run_in_threadpool(self.user_repository.exists_by_username, user_data.username):
             raise ValueError(
                 f"Username '{user_data.username}' đã tồn tại. "
                 "Vui lòng chọn username khác."
             )
 
         # Hash password
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await password_hasher.hash(user_data.password)
 
         # Create new user
         user_dict = {
@@ -65,9 +67,9 @@ class AuthService:
             "is_active": True,
         }
 
-        return self.user_repository.create(user_dict)
+        return await run_in_threadpool(self.user_repository.create, user_dict)
 
-    def authenticate_user(
+    async def authenticate_user(
         self,
         username: str,
         password: str
@@ -81,15 +83,18 @@ class AuthService:
             
         Returns:
             User if authentication successful, None if failed
+            
+        Raises:
+            PasswordHasherBusyError: If the hashing pool is saturated
         """
         # Get user from database
-        user = self.user_repository.get_active_user_by_username(username)
+        user = await run_in_threadpool(self.user_repository.get_active_user_by_username, username)
 
         # Check user exists and password is correct
         if not user:
             return None
 
-        if not verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             return None
 
         return user
@@ -104,13 +109,14 @@ class AuthService:
         Returns:
             JWT token response
         """
-        # Create token with username in 'sub' claim
+        # Create token with username in 'sub' claim and user ID in 'uid',
+        # so other services can authenticate it without calling back
         access_token_expires = timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
 
         access_token = create_access_token(
-            data={"sub": user.username},
+            data={"sub": user.username, "uid": user.id},
             expires_delta=access_token_expires
         )
 
@@ -119,7 +125,7 @@ class AuthService:
             token_type="bearer"
         )
 
-    def login(self, username: str, password: str) -> Token:
+    async def login(self, username: str, password: str) -> Token:
         """
         Login and return JWT token
         
@@ -132,9 +138,10 @@ class AuthService:
             
         Raises:
             ValueError: If username or password is incorrect
+            PasswordHasherBusyError: If the hashing pool is saturated
         """
         # Authenticate user
-        user = self.authenticate_user(username, password)
+        user = await self.authenticate_user(username, password)
 
         if not user:
             raise ValueError("Username hoặc password không đúng")
@@ -163,6 +170,35 @@ class AuthService:
             
         return username
 
+    def get_denied_user_ids(self) -> List[int]:
+        """
+        Get users whose unexpired tokens must be rejected
+        
+        Tokens live at most ACCESS_TOKEN_EXPIRE_MINUTES, so only users
+        deactivated within that window can still hold a valid-looking
+        token; the list stays small however many users were ever deactivated.
+        
+        Returns:
+            List of deactivated user IDs
+        """
+        since = datetime.utcnow() - timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        return self.user_repository.get_deactivated_user_ids(since)
+
+    def deactivate_user(self, user: User) -> User:
+        """
+        Deactivate a user account
+        
+        The user's tokens are rejected from now on: /validate-token only
+        accepts active users and the user appears in the deny-list.
+        
+        Args:
+            user: User to deactivate
+            
+        Returns:
+            Deactivated user
+        """
+        return self.user_repository.update(user.id, {"is_active": False})
+
     def validate_token_with_user(self, token: str) -> Optional[User]:
         """
         Validate JWT token and return User object
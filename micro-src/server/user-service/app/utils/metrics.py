@@ -0,0 +1,39 @@
+"""
+Prometheus Metrics - Custom application metrics for User Service
+Exposed on /metrics together with the default HTTP instrumentation
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Size of the password hashing process pool
+PASSWORD_HASH_WORKERS = Gauge(
+    "user_password_hash_workers",
+    "Processes in the password hashing pool",
+)
+
+# Hash/verify jobs running in the pool or waiting for a free process
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "user_password_hash_in_flight",
+    "Password hashing jobs running or queued",
+)
+
+# Jobs waiting for a free process
+PASSWORD_HASH_QUEUED = Gauge(
+    "user_password_hash_queued",
+    "Password hashing jobs waiting for a free process",
+)
+
+# Jobs rejected because the queue was full, by operation ("hash", "verify")
+PASSWORD_HASH_REJECTED = Counter(
+    "user_password_hash_rejected_total",
+    "Password hashing jobs rejected because the pool was saturated",
+    ["operation"],
+)
+
+# Time from submission to result, including queueing, by operation
+PASSWORD_HASH_DURATION = Histogram(
+    "user_password_hash_duration_seconds",
+    "Password hashing latency including time spent queued",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
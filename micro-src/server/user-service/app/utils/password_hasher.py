@@ -0,0 +1,155 @@
+"""
+Password Hasher - bcrypt in a dedicated, size-limited process pool
+bcrypt costs tens to hundreds of ms of CPU per call; running it in worker
+processes keeps the event loop and the threadpool of sync routes (e.g.
+/validate-token) free, and sidesteps the GIL. At most PASSWORD_HASH_WORKERS
+jobs run and PASSWORD_HASH_MAX_QUEUE wait; further jobs are rejected at once
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+from app.config import settings
+from app.utils.metrics import (
+    PASSWORD_HASH_DURATION,
+    PASSWORD_HASH_IN_FLIGHT,
+    PASSWORD_HASH_QUEUED,
+    PASSWORD_HASH_REJECTED,
+    PASSWORD_HASH_WORKERS,
+)
+from app.utils.security import get_password_hash, verify_password
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the hashing pool and its queue are full"""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hash/verify jobs in a process pool with load-shedding
+    """
+
+    def __init__(self):
+        """Initialize hasher; the pool is created by start() or on first use"""
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self._closed = False
+
+    def start(self):
+        """
+        Create the process pool
+        Processes are spawned, not forked, so they never inherit the
+        event loop or locks held by other threads
+        """
+        if self._pool is not None:
+            return
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        PASSWORD_HASH_WORKERS.set(settings.PASSWORD_HASH_WORKERS)
+        logger.info(
+            f"🔐 Password hashing pool: {settings.PASSWORD_HASH_WORKERS} processes, "
+            f"queue limit {settings.PASSWORD_HASH_MAX_QUEUE}"
+        )
+
+    async def close(self):
+        """
+        Shut down the process pool, waiting for running jobs
+        The wait happens in a thread so the event loop keeps serving
+        other shutdown work meanwhile
+        """
+        # Jobs arriving during shutdown are rejected rather than starting a new pool
+        self._closed = True
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            PASSWORD_HASH_WORKERS.set(0)
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password with bcrypt
+        
+        Args:
+            password: Plain text password
+        
+        Returns:
+            bcrypt hash
+        
+        Raises:
+            PasswordHasherBusyError: If the pool is saturated
+        """
+        return await self._run("hash", get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against a bcrypt hash
+        
+        Args:
+            password: Plain text password
+            hashed_password: Stored bcrypt hash
+        
+        Returns:
+            True if the password matches
+        
+        Raises:
+            PasswordHasherBusyError: If the pool is saturated
+        """
+        return await self._run("verify", verify_password, password, hashed_password)
+
+    async def _run(self, operation: str, func: Callable, *args):
+        """
+        Run a job in the pool unless running and queued jobs are at the limit
+        
+        Args:
+            operation: Metric label ("hash", "verify")
+            func: Module-level function executed in a worker process
+            *args: Function arguments
+        
+        Returns:
+            Function result
+        """
+        if self._closed or self._in_flight >= settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE:
+            PASSWORD_HASH_REJECTED.labels(operation=operation).inc()
+            raise PasswordHasherBusyError("Hệ thống đang bận, vui lòng thử lại sau")
+
+        self.start()
+        started = time.perf_counter()
+        self._in_flight += 1
+        self._update_gauges()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._update_gauges()
+            PASSWORD_HASH_DURATION.labels(operation=operation).observe(time.perf_counter() - started)
+
+    def _update_gauges(self):
+        """Publish running/queued job counts"""
+        PASSWORD_HASH_IN_FLIGHT.set(self._in_flight)
+        PASSWORD_HASH_QUEUED.set(max(self._in_flight - settings.PASSWORD_HASH_WORKERS, 0))
+
+    def stats(self) -> dict:
+        """
+        Get pool utilization
+        
+        Returns:
+            Pool size, queue limit and current running/queued jobs
+        """
+        return {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+            "in_flight": self._in_flight,
+            "queued": max(self._in_flight - settings.PASSWORD_HASH_WORKERS, 0),
+        }
+
+
+# Global hasher instance
+password_hasher = PasswordHasher()
@@ -1,6 +1,7 @@
 """
 Security Utilities - Password Hashing and JWT Token Management
 Uses bcrypt for password hashing and jose for JWT
+JWTs are signed with SECRET_KEY (HS*) or a rotating key pair (RS*/ES*)
 """
 
 from datetime import datetime, timedelta
@@ -9,6 +10,7 @@ import bcrypt
 from jose import JWTError, jwt
 
 from app.config import settings
+from app.utils.signing_keys import is_asymmetric, signing_key_ring
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -50,6 +52,16 @@ def create_access_token(
     # Add 'exp' claim (expiration time)
     to_encode.update({"exp": expire})
 
+    # Asymmetric: sign with the active private key, named by kid in the header
+    if is_asymmetric():
+        kid, private_key = signing_key_ring.signing_key()
+        return jwt.encode(
+            to_encode,
+            private_key,
+            algorithm=settings.ALGORITHM,
+            headers={"kid": kid}
+        )
+
     # Encode JWT token
     encoded_jwt = jwt.encode(
         to_encode,
@@ -68,10 +80,18 @@ def decode_access_token(token: str) -> Optional[str]:
         Optional[str]: Username from token if valid, None if invalid
     """
     try:
+        if is_asymmetric():
+            # Verify with the public key the token names; unknown kid = invalid
+            key = signing_key_ring.verification_key(jwt.get_unverified_header(token).get("kid"))
+            if key is None:
+                return None
+        else:
+            key = settings.SECRET_KEY
+
         # Decode JWT token
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
+            key,
             algorithms=[settings.ALGORITHM]
         )
 
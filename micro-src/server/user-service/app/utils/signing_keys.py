@@ -0,0 +1,157 @@
+"""
+Signing Keys - Asymmetric JWT signing keys with kid-based rotation
+With an RS*/ES* ALGORITHM, tokens are signed with a private key from
+JWT_KEYS_DIR and carry its key ID (kid) in the header; the public halves
+of all keys in the directory are published as a JWKS, so other services
+verify tokens without holding any secret
+"""
+
+import logging
+import os
+import uuid
+from typing import Dict, List, Optional, Tuple
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwk
+from jose.backends.base import Key
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Algorithms signed with a key pair (python-jose has no EdDSA support)
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"}
+
+# Curve of the generated development key per EC algorithm
+_EC_CURVES = {"ES256": ec.SECP256R1, "ES384": ec.SECP384R1, "ES512": ec.SECP521R1}
+
+
+def is_asymmetric() -> bool:
+    """
+    Check whether tokens are signed with a key pair
+    
+    Returns:
+        True for RS*/ES* algorithms, False for the shared HS* secret
+    """
+    return settings.ALGORITHM in ASYMMETRIC_ALGORITHMS
+
+
+class SigningKeyRing:
+    """
+    Private keys loaded from JWT_KEYS_DIR, one PEM file per key ID (<kid>.pem)
+    The active key signs new tokens; all keys verify tokens and are
+    published, so tokens signed before a rotation stay valid until they expire
+    """
+
+    def __init__(self):
+        """Initialize empty key ring, loaded on first use"""
+        # kid -> (private key PEM, parsed public key)
+        self._keys: Dict[str, Tuple[str, Key]] = {}
+        self._active_kid: Optional[str] = None
+
+    def load(self):
+        """
+        Load all keys from JWT_KEYS_DIR
+        
+        Without a directory a key is generated in memory; its tokens cannot
+        be verified by other processes, so this is for development only
+        
+        Raises:
+            ValueError: If JWT_ACTIVE_KID is not among the loaded keys or a
+                key does not match ALGORITHM
+        """
+        keys: Dict[str, Tuple[str, Key]] = {}
+        keys_dir = settings.JWT_KEYS_DIR
+        if keys_dir:
+            for filename in sorted(os.listdir(keys_dir)):
+                kid, extension = os.path.splitext(filename)
+                if extension != ".pem":
+                    continue
+                with open(os.path.join(keys_dir, filename)) as f:
+                    private_pem = f.read()
+                keys[kid] = (private_pem, self._public_key(private_pem))
+
+        if not keys:
+            kid = f"dev-{uuid.uuid4().hex[:8]}"
+            private_pem = self._generate_private_key()
+            keys[kid] = (private_pem, self._public_key(private_pem))
+            logger.warning(
+                f"⚠️ No signing keys in JWT_KEYS_DIR, generated in-memory key '{kid}' "
+                f"(development only, tokens are not valid in other processes)"
+            )
+
+        # Default: the newest key by file name, e.g. 2025-10-01.pem
+        active_kid = settings.JWT_ACTIVE_KID or list(keys)[-1]
+        if active_kid not in keys:
+            raise ValueError(f"Không tìm thấy khóa ký JWT_ACTIVE_KID '{active_kid}'")
+
+        self._keys = keys
+        self._active_kid = active_kid
+        logger.info(f"🔑 Loaded {len(keys)} JWT signing key(s), active kid: {active_kid}")
+
+    @staticmethod
+    def _public_key(private_pem: str) -> Key:
+        """Parse a private key PEM into its public key for ALGORITHM"""
+        try:
+            return jwk.construct(private_pem, algorithm=settings.ALGORITHM).public_key()
+        except Exception as e:
+            raise ValueError(f"Khóa ký không hợp lệ cho thuật toán {settings.ALGORITHM}: {e}")
+
+    @staticmethod
+    def _generate_private_key() -> str:
+        """Generate a development private key PEM for ALGORITHM"""
+        if settings.ALGORITHM.startswith("ES"):
+            private_key = ec.generate_private_key(_EC_CURVES[settings.ALGORITHM]())
+        else:
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        return private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        ).decode()
+
+    def _ensure_loaded(self):
+        """Load keys on first use"""
+        if self._active_kid is None:
+            self.load()
+
+    def signing_key(self) -> Tuple[str, str]:
+        """
+        Get the key that signs new tokens
+        
+        Returns:
+            (kid, private key PEM)
+        """
+        self._ensure_loaded()
+        return self._active_kid, self._keys[self._active_kid][0]
+
+    def verification_key(self, kid: str) -> Optional[Key]:
+        """
+        Get the public key of a key ID
+        
+        Args:
+            kid: Key ID from the token header
+        
+        Returns:
+            Parsed public key, or None if the key ID is unknown
+        """
+        self._ensure_loaded()
+        entry = self._keys.get(kid)
+        return entry[1] if entry else None
+
+    def jwks(self) -> List[dict]:
+        """
+        Get the public keys as JSON Web Keys
+        
+        Returns:
+            One JWK per key ID, with kid, use and alg set
+        """
+        self._ensure_loaded()
+        return [
+            {**public_key.to_dict(), "kid": kid, "use": "sig", "alg": settings.ALGORITHM}
+            for kid, (_, public_key) in self._keys.items()
+        ]
+
+
+# Global key ring instance
+signing_key_ring = SigningKeyRing()
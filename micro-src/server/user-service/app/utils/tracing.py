@@ -12,6 +12,7 @@ from opentelemetry.sdk.resources import Resource, SERVICE_NAME, SERVICE_VERSION
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+from opentelemetry.instrumentation.aio_pika import AioPikaInstrumentor
 
 
 def setup_tracing(app, service_name: str, service_version: str = "1.0.0"):
@@ -57,6 +58,9 @@ def setup_tracing(app, service_name: str, service_version: str = "1.0.0"):
     
     # Instrument HTTPX for inter-service tracing
     HTTPXClientInstrumentor().instrument()
+
+    # Instrument RabbitMQ (aio-pika)
+    AioPikaInstrumentor().instrument()
     
     print(f"✅ OpenTelemetry tracing configured for {service_name}")
     print(f"📊 Traces will be sent to: {jaeger_endpoint}")